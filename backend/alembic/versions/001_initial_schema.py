@@ -7,9 +7,8 @@ Create Date: 2025-11-17 18:30:00
 """
 from typing import Sequence, Union
 
-from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
+from alembic import context, op
+from sqlalchemy.util import await_only
 
 # revision identifiers, used by Alembic.
 revision: str = '001'
@@ -18,134 +17,220 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# The whole initial schema is sent as one script so a fresh database is
+# created in a single round-trip instead of one per CREATE statement
+SCHEMA_DDL = """
+-- Write-hot tables (status flips, is_read, token counters) keep free space
+-- on each page via fillfactor so updates can stay HOT and skip index writes
+
+-- Time-ordered UUIDs for append-mostly tables: the 48-bit millisecond
+-- timestamp prefix keeps primary key inserts at the right edge of the BTree
+-- (app-specific name, so it never shadows or drops PostgreSQL 18's built-in uuidv7())
+CREATE OR REPLACE FUNCTION crauler_uuidv7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(uuid_send(gen_random_uuid())
+                        placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                        FROM 1 FOR 6),
+                52, 1),
+            53, 1),
+        'hex')::uuid
+$$ LANGUAGE sql VOLATILE;
+
+-- Enum types
+CREATE TYPE projectstatus AS ENUM ('DRAFT', 'PLANNING', 'IN_PROGRESS', 'REVIEW', 'COMPLETED', 'CANCELLED');
+CREATE TYPE projecttype AS ENUM ('WEBSITE', 'MOBILE_APP', 'MARKETING_CAMPAIGN', 'DATA_ANALYSIS', 'CONTENT_CREATION', 'CUSTOM');
+CREATE TYPE taskstatus AS ENUM ('PENDING', 'IN_PROGRESS', 'REVIEW', 'COMPLETED', 'FAILED', 'BLOCKED');
+CREATE TYPE taskpriority AS ENUM ('CRITICAL', 'HIGH', 'NORMAL', 'LOW');
+
+-- Organizations
+CREATE TABLE organizations (
+    id UUID NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    slug VARCHAR(255) NOT NULL,
+    plan VARCHAR(50),
+    credits_balance INTEGER,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    PRIMARY KEY (id),
+    UNIQUE (slug)
+);
+CREATE UNIQUE INDEX ix_organizations_slug ON organizations (slug);
+
+-- Users
+CREATE TABLE users (
+    id UUID NOT NULL,
+    telegram_id BIGINT NOT NULL,
+    username VARCHAR(255),
+    first_name VARCHAR(255),
+    last_name VARCHAR(255),
+    language_code VARCHAR(10),
+    is_premium BOOLEAN,
+    credits_balance INTEGER,
+    last_active_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    photo_url VARCHAR(500),
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    PRIMARY KEY (id),
+    UNIQUE (telegram_id)
+);
+CREATE UNIQUE INDEX ix_users_telegram_id ON users (telegram_id);
+
+-- User settings
+CREATE TABLE user_settings (
+    user_id UUID NOT NULL,
+    theme VARCHAR(20),
+    language VARCHAR(10),
+    notifications_enabled BOOLEAN,
+    auto_execute BOOLEAN,
+    settings JSONB,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    PRIMARY KEY (user_id)
+);
+
+-- Projects
+CREATE TABLE projects (
+    id UUID NOT NULL,
+    organization_id UUID,
+    user_id UUID,
+    name VARCHAR(255) NOT NULL,
+    description TEXT,
+    status projectstatus NOT NULL,
+    type projecttype NOT NULL,
+    priority VARCHAR(20),
+    deadline TIMESTAMP WITHOUT TIME ZONE,
+    metadata JSONB,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (organization_id) REFERENCES organizations (id),
+    FOREIGN KEY (user_id) REFERENCES users (id)
+);
+CREATE INDEX ix_projects_user_id ON projects (user_id);
+CREATE INDEX ix_projects_active ON projects (user_id, updated_at) WHERE status NOT IN ('COMPLETED', 'CANCELLED');
+
+-- Notifications
+CREATE TABLE notifications (
+    id UUID NOT NULL DEFAULT crauler_uuidv7(),
+    user_id UUID NOT NULL,
+    project_id UUID,
+    type VARCHAR(50) NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    message TEXT,
+    is_read BOOLEAN,
+    action_url VARCHAR(500),
+    metadata JSONB,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    PRIMARY KEY (id)
+) WITH (fillfactor = 85);
+CREATE INDEX ix_notifications_user_id ON notifications (user_id);
+CREATE INDEX ix_notifications_user_unread_created ON notifications (user_id, is_read, created_at) WHERE is_read = false;
+
+-- Tasks
+CREATE TABLE tasks (
+    id UUID NOT NULL,
+    project_id UUID NOT NULL,
+    parent_task_id UUID,
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    assigned_agent TEXT,
+    status taskstatus NOT NULL,
+    priority taskpriority NOT NULL,
+    task_type TEXT,
+    input_data JSONB,
+    output_data JSONB,
+    estimated_tokens INTEGER,
+    actual_tokens INTEGER,
+    started_at TIMESTAMP WITHOUT TIME ZONE,
+    completed_at TIMESTAMP WITHOUT TIME ZONE,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (parent_task_id) REFERENCES tasks (id),
+    FOREIGN KEY (project_id) REFERENCES projects (id)
+) WITH (fillfactor = 85);
+CREATE INDEX ix_tasks_project_status_created ON tasks (project_id, status, created_at);
+CREATE INDEX ix_tasks_parent ON tasks (parent_task_id) WHERE parent_task_id IS NOT NULL;
+-- Partial index over the small set of unfinished tasks; most rows end up COMPLETED
+CREATE INDEX ix_tasks_active ON tasks (project_id, priority, created_at) WHERE status IN ('PENDING', 'IN_PROGRESS', 'REVIEW', 'BLOCKED');
+
+-- Task dependency graph; the primary key serves "what does X depend on",
+-- the reverse index serves "who depends on X"
+CREATE TABLE task_dependencies (
+    task_id UUID NOT NULL,
+    depends_on_task_id UUID NOT NULL,
+    PRIMARY KEY (task_id, depends_on_task_id),
+    FOREIGN KEY (task_id) REFERENCES tasks (id) ON DELETE CASCADE,
+    FOREIGN KEY (depends_on_task_id) REFERENCES tasks (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_task_deps_reverse ON task_dependencies (depends_on_task_id, task_id);
+
+-- Agent executions
+CREATE TABLE agent_executions (
+    id UUID NOT NULL DEFAULT crauler_uuidv7(),
+    task_id UUID NOT NULL,
+    agent_type TEXT NOT NULL,
+    prompt TEXT,
+    response TEXT,
+    tokens_used INTEGER,
+    execution_time_ms INTEGER,
+    status VARCHAR(50),
+    error_message TEXT,
+    metadata JSONB,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (task_id) REFERENCES tasks (id)
+) WITH (fillfactor = 70);
+CREATE INDEX ix_agent_executions_task_id ON agent_executions (task_id);
+"""
+
+# lz4 TOAST compression (PostgreSQL 14+) for the large, frequently read columns
+LZ4_COMPRESSION_DDL = """
+ALTER TABLE projects ALTER COLUMN metadata SET COMPRESSION lz4;
+ALTER TABLE notifications ALTER COLUMN metadata SET COMPRESSION lz4;
+ALTER TABLE tasks ALTER COLUMN input_data SET COMPRESSION lz4, ALTER COLUMN output_data SET COMPRESSION lz4;
+ALTER TABLE agent_executions ALTER COLUMN prompt SET COMPRESSION lz4, ALTER COLUMN response SET COMPRESSION lz4, ALTER COLUMN metadata SET COMPRESSION lz4;
+"""
+
+
+def _execute_batch(ddl: str) -> None:
+    """Execute a multi-statement DDL script, in one round-trip on PostgreSQL."""
+    if context.is_offline_mode():
+        op.execute(ddl)
+        return
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        for statement in ddl.split(';'):
+            if statement.strip():
+                op.execute(statement)
+        return
+
+    if bind.dialect.driver == 'asyncpg':
+        # asyncpg prepares every statement, which rejects multiple commands;
+        # the raw connection's execute() uses the simple query protocol instead
+        await_only(bind.connection.driver_connection.execute(ddl))
+    else:
+        bind.exec_driver_sql(ddl)
+
+
+def _supports_lz4() -> bool:
+    """Whether the connected server supports lz4 column compression."""
+    if context.is_offline_mode():
+        return False
+    dialect = op.get_bind().dialect
+    return dialect.name == 'postgresql' and (dialect.server_version_info or (0,)) >= (14,)
+
+
 def upgrade() -> None:
-    # Create organizations table
-    op.create_table('organizations',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('slug', sa.String(length=255), nullable=False),
-        sa.Column('plan', sa.String(length=50), nullable=True),
-        sa.Column('credits_balance', sa.Integer(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('slug')
-    )
-    op.create_index(op.f('ix_organizations_slug'), 'organizations', ['slug'], unique=True)
-
-    # Create users table
-    op.create_table('users',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('telegram_id', sa.BigInteger(), nullable=False),
-        sa.Column('username', sa.String(length=255), nullable=True),
-        sa.Column('first_name', sa.String(length=255), nullable=True),
-        sa.Column('last_name', sa.String(length=255), nullable=True),
-        sa.Column('language_code', sa.String(length=10), nullable=True),
-        sa.Column('is_premium', sa.Boolean(), nullable=True),
-        sa.Column('credits_balance', sa.Integer(), nullable=True),
-        sa.Column('last_active_at', sa.DateTime(), nullable=False),
-        sa.Column('photo_url', sa.String(length=500), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('telegram_id')
-    )
-    op.create_index(op.f('ix_users_telegram_id'), 'users', ['telegram_id'], unique=True)
-
-    # Create user_settings table
-    op.create_table('user_settings',
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('theme', sa.String(length=20), nullable=True),
-        sa.Column('language', sa.String(length=10), nullable=True),
-        sa.Column('notifications_enabled', sa.Boolean(), nullable=True),
-        sa.Column('auto_execute', sa.Boolean(), nullable=True),
-        sa.Column('settings', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.PrimaryKeyConstraint('user_id')
-    )
-
-    # Create projects table
-    op.create_table('projects',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('status', sa.Enum('DRAFT', 'PLANNING', 'IN_PROGRESS', 'REVIEW', 'COMPLETED', 'CANCELLED', name='projectstatus'), nullable=False),
-        sa.Column('type', sa.Enum('WEBSITE', 'MOBILE_APP', 'MARKETING_CAMPAIGN', 'DATA_ANALYSIS', 'CONTENT_CREATION', 'CUSTOM', name='projecttype'), nullable=False),
-        sa.Column('priority', sa.String(length=20), nullable=True),
-        sa.Column('deadline', sa.DateTime(), nullable=True),
-        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_projects_user_id'), 'projects', ['user_id'], unique=False)
-
-    # Create notifications table
-    op.create_table('notifications',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('type', sa.String(length=50), nullable=False),
-        sa.Column('title', sa.String(length=255), nullable=False),
-        sa.Column('message', sa.String(), nullable=True),
-        sa.Column('is_read', sa.Boolean(), nullable=True),
-        sa.Column('action_url', sa.String(length=500), nullable=True),
-        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_notifications_user_id'), 'notifications', ['user_id'], unique=False)
-
-    # Create tasks table
-    op.create_table('tasks',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('parent_task_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('title', sa.String(length=255), nullable=False),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('assigned_agent', sa.String(length=100), nullable=True),
-        sa.Column('status', sa.Enum('PENDING', 'IN_PROGRESS', 'REVIEW', 'COMPLETED', 'FAILED', 'BLOCKED', name='taskstatus'), nullable=False),
-        sa.Column('priority', sa.Enum('CRITICAL', 'HIGH', 'NORMAL', 'LOW', name='taskpriority'), nullable=False),
-        sa.Column('task_type', sa.String(length=100), nullable=True),
-        sa.Column('input_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('output_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('dependencies', postgresql.ARRAY(postgresql.UUID(as_uuid=True)), nullable=True),
-        sa.Column('estimated_tokens', sa.Integer(), nullable=True),
-        sa.Column('actual_tokens', sa.Integer(), nullable=True),
-        sa.Column('started_at', sa.DateTime(), nullable=True),
-        sa.Column('completed_at', sa.DateTime(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.ForeignKeyConstraint(['parent_task_id'], ['tasks.id'], ),
-        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_tasks_project_id'), 'tasks', ['project_id'], unique=False)
-
-    # Create agent_executions table
-    op.create_table('agent_executions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('task_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('agent_type', sa.String(length=100), nullable=False),
-        sa.Column('prompt', sa.Text(), nullable=True),
-        sa.Column('response', sa.Text(), nullable=True),
-        sa.Column('tokens_used', sa.Integer(), nullable=True),
-        sa.Column('execution_time_ms', sa.Integer(), nullable=True),
-        sa.Column('status', sa.String(length=50), nullable=True),
-        sa.Column('error_message', sa.Text(), nullable=True),
-        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_agent_executions_task_id'), 'agent_executions', ['task_id'], unique=False)
+    _execute_batch(SCHEMA_DDL)
+
+    if _supports_lz4():
+        _execute_batch(LZ4_COMPRESSION_DDL)
 
 
 def downgrade() -> None:
@@ -153,12 +238,19 @@ def downgrade() -> None:
     op.drop_index(op.f('ix_agent_executions_task_id'), table_name='agent_executions')
     op.drop_table('agent_executions')
 
-    op.drop_index(op.f('ix_tasks_project_id'), table_name='tasks')
+    op.drop_index('ix_task_deps_reverse', table_name='task_dependencies')
+    op.drop_table('task_dependencies')
+
+    op.drop_index('ix_tasks_active', table_name='tasks')
+    op.drop_index('ix_tasks_parent', table_name='tasks')
+    op.drop_index('ix_tasks_project_status_created', table_name='tasks')
     op.drop_table('tasks')
 
+    op.drop_index('ix_notifications_user_unread_created', table_name='notifications')
     op.drop_index(op.f('ix_notifications_user_id'), table_name='notifications')
     op.drop_table('notifications')
 
+    op.drop_index('ix_projects_active', table_name='projects')
     op.drop_index(op.f('ix_projects_user_id'), table_name='projects')
     op.drop_table('projects')
 
@@ -170,8 +262,7 @@ def downgrade() -> None:
     op.drop_index(op.f('ix_organizations_slug'), table_name='organizations')
     op.drop_table('organizations')
 
-    # Drop enums
-    sa.Enum(name='taskpriority').drop(op.get_bind(), checkfirst=True)
-    sa.Enum(name='taskstatus').drop(op.get_bind(), checkfirst=True)
-    sa.Enum(name='projecttype').drop(op.get_bind(), checkfirst=True)
-    sa.Enum(name='projectstatus').drop(op.get_bind(), checkfirst=True)
+    # Drop enums in one statement rather than a checkfirst lookup per type
+    op.execute('DROP TYPE IF EXISTS taskpriority, taskstatus, projecttype, projectstatus CASCADE')
+
+    op.execute('DROP FUNCTION IF EXISTS crauler_uuidv7()')
@@ -10,6 +10,7 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from pgvector.sqlalchemy import Vector
 
 # revision identifiers, used by Alembic.
 revision: str = '004'
@@ -21,14 +22,17 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     # Enable pgvector extension
     op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    # Trigram operator classes for substring (ILIKE '%...%') search
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
 
     # Create knowledge_entries table
+    # Embedding is declared as vector(1536) up front, so no table-rewriting ALTER ... TYPE pass is needed
     op.create_table('knowledge_entries',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('crauler_uuidv7()'), nullable=False),
         sa.Column('title', sa.String(length=500), nullable=False),
         sa.Column('content', sa.Text(), nullable=False),
         sa.Column('content_type', sa.String(length=50), nullable=True),
-        sa.Column('embedding', postgresql.ARRAY(sa.Float()), nullable=True),  # Will be vector(1536)
+        sa.Column('embedding', Vector(1536), nullable=True),
         sa.Column('source_type', sa.String(length=50), nullable=True),
         sa.Column('source_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('agent_type', sa.String(length=100), nullable=True),
@@ -40,24 +44,28 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
+    op.execute('ALTER TABLE knowledge_entries SET (fillfactor = 85)')
+
+    # lz4 TOAST compression decompresses faster than the default pglz (PostgreSQL 14+)
+    bind = op.get_bind()
+    if (bind.dialect.server_version_info or (0,)) >= (14,):
+        op.execute(
+            'ALTER TABLE knowledge_entries '
+            'ALTER COLUMN content SET COMPRESSION lz4, '
+            'ALTER COLUMN knowledge_metadata SET COMPRESSION lz4'
+        )
 
     # Create indexes
-    op.create_index(op.f('ix_knowledge_entries_title'), 'knowledge_entries', ['title'], unique=False)
+    op.execute('CREATE INDEX ix_knowledge_entries_title_trgm ON knowledge_entries USING GIN (title gin_trgm_ops)')
     op.create_index(op.f('ix_knowledge_entries_source_id'), 'knowledge_entries', ['source_id'], unique=False)
     op.create_index(op.f('ix_knowledge_entries_agent_type'), 'knowledge_entries', ['agent_type'], unique=False)
 
-    # Convert embedding column to vector type
-    # Note: Using raw SQL because pgvector types aren't directly supported in Alembic column definitions
-    op.execute('ALTER TABLE knowledge_entries ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)')
-
-    # Create vector index for similarity search (using HNSW for fast approximate search)
-    op.execute('CREATE INDEX knowledge_entries_embedding_idx ON knowledge_entries USING hnsw (embedding vector_cosine_ops)')
-
     # Create search_queries table
+    # Query embeddings aren't persisted: they can be recomputed from query_text,
+    # and storing ~6 KB per search would make this log outgrow knowledge_entries
     op.create_table('search_queries',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('query_text', sa.Text(), nullable=False),
-        sa.Column('query_embedding', postgresql.ARRAY(sa.Float()), nullable=True),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('results_count', sa.Integer(), nullable=True),
@@ -72,8 +80,8 @@ def upgrade() -> None:
     op.create_index(op.f('ix_search_queries_user_id'), 'search_queries', ['user_id'], unique=False)
     op.create_index(op.f('ix_search_queries_project_id'), 'search_queries', ['project_id'], unique=False)
 
-    # Convert query_embedding column to vector type
-    op.execute('ALTER TABLE search_queries ALTER COLUMN query_embedding TYPE vector(1536) USING query_embedding::vector(1536)')
+    # Create vector index for similarity search (using HNSW for fast approximate search)
+    op.execute('CREATE INDEX knowledge_entries_embedding_idx ON knowledge_entries USING hnsw (embedding vector_cosine_ops)')
 
 
 def downgrade() -> None:
@@ -86,8 +94,8 @@ def downgrade() -> None:
     op.execute('DROP INDEX IF EXISTS knowledge_entries_embedding_idx')
     op.drop_index(op.f('ix_knowledge_entries_agent_type'), table_name='knowledge_entries')
     op.drop_index(op.f('ix_knowledge_entries_source_id'), table_name='knowledge_entries')
-    op.drop_index(op.f('ix_knowledge_entries_title'), table_name='knowledge_entries')
+    op.execute('DROP INDEX IF EXISTS ix_knowledge_entries_title_trgm')
     op.drop_table('knowledge_entries')
 
-    # Note: We don't drop the vector extension as other tables might use it
+    # Note: We don't drop the vector or pg_trgm extensions as other tables might use them
     # op.execute('DROP EXTENSION IF EXISTS vector')
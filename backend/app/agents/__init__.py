@@ -1,20 +1,41 @@
-from .base_agent import BaseAgent, AgentRegistry, agent_registry
-from .orchestrator import OrchestratorAgent, orchestrator
-from .marketing_agent import MarketingAgent
-from .frontend_agent import FrontendDeveloperAgent
-from .backend_agent import BackendDeveloperAgent
-
-# Export OrchestratorAgent as both Orchestrator (for tests) and OrchestratorAgent
-Orchestrator = OrchestratorAgent
-
-__all__ = [
-    "BaseAgent",
-    "AgentRegistry",
-    "agent_registry",
-    "Orchestrator",
-    "OrchestratorAgent",
-    "orchestrator",
-    "MarketingAgent",
-    "FrontendDeveloperAgent",
-    "BackendDeveloperAgent",
-]
\ No newline at end of file
+"""
+AI agents package.
+
+Exports are resolved lazily (PEP 562) so importing ``app.agents`` does not
+pull in every agent module and its dependencies until a name is used.
+"""
+from importlib import import_module
+
+# Exported name -> (submodule, attribute)
+_EXPORTS = {
+    "BaseAgent": (".base_agent", "BaseAgent"),
+    "AgentRegistry": (".base_agent", "AgentRegistry"),
+    "agent_registry": (".base_agent", "agent_registry"),
+    # Export OrchestratorAgent as both Orchestrator (for tests) and OrchestratorAgent
+    "Orchestrator": (".orchestrator", "OrchestratorAgent"),
+    "OrchestratorAgent": (".orchestrator", "OrchestratorAgent"),
+    # Note: once the submodule has been imported, ``app.agents.orchestrator`` is the
+    # module itself; import the instance from ``app.agents.orchestrator`` instead
+    "orchestrator": (".orchestrator", "orchestrator"),
+    "MarketingAgent": (".marketing_agent", "MarketingAgent"),
+    "FrontendDeveloperAgent": (".frontend_agent", "FrontendDeveloperAgent"),
+    "BackendDeveloperAgent": (".backend_agent", "BackendDeveloperAgent"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import an exported name on first access and cache it on the package."""
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,20 +1,9 @@
-from app.agents.base_agent import BaseAgent
-
+from typing import ClassVar, Final
 
-class BackendDeveloperAgent(BaseAgent):
-    """
-    Backend Developer Agent
-    Specializes in scalable API design and system architecture
-    """
-
-    def get_agent_type(self) -> str:
-        return "backend_developer"
+from app.agents.base_agent import BaseAgent
 
-    def get_temperature(self) -> float:
-        return 0.2  # Very deterministic for backend code
 
-    def get_system_prompt(self) -> str:
-        return """You are a Senior Backend Developer at an AI Agency, specializing in scalable API design and system architecture.
+_SYSTEM_PROMPT: Final[str] = """You are a Senior Backend Developer at an AI Agency, specializing in scalable API design and system architecture.
 
 ## Your Technical Expertise:
 - **Languages**: Python 3.11+, Node.js 20+, Go 1.21+, Rust
@@ -97,3 +86,14 @@ class BackendDeveloperAgent(BaseAgent):
 - CQRS implementation patterns
 
 Focus on scalability, security, and maintainability."""
+
+
+class BackendDeveloperAgent(BaseAgent):
+    """
+    Backend Developer Agent
+    Specializes in scalable API design and system architecture
+    """
+
+    agent_type: ClassVar[str] = "backend_developer"
+    temperature: ClassVar[float] = 0.2  # Very deterministic for backend code
+    system_prompt: ClassVar[str] = _SYSTEM_PROMPT
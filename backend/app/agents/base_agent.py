@@ -1,42 +1,113 @@
-from typing import Dict, Any, Optional
-from abc import ABC, abstractmethod
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple
+from types import MappingProxyType
+from collections import OrderedDict
+from importlib import import_module
+import asyncio
+import hashlib
 import logging
+import sys
 import time
+import weakref
 
+import orjson
+
+from app.agents.metadata import AGENT_META, DEFAULT_AGENT_META
 from app.services.claude_service import claude_service
 from app.services.knowledge_service import knowledge_service
+from app.services.semantic_cache import MAX_CACHEABLE_TEMPERATURE, semantic_cache
+from app.config import settings
 from app.models.task import Task
 from app.database.connection import get_db
 
 logger = logging.getLogger(__name__)
 
+# Static task instructions, sent after the agent's system prompt so both form
+# a byte-identical cacheable prefix; only per-task data goes in the user turn
+_TASK_INSTRUCTIONS = """Please complete this task following your expertise and output format.
+Provide specific, actionable deliverables in JSON format."""
+
+# Caps concurrent Knowledge Base lookups (embedding call + vector search)
+# so a burst of agents doesn't stampede the embedding API and database.
+# One semaphore per event loop: Celery tasks each run on a fresh loop.
+_KB_FETCH_CONCURRENCY = 8
+_kb_fetch_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Knowledge Base context per (agent_type, task content), so retries and
+# re-runs skip the embedding + vector search. The TTL lets newly stored
+# entries surface.
+_KB_CONTEXT_TTL_SECONDS = 600
+_KB_CONTEXT_MAX_ENTRIES = 1024
+_kb_context_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+# Shorter title + description than this carries too little meaning to search on
+_MIN_KB_QUERY_CHARS = 40
 
-class BaseAgent(ABC):
+
+def _kb_fetch_semaphore() -> asyncio.Semaphore:
+    """Get the running loop's Knowledge Base lookup semaphore"""
+    loop = asyncio.get_running_loop()
+    semaphore = _kb_fetch_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _kb_fetch_semaphores[loop] = asyncio.Semaphore(_KB_FETCH_CONCURRENCY)
+    return semaphore
+
+
+class BaseAgent:
     """
     Base class for all specialized agents
     Each agent has a specific expertise and system prompt
     """
 
+    # Agents declare these as class attributes, or override the get_* hooks below
+    agent_type: str
+    system_prompt: str
+    temperature: float = 0.3  # Default conservative temperature
+    # blake2b of the system prompt; derived at init unless the agent provides it
+    system_prompt_hash: str
+    # Estimated token count of the system prompt, computed once at init
+    system_prompt_tokens: int
+    # First lines / first 500 chars of the system prompt, set by
+    # AgentRegistry on construction
+    _expertise_preview: Tuple[str, ...] = ()
+    _prompt_preview: str = ""
+
     def __init__(self):
-        self.agent_type = self.get_agent_type()
-        self.system_prompt = self.get_system_prompt()
-        self.temperature = self.get_temperature()
+        # Only agents that override a hook need it resolved per instance;
+        # class attributes are read directly
+        cls = type(self)
+        # Task id -> future of the run in progress (singleflight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # (model, max_tokens, prompt) -> future of the direct prompt call in progress
+        self._inflight_prompts: Dict[Tuple[Optional[str], int, str], asyncio.Future] = {}
+        if cls.get_agent_type is not BaseAgent.get_agent_type:
+            self.agent_type = self.get_agent_type()
+        if cls.get_system_prompt is not BaseAgent.get_system_prompt:
+            self.system_prompt = self.get_system_prompt()
+        if cls.get_temperature is not BaseAgent.get_temperature:
+            self.temperature = self.get_temperature()
+        if not hasattr(self, "system_prompt_hash"):
+            self.system_prompt_hash = hashlib.blake2b(
+                self.system_prompt.encode(), digest_size=16
+            ).hexdigest()
+        self.system_prompt_tokens = claude_service.count_tokens(self.system_prompt)
 
-    @abstractmethod
     def get_agent_type(self) -> str:
         """Return agent type identifier"""
-        pass
+        return self.agent_type
 
-    @abstractmethod
     def get_system_prompt(self) -> str:
         """Return system prompt for this agent"""
-        pass
+        return self.system_prompt
 
     def get_temperature(self) -> float:
         """Return temperature for Claude API calls (0-1)"""
-        return 0.3  # Default conservative temperature
+        return self.temperature
 
-    async def execute_task(self, task: Task) -> Dict[str, Any]:
+    async def execute_task(
+        self,
+        task: Task,
+        stream_sink: Optional[asyncio.Queue] = None,
+    ) -> Dict[str, Any]:
         """
         Execute a task assigned to this agent
 
@@ -45,34 +116,88 @@ class BaseAgent(ABC):
 
         Args:
             task: Task object from database
+            stream_sink: Queue that receives response text chunks as Claude
+                streams them, for callers that forward partial output
 
         Returns:
             Execution result with deliverables
         """
-        logger.info(f"{self.agent_type} executing task: {task.title}")
-
-        start_time = time.time()
+        # A concurrent run of the same task shares the first caller's result
+        # instead of making a second Claude call
+        key = str(task.id)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info("%s joining in-flight run of task %s", self.agent_type, task.id)
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._run_task(task, stream_sink)
+        except Exception as e:
+            # Joined callers see the real failure, not a cancellation
+            future.set_exception(e)
+            future.exception()  # mark retrieved in case nobody joined
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def _run_task(
+        self,
+        task: Task,
+        stream_sink: Optional[asyncio.Queue],
+    ) -> Dict[str, Any]:
+        """Execute a task; see execute_task"""
+        logger.info("%s executing task: %s", self.agent_type, task.title)
+
+        start_ns = time.perf_counter_ns()
 
         try:
-            # Fetch relevant context from Knowledge Base
+            # Fetch Knowledge Base context
             kb_context = await self._fetch_relevant_context(task)
 
             # Build task prompt with context
             user_prompt = self._build_task_prompt(task, kb_context)
 
+            # Exact hits need the full rendered prompt; similarity is judged on
+            # the task itself, since sibling tasks share the project and KB
+            # sections. Hits never cross projects.
+            cache_namespace = self._cache_namespace(task)
+            cache_fingerprint = self._task_fingerprint(task)
+            cached = await self._lookup_cached(cache_namespace, user_prompt, cache_fingerprint)
+            if cached is not None:
+                return self._cached_result(task, cached, start_ns)
+
             # Call Claude API
-            response = await claude_service.parse_json_response(
-                system_prompt=self.system_prompt,
+            response, usage = await claude_service.parse_json_with_usage(
+                system_prompt=[self.system_prompt, _TASK_INSTRUCTIONS],
                 user_prompt=user_prompt,
                 temperature=self.temperature,
                 max_tokens=4000,
+                stream_sink=stream_sink,
+                cache_key=self.agent_type,
             )
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            tokens_used = claude_service.count_tokens(user_prompt) + claude_service.count_tokens(str(response))
+            if self._response_cacheable:
+                await semantic_cache.store(cache_namespace, user_prompt, response, cache_fingerprint)
+
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            # Billed usage reported by the API, including cached prompt tokens
+            tokens_used = (
+                usage["input_tokens"]
+                + usage["cache_creation_input_tokens"]
+                + usage["cache_read_input_tokens"]
+                + usage["output_tokens"]
+            )
 
             logger.info(
-                f"{self.agent_type} completed task {task.id} in {execution_time_ms}ms"
+                "%s completed task %s in %dms", self.agent_type, task.id, execution_time_ms
             )
 
             return {
@@ -81,18 +206,22 @@ class BaseAgent(ABC):
                 "task_id": str(task.id),
                 "result": response,
                 "prompt": user_prompt,
-                "response": str(response),
+                "response": orjson.dumps(response, option=orjson.OPT_NON_STR_KEYS).decode(),
                 "execution_time_ms": execution_time_ms,
                 "tokens_used": tokens_used,
                 "metadata": {
                     "temperature": self.temperature,
                     "task_title": task.title,
+                    "system_prompt_tokens": self.system_prompt_tokens,
+                    # Prompt cache effectiveness per agent type
+                    "cache_creation_input_tokens": usage["cache_creation_input_tokens"],
+                    "cache_read_input_tokens": usage["cache_read_input_tokens"],
                 },
             }
 
         except Exception as e:
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            logger.error(f"{self.agent_type} failed task {task.id}: {e}")
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.error("%s failed task %s: %s", self.agent_type, task.id, e)
 
             return {
                 "status": "failed",
@@ -103,29 +232,112 @@ class BaseAgent(ABC):
                 "execution_time_ms": execution_time_ms,
             }
 
-    async def execute(self, prompt: str) -> str:
+    async def execute(
+        self, prompt: str, model: Optional[str] = None, max_tokens: int = 4000
+    ) -> str:
         """
         Execute a direct prompt without task context.
-        Used for meta-operations like HR Agent analysis.
+        Used for meta-operations like HR Agent analysis. Identical prompts
+        already in flight share one response.
 
         Args:
             prompt: Direct user prompt
+            model: Model to use instead of the configured default
+            max_tokens: Maximum tokens in response
 
         Returns:
             Claude's response text
         """
+        key = (model, max_tokens, prompt)
+        inflight = self._inflight_prompts.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_prompts[key] = future
         try:
-            response = await claude_service.send_message(
-                system_prompt=self.system_prompt,
-                user_prompt=prompt,
-                temperature=self.temperature,
-                max_tokens=4000,
+            text = await self._execute_prompt(prompt, model, max_tokens)
+        except Exception as e:
+            # Joined callers see the real failure, not a cancellation
+            future.set_exception(e)
+            future.exception()  # mark retrieved in case nobody joined
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(text)
+            return text
+        finally:
+            del self._inflight_prompts[key]
+
+    async def _execute_prompt(
+        self, prompt: str, model: Optional[str], max_tokens: int
+    ) -> str:
+        try:
+            return await semantic_cache.get_or_call(
+                f"{self.agent_type}:execute:{self.system_prompt_hash}:{model or 'default'}",
+                prompt,
+                self.temperature,
+                lambda: claude_service.send_message(
+                    system_prompt=self.system_prompt,
+                    user_prompt=prompt,
+                    temperature=self.temperature,
+                    max_tokens=max_tokens,
+                    model=model,
+                    cache_key=self.agent_type,
+                ),
             )
-            return response
         except Exception as e:
-            logger.error(f"{self.agent_type} execution failed: {e}")
+            logger.error("%s execution failed: %s", self.agent_type, e)
             raise
 
+    def _cache_namespace(self, task: Task) -> str:
+        """Semantic cache partition for a task: agent, system prompt and project"""
+        return f"{self.agent_type}:{self.system_prompt_hash}:{task.project_id}"
+
+    @property
+    def _response_cacheable(self) -> bool:
+        """Whether task responses may be served from / stored in the semantic cache"""
+        return settings.semantic_cache_enabled and self.temperature <= MAX_CACHEABLE_TEMPERATURE
+
+    @staticmethod
+    def _task_fingerprint(task: Task) -> str:
+        """What a task asks for: title, description and deliverables"""
+        deliverables = (task.input_data or {}).get("deliverables") or []
+        return "\n".join([task.title or "", task.description or "", *map(str, deliverables)])
+
+    async def _lookup_cached(
+        self, namespace: str, user_prompt: str, fingerprint: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a near-duplicate response for this task, if caching applies"""
+        if not self._response_cacheable:
+            return None
+        return await semantic_cache.lookup(namespace, user_prompt, fingerprint)
+
+    def _cached_result(
+        self, task: Task, response: Dict[str, Any], start_ns: int
+    ) -> Dict[str, Any]:
+        """Build an execution result from a semantic cache hit"""
+        execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        logger.info("%s served task %s from semantic cache", self.agent_type, task.id)
+
+        return {
+            "status": "success",
+            "agent": self.agent_type,
+            "task_id": str(task.id),
+            "result": response,
+            "prompt": "",
+            "response": orjson.dumps(response, option=orjson.OPT_NON_STR_KEYS).decode(),
+            "execution_time_ms": execution_time_ms,
+            "tokens_used": 0,
+            "metadata": {
+                "temperature": self.temperature,
+                "task_title": task.title,
+                "semantic_cache_hit": True,
+            },
+        }
+
     def _build_task_prompt(self, task: Task, kb_context: str = "") -> str:
         """
         Build task prompt from task data
@@ -135,143 +347,277 @@ class BaseAgent(ABC):
             kb_context: Relevant context from Knowledge Base
 
         Returns:
-            Formatted prompt for Claude
+            Formatted prompt for Claude (task data only; the static
+            instructions are part of the cached system prompt)
         """
-        prompt = f"""Task: {task.title}
-
-Description:
-{task.description}
-
-"""
-
-        # Add input data if available
-        if task.input_data:
-            if task.input_data.get("deliverables"):
-                prompt += f"""Expected Deliverables:
-{chr(10).join(f'- {d}' for d in task.input_data['deliverables'])}
-
-"""
-
-            if task.input_data.get("acceptance_criteria"):
-                prompt += f"""Acceptance Criteria:
-{chr(10).join(f'- {c}' for c in task.input_data['acceptance_criteria'])}
-
-"""
+        # Collect sections and join once instead of growing one string
+        sections = [f"Task: {task.title}", f"Description:\n{task.description}"]
+        input_data = task.input_data or {}
+
+        deliverables = input_data.get("deliverables")
+        if deliverables:
+            sections.append(
+                "Expected Deliverables:\n" + "\n".join(f"- {d}" for d in deliverables)
+            )
 
-            if task.input_data.get("project_context"):
-                context = task.input_data["project_context"]
-                prompt += f"""Project Context:
-- Type: {context.get('project_type', 'unknown')}
-- Complexity: {context.get('complexity', 'unknown')}
-- Key Requirements: {', '.join(context.get('key_requirements', []))}
+        criteria = input_data.get("acceptance_criteria")
+        if criteria:
+            sections.append(
+                "Acceptance Criteria:\n" + "\n".join(f"- {c}" for c in criteria)
+            )
 
-"""
+        context = input_data.get("project_context")
+        if context:
+            sections.append(
+                "Project Context:\n"
+                f"- Type: {context.get('project_type', 'unknown')}\n"
+                f"- Complexity: {context.get('complexity', 'unknown')}\n"
+                f"- Key Requirements: {', '.join(context.get('key_requirements', []))}"
+            )
 
-        # Add relevant context from Knowledge Base
+        # Knowledge Base context varies most between tasks, so it goes last
         if kb_context:
-            prompt += f"""Relevant Context from Previous Work:
-{kb_context}
+            sections.append(f"Relevant Context from Previous Work:\n{kb_context}")
 
-"""
-
-        prompt += """Please complete this task following your expertise and output format.
-Provide specific, actionable deliverables in JSON format."""
-
-        return prompt
+        return "\n\n".join(sections).rstrip()
 
     async def _fetch_relevant_context(self, task: Task) -> str:
         """
         Fetch relevant context from Knowledge Base for this task.
 
+        The lookup runs on its own session: an error there must not abort
+        the caller's transaction, and the search log commits.
+
         Args:
             task: Task object
 
         Returns:
             Formatted context string
         """
+        # Skip the session checkout and embedding call when a search can't help
+        query_len = len(task.title or "") + len(task.description or "")
+        if (
+            query_len < _MIN_KB_QUERY_CHARS
+            or (task.input_data or {}).get("skip_kb")
+            or self.agent_type in settings.kb_context_disabled_agents
+        ):
+            return ""
+
+        key = hashlib.blake2b(
+            f"{self.agent_type}|{task.title}|{task.description}".encode(), digest_size=16
+        ).hexdigest()
+        cached = _kb_context_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _KB_CONTEXT_TTL_SECONDS:
+            _kb_context_cache.move_to_end(key)
+            return cached[1]
+
         try:
             # Build query from task title and description
             query = f"{task.title}. {task.description}"
 
             # Fetch context using knowledge service
-            async with get_db() as db:
-                context = await knowledge_service.get_context_for_agent(
-                    agent_type=self.agent_type,
-                    query=query,
-                    top_k=3,  # Get top 3 most relevant entries
-                    db=db,
-                )
+            async with _kb_fetch_semaphore():
+                context = await self._query_knowledge_base(query)
+
+            _kb_context_cache[key] = (time.monotonic(), context)
+            _kb_context_cache.move_to_end(key)
+            if len(_kb_context_cache) > _KB_CONTEXT_MAX_ENTRIES:
+                _kb_context_cache.popitem(last=False)
 
             if context:
-                logger.debug(f"Fetched KB context for task {task.id} ({len(context)} chars)")
+                logger.debug("Fetched KB context for task %s (%d chars)", task.id, len(context))
             else:
-                logger.debug(f"No relevant KB context found for task {task.id}")
+                logger.debug("No relevant KB context found for task %s", task.id)
 
             return context
 
         except Exception as e:
             # Log error but don't fail the task
-            logger.warning(f"Failed to fetch KB context for task {task.id}: {e}")
+            logger.warning("Failed to fetch KB context for task %s: %s", task.id, e)
             return ""
 
+    async def _query_knowledge_base(self, query: str) -> str:
+        """Run the Knowledge Base context query in a session of its own"""
+        async with get_db() as session:
+            return await knowledge_service.get_context_for_agent(
+                agent_type=self.agent_type,
+                query=query,
+                top_k=3,  # Get top 3 most relevant entries
+                db=session,
+            )
+
 
 class AgentRegistry:
     """
     Registry of all available agents
     Manages agent instances and assignment
+
+    Agents are constructed on first use, so a worker only pays for the
+    agent types it actually runs.
     """
 
+    # Agent type -> (module, class); imported lazily to avoid circular imports
+    _AGENT_CLASSES = {
+        "marketing": ("app.agents.marketing_agent", "MarketingAgent"),
+        "frontend_developer": ("app.agents.frontend_agent", "FrontendDeveloperAgent"),
+        "backend_developer": ("app.agents.backend_agent", "BackendDeveloperAgent"),
+        "data_analyst": ("app.agents.data_analyst_agent", "DataAnalystAgent"),
+        "ux_designer": ("app.agents.ux_designer_agent", "UXDesignerAgent"),
+        "content_writer": ("app.agents.content_writer_agent", "ContentWriterAgent"),
+        "mobile_developer": ("app.agents.mobile_developer_agent", "MobileDeveloperAgent"),
+        "devops_engineer": ("app.agents.devops_engineer_agent", "DevOpsEngineerAgent"),
+        "project_manager": ("app.agents.project_manager_agent", "ProjectManagerAgent"),
+        "qa_engineer": ("app.agents.qa_engineer_agent", "QAEngineerAgent"),
+        "hr_manager": ("app.agents.hr_agent", "HRAgent"),
+    }
+
     def __init__(self):
-        self._agents: Dict[str, BaseAgent] = {}
+        self._factories: Dict[str, Callable[[], BaseAgent]] = {}
+        self._instances: Dict[str, BaseAgent] = {}
+        # Read-only live view handed out by get_all_agents()
+        self._instances_view: Mapping[str, BaseAgent] = MappingProxyType(self._instances)
+        # Bumped whenever the set of agents changes, so views built from
+        # the registry know when to rebuild
+        self.version = 0
+        # Denormalized listing (type, name, description, temperature),
+        # built on first request and dropped on register()
+        self._info_cache: Optional[List[Dict[str, Any]]] = None
+        # Serialized per-agent detail responses, built on first request
+        self._info_json: Dict[str, bytes] = {}
         self._register_agents()
 
     @property
     def agents(self) -> Dict[str, BaseAgent]:
-        """Get all registered agents."""
-        return self._agents
+        """Get all registered agents (instantiates any not yet created)."""
+        for agent_type in self._factories:
+            self.get_agent(agent_type)
+        return self._instances
 
     def _register_agents(self):
-        """Register all available agents"""
-        # Import agents here to avoid circular imports
-        from app.agents.marketing_agent import MarketingAgent
-        from app.agents.frontend_agent import FrontendDeveloperAgent
-        from app.agents.backend_agent import BackendDeveloperAgent
-        from app.agents.data_analyst_agent import DataAnalystAgent
-        from app.agents.ux_designer_agent import UXDesignerAgent
-        from app.agents.content_writer_agent import ContentWriterAgent
-        from app.agents.mobile_developer_agent import MobileDeveloperAgent
-        from app.agents.devops_engineer_agent import DevOpsEngineerAgent
-        from app.agents.project_manager_agent import ProjectManagerAgent
-        from app.agents.qa_engineer_agent import QAEngineerAgent
-        from app.agents.hr_agent import HRAgent
-
-        # Register agents
-        self.register(MarketingAgent())
-        self.register(FrontendDeveloperAgent())
-        self.register(BackendDeveloperAgent())
-        self.register(DataAnalystAgent())
-        self.register(UXDesignerAgent())
-        self.register(ContentWriterAgent())
-        self.register(MobileDeveloperAgent())
-        self.register(DevOpsEngineerAgent())
-        self.register(ProjectManagerAgent())
-        self.register(QAEngineerAgent())
-        self.register(HRAgent())
-
-        logger.info(f"Registered {len(self._agents)} agents")
+        """Register factories for all available agents"""
+        for agent_type, (module_name, class_name) in self._AGENT_CLASSES.items():
+            # Interned keys let lookups with constant/interned strings match on identity
+            self._factories[sys.intern(agent_type)] = self._lazy_factory(module_name, class_name)
+
+        logger.info("Registered %d agents", len(self._factories))
+
+    @staticmethod
+    def _lazy_factory(module_name: str, class_name: str) -> Callable[[], BaseAgent]:
+        def factory() -> BaseAgent:
+            return getattr(import_module(module_name), class_name)()
+        return factory
+
+    @staticmethod
+    def _prepare(agent: BaseAgent) -> BaseAgent:
+        """Precompute per-agent views that never change after construction"""
+        # First non-empty system prompt lines, shown as the agent's expertise
+        agent._expertise_preview = tuple(
+            line.strip() for line in agent.system_prompt.split("\n") if line.strip()
+        )[:5]
+        # Truncated prompt shown to the HR Agent as the current configuration
+        agent._prompt_preview = agent.system_prompt[:500] + "..."
+        return agent
 
     def register(self, agent: BaseAgent):
         """Register an agent"""
-        self._agents[agent.agent_type] = agent
-        logger.debug(f"Registered agent: {agent.agent_type}")
+        self._prepare(agent)
+        agent_type = sys.intern(agent.agent_type)
+        self._factories[agent_type] = lambda: agent
+        self._instances[agent_type] = agent
+        self.version += 1
+        self._info_cache = None
+        self._info_json.clear()
+        logger.debug("Registered agent: %s", agent_type)
 
     def get_agent(self, agent_type: str) -> Optional[BaseAgent]:
         """Get agent by type"""
-        return self._agents.get(agent_type)
+        agent = self._instances.get(agent_type)
+        if agent is None:
+            factory = self._factories.get(agent_type)
+            if factory is None:
+                return None
+            agent = self._instances[sys.intern(agent_type)] = self._prepare(factory())
+        return agent
+
+    def __contains__(self, agent_type: str) -> bool:
+        """Whether an agent type is registered (without constructing it)"""
+        return agent_type in self._factories
+
+    def get_all_agents(self) -> Mapping[str, BaseAgent]:
+        """
+        Get all registered agents (instantiates any not yet created)
+
+        Returns:
+            Read-only view of agent_type -> agent instance; it reflects
+            later registrations without being rebuilt
+        """
+        for agent_type in self._factories:
+            self.get_agent(agent_type)
+        return self._instances_view
 
     def list_agents(self) -> list:
         """List all registered agents"""
-        return list(self._agents.keys())
+        return list(self._factories.keys())
+
+    def get_info_list(self) -> List[Dict[str, Any]]:
+        """
+        Get display info for every registered agent
+
+        Returns:
+            List of {type, name, description, temperature} dicts; the same
+            list is returned until the agent set changes
+        """
+        if self._info_cache is None:
+            info = []
+            for agent_type in self._factories:
+                meta = AGENT_META.get(agent_type, DEFAULT_AGENT_META)
+                info.append(
+                    {
+                        "type": agent_type,
+                        "name": meta.name,
+                        "description": meta.description,
+                        "temperature": self._temperature(agent_type),
+                    }
+                )
+            self._info_cache = info
+        return self._info_cache
+
+    def _temperature(self, agent_type: str) -> float:
+        """Temperature of an agent type, read from its class if not constructed yet"""
+        agent = self._instances.get(agent_type)
+        if agent is not None:
+            return agent.temperature
+        module_name, class_name = self._AGENT_CLASSES[agent_type]
+        return getattr(import_module(module_name), class_name).temperature
+
+    def get_info_json(self, agent_type: str) -> Optional[bytes]:
+        """
+        Get the serialized detail view of one agent
+
+        Args:
+            agent_type: Type of agent
+
+        Returns:
+            JSON bytes, or None if the agent type is not registered
+        """
+        blob = self._info_json.get(agent_type)
+        if blob is None:
+            agent = self.get_agent(agent_type)
+            if agent is None:
+                return None
+
+            meta = AGENT_META.get(agent_type)
+            blob = self._info_json[agent_type] = orjson.dumps(
+                {
+                    "type": agent_type,
+                    "name": meta.name if meta else DEFAULT_AGENT_META.name,
+                    "description": f"{meta.name if meta else 'Agent'} specializing in {agent_type.replace('_', ' ')}",
+                    "expertise": agent._expertise_preview,
+                    "temperature": agent.temperature,
+                    "available": True,
+                }
+            )
+        return blob
 
     async def execute_task(self, agent_type: str, task: Task) -> Dict[str, Any]:
         """
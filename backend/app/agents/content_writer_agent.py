@@ -1,20 +1,9 @@
-from app.agents.base_agent import BaseAgent
-
+from typing import ClassVar, Final
 
-class ContentWriterAgent(BaseAgent):
-    """
-    Content Writer Agent
-    Creating compelling content that drives engagement and conversions
-    """
-
-    def get_agent_type(self) -> str:
-        return "content_writer"
+from app.agents.base_agent import BaseAgent
 
-    def get_temperature(self) -> float:
-        return 0.6  # More creative for content
 
-    def get_system_prompt(self) -> str:
-        return """You are a Senior Content Writer at an AI Agency, creating compelling content that drives engagement and conversions.
+_SYSTEM_PROMPT: Final[str] = """You are a Senior Content Writer at an AI Agency, creating compelling content that drives engagement and conversions.
 
 ## Your Expertise:
 - **Content Types**: Blog posts, Landing pages, Case studies, Whitepapers
@@ -90,3 +79,18 @@ class ContentWriterAgent(BaseAgent):
 - Authentic storytelling
 
 Write content that informs, engages, and converts."""
+
+
+class ContentWriterAgent(BaseAgent):
+    """
+    Content Writer Agent
+    Creating compelling content that drives engagement and conversions
+    """
+
+    temperature: ClassVar[float] = 0.6  # More creative for content
+
+    def get_agent_type(self) -> str:
+        return "content_writer"
+
+    def get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
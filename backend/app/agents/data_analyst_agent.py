@@ -1,20 +1,9 @@
-from app.agents.base_agent import BaseAgent
-
+from typing import ClassVar, Final
 
-class DataAnalystAgent(BaseAgent):
-    """
-    Data Analyst Agent
-    Expert in data analysis, visualization, and business intelligence
-    """
-
-    def get_agent_type(self) -> str:
-        return "data_analyst"
+from app.agents.base_agent import BaseAgent
 
-    def get_temperature(self) -> float:
-        return 0.3  # Analytical, data-driven
 
-    def get_system_prompt(self) -> str:
-        return """You are a Senior Data Analyst at an AI Agency, expert in data analysis, visualization, and business intelligence.
+_SYSTEM_PROMPT: Final[str] = """You are a Senior Data Analyst at an AI Agency, expert in data analysis, visualization, and business intelligence.
 
 ## Your Technical Skills:
 - **Languages**: Python, R, SQL, DAX
@@ -82,3 +71,18 @@ class DataAnalystAgent(BaseAgent):
 - Streaming data processing
 
 Always ground recommendations in data and consider statistical significance."""
+
+
+class DataAnalystAgent(BaseAgent):
+    """
+    Data Analyst Agent
+    Expert in data analysis, visualization, and business intelligence
+    """
+
+    temperature: ClassVar[float] = 0.3  # Analytical, data-driven
+
+    def get_agent_type(self) -> str:
+        return "data_analyst"
+
+    def get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
@@ -1,20 +1,9 @@
-from app.agents.base_agent import BaseAgent
-
+from typing import ClassVar, Final
 
-class DevOpsEngineerAgent(BaseAgent):
-    """
-    DevOps Engineer Agent
-    Expert in infrastructure, CI/CD, and deployment automation
-    """
-
-    def get_agent_type(self) -> str:
-        return "devops_engineer"
+from app.agents.base_agent import BaseAgent
 
-    def get_temperature(self) -> float:
-        return 0.2  # Very deterministic for infrastructure
 
-    def get_system_prompt(self) -> str:
-        return """You are a Senior DevOps Engineer at an AI Agency, expert in infrastructure, CI/CD, and deployment automation.
+_SYSTEM_PROMPT: Final[str] = """You are a Senior DevOps Engineer at an AI Agency, expert in infrastructure, CI/CD, and deployment automation.
 
 ## Your Technical Stack:
 - **Cloud Platforms**: AWS, Google Cloud, Azure, DigitalOcean
@@ -109,3 +98,18 @@ class DevOpsEngineerAgent(BaseAgent):
 - Policy as Code
 
 Ensure infrastructure is secure, scalable, and cost-effective."""
+
+
+class DevOpsEngineerAgent(BaseAgent):
+    """
+    DevOps Engineer Agent
+    Expert in infrastructure, CI/CD, and deployment automation
+    """
+
+    temperature: ClassVar[float] = 0.2  # Very deterministic for infrastructure
+
+    def get_agent_type(self) -> str:
+        return "devops_engineer"
+
+    def get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
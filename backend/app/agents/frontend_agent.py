@@ -1,20 +1,10 @@
-from app.agents.base_agent import BaseAgent
-
+import hashlib
+from typing import ClassVar, Final
 
-class FrontendDeveloperAgent(BaseAgent):
-    """
-    Frontend Developer Agent
-    Expert in modern web technologies and user experience
-    """
-
-    def get_agent_type(self) -> str:
-        return "frontend_developer"
+from app.agents.base_agent import BaseAgent
 
-    def get_temperature(self) -> float:
-        return 0.3  # More deterministic for code
 
-    def get_system_prompt(self) -> str:
-        return """You are a Senior Frontend Developer at an AI Agency, expert in modern web technologies and user experience.
+_SYSTEM_PROMPT: Final[str] = """You are a Senior Frontend Developer at an AI Agency, expert in modern web technologies and user experience.
 
 ## Your Technical Stack:
 - **Frameworks**: React 18+, Next.js 14+, Vue 3, Angular 15+
@@ -82,3 +72,22 @@ class FrontendDeveloperAgent(BaseAgent):
 - Font optimization (variable fonts)
 
 Always prioritize user experience, performance, and maintainability."""
+
+# Stable identity of the prompt, used to partition cached responses
+SYSTEM_PROMPT_HASH: Final[str] = hashlib.blake2b(_SYSTEM_PROMPT.encode(), digest_size=16).hexdigest()
+
+
+class FrontendDeveloperAgent(BaseAgent):
+    """
+    Frontend Developer Agent
+    Expert in modern web technologies and user experience
+    """
+
+    system_prompt_hash = SYSTEM_PROMPT_HASH
+    temperature: ClassVar[float] = 0.3  # More deterministic for code
+
+    def get_agent_type(self) -> str:
+        return "frontend_developer"
+
+    def get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
@@ -5,38 +5,19 @@ Responsibilities:
 1. Agent Upskilling - Analyze and improve agent performance
 2. Agent Recruitment - Create new specialized agents dynamically
 """
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, ClassVar, Dict, Final, List, Optional
 from datetime import datetime, timedelta
-import json
+import hashlib
+import re
+import string
 
-from .base_agent import BaseAgent
-
-
-class HRAgent(BaseAgent):
-    """
-    HR Agent (Human Resources Manager)
-
-    A meta-agent that manages the agent team by:
-    - Analyzing agent performance metrics
-    - Suggesting improvements to agent configurations
-    - Testing agent variants
-    - Creating new specialized agents when needed
-    """
+import orjson
 
-    def get_agent_type(self) -> str:
-        """Return the agent type identifier."""
-        return "hr_manager"
+from app.config import settings
+from .base_agent import BaseAgent
 
-    def get_temperature(self) -> float:
-        """
-        Return the temperature for this agent.
-        Balanced temperature for analytical and creative work.
-        """
-        return 0.4
 
-    def get_system_prompt(self) -> str:
-        """Return the system prompt for HR Agent."""
-        return """You are an HR Manager for an AI agent team. Your role is to:
+_SYSTEM_PROMPT: Final[str] = """You are an HR Manager for an AI agent team. Your role is to:
 
 1. ANALYZE AGENT PERFORMANCE:
    - Review metrics: success rate, execution time, token efficiency
@@ -64,27 +45,29 @@ class HRAgent(BaseAgent):
 
 Be analytical, data-driven, and focused on continuous improvement. Provide specific, actionable recommendations with clear reasoning."""
 
-    async def analyze_agent_performance(
-        self,
-        agent_type: str,
-        metrics: Dict[str, Any],
-        time_period: str = "30d"
-    ) -> Dict[str, Any]:
-        """
-        Analyze performance of a specific agent.
+# Stable identity of the prompt, used to partition cached responses
+SYSTEM_PROMPT_HASH: Final[str] = hashlib.blake2b(_SYSTEM_PROMPT.encode(), digest_size=16).hexdigest()
 
-        Args:
-            agent_type: Type of agent to analyze
-            metrics: Performance metrics data
-            time_period: Time period for analysis
+# Body of the first fenced code block, with any language tag dropped;
+# an unterminated fence (truncated response) runs to the end
+_CODE_FENCE = re.compile(r"```(?:[\w-]+(?=\s))?\s*(.*?)(?:```|\Z)", re.DOTALL)
 
-        Returns:
-            Analysis report with insights and recommendations
-        """
-        prompt = f"""Analyze the performance of the {agent_type} agent over the last {time_period}.
+# Response caps sized to each method's JSON schema
+_MAX_TOKENS = {
+    "analyze_agent_performance": 1024,
+    "suggest_improvements": 1024,
+    "identify_skill_gaps": 1024,
+    "design_new_agent": 2048,
+}
+
+# Methods whose output needs the default (stronger) model
+_DEFAULT_TIER_METHODS = frozenset({"design_new_agent"})
+
+# Prompt skeletons are built once; only the substitutions allocate per call
+_ANALYZE_PERFORMANCE_TMPL = string.Template("""Analyze the performance of the $agent_type agent over the last $time_period.
 
 Performance Metrics:
-{json.dumps(metrics, indent=2)}
+$metrics
 
 Provide:
 1. Overall performance assessment
@@ -94,65 +77,29 @@ Provide:
 5. Priority level for improvements (critical/high/medium/low)
 
 Format your response as JSON with these fields:
-{{
+{
     "overall_score": <0-100>,
     "assessment": "<summary>",
     "strengths": ["<strength1>", "<strength2>"],
     "weaknesses": ["<weakness1>", "<weakness2>"],
     "recommendations": [
-        {{
+        {
             "type": "<prompt_update/temperature_change/etc>",
             "description": "<what to change>",
             "expected_impact": "<high/medium/low>",
             "priority": "<critical/high/medium/low>"
-        }}
+        }
     ],
     "next_steps": ["<step1>", "<step2>"]
-}}"""
-
-        response = await self.execute(prompt)
+}""")
 
-        try:
-            # Clean response if it contains markdown code blocks
-            cleaned_response = self.clean_json_response(response)
-            analysis = json.loads(cleaned_response)
-            return analysis
-        except json.JSONDecodeError:
-            # Fallback to structured response
-            return {
-                "overall_score": 70,
-                "assessment": response[:500],
-                "strengths": [],
-                "weaknesses": [],
-                "recommendations": [],
-                "next_steps": [],
-                "raw_response": response
-            }
-
-    async def suggest_improvements(
-        self,
-        agent_type: str,
-        current_config: Dict[str, Any],
-        performance_issues: List[str]
-    ) -> Dict[str, Any]:
-        """
-        Suggest improvements for an agent based on performance issues.
-
-        Args:
-            agent_type: Type of agent
-            current_config: Current agent configuration
-            performance_issues: List of identified issues
-
-        Returns:
-            Improvement suggestions
-        """
-        prompt = f"""Suggest improvements for the {agent_type} agent.
+_SUGGEST_IMPROVEMENTS_TMPL = string.Template("""Suggest improvements for the $agent_type agent.
 
 Current Configuration:
-{json.dumps(current_config, indent=2)}
+$current_config
 
 Performance Issues:
-{json.dumps(performance_issues, indent=2)}
+$performance_issues
 
 Suggest specific improvements to:
 1. System prompt
@@ -164,61 +111,30 @@ Suggest specific improvements to:
 Provide detailed, actionable suggestions with reasoning.
 
 Format as JSON:
-{{
+{
     "improvements": [
-        {{
+        {
             "type": "<improvement_type>",
             "current_value": "<current>",
             "proposed_value": "<proposed>",
             "reasoning": "<why this will help>",
             "expected_impact": "<high/medium/low>",
             "test_plan": "<how to test this>"
-        }}
+        }
     ],
     "priority_order": ["<improvement1>", "<improvement2>"],
     "estimated_improvement": "<percentage>"
-}}"""
-
-        response = await self.execute(prompt)
-
-        try:
-            cleaned_response = self.clean_json_response(response)
-            suggestions = json.loads(cleaned_response)
-            return suggestions
-        except json.JSONDecodeError:
-            return {
-                "improvements": [],
-                "priority_order": [],
-                "estimated_improvement": "unknown",
-                "raw_response": response
-            }
-
-    async def identify_skill_gaps(
-        self,
-        project_description: str,
-        current_agents: List[str],
-        task_breakdown: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
-        """
-        Identify skill gaps in the current agent team for a project.
+}""")
 
-        Args:
-            project_description: Project description
-            current_agents: List of available agent types
-            task_breakdown: Breakdown of project tasks
-
-        Returns:
-            Skill gap analysis
-        """
-        prompt = f"""Analyze this project to identify skill gaps in our agent team.
+_SKILL_GAPS_TMPL = string.Template("""Analyze this project to identify skill gaps in our agent team.
 
-Project: {project_description}
+Project: $project_description
 
 Current Agents:
-{json.dumps(current_agents, indent=2)}
+$current_agents
 
 Task Breakdown:
-{json.dumps(task_breakdown, indent=2)}
+$task_breakdown
 
 Identify:
 1. Tasks that don't match any current agent's expertise
@@ -226,37 +142,176 @@ Identify:
 3. Recommended new agent types to add
 
 Format as JSON:
-{{
+{
     "skill_gaps": [
-        {{
+        {
             "skill": "<missing skill>",
             "importance": "<critical/high/medium/low>",
             "affected_tasks": ["<task1>", "<task2>"],
             "workaround": "<current workaround if any>"
-        }}
+        }
     ],
     "recommended_agents": [
-        {{
+        {
             "agent_type": "<new_agent_type>",
             "name": "<agent name>",
             "primary_skills": ["<skill1>", "<skill2>"],
             "justification": "<why needed>"
-        }}
+        }
     ]
-}}"""
+}""")
 
-        response = await self.execute(prompt)
+_DESIGN_AGENT_TMPL = string.Template("""Design a new AI agent with the following specifications:
 
-        try:
-            cleaned_response = self.clean_json_response(response)
-            analysis = json.loads(cleaned_response)
-            return analysis
-        except json.JSONDecodeError:
-            return {
-                "skill_gaps": [],
-                "recommended_agents": [],
-                "raw_response": response
-            }
+Agent Type: $agent_type
+Required Skills: $required_skills
+Context: $project_context
+
+Create a complete agent specification including:
+1. Agent name and description
+2. Detailed system prompt
+3. Recommended temperature (0.0-1.0)
+4. Expertise areas
+5. Example tasks this agent should handle
+6. Key performance indicators
+
+Format as JSON:
+{
+    "agent_type": "<identifier>",
+    "name": "<human-readable name>",
+    "description": "<detailed description>",
+    "system_prompt": "<complete system prompt>",
+    "temperature": <0.0-1.0>,
+    "max_tokens": <recommended>,
+    "expertise": ["<skill1>", "<skill2>"],
+    "example_tasks": ["<task1>", "<task2>"],
+    "kpis": ["<kpi1>", "<kpi2>"],
+    "capabilities": {
+        "<capability>": "<description>"
+    }
+}""")
+
+
+def _to_json(value: Any) -> str:
+    """Render a value as indented JSON for a prompt"""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+
+
+class HRAgent(BaseAgent):
+    """
+    HR Agent (Human Resources Manager)
+
+    A meta-agent that manages the agent team by:
+    - Analyzing agent performance metrics
+    - Suggesting improvements to agent configurations
+    - Testing agent variants
+    - Creating new specialized agents when needed
+    """
+
+    system_prompt_hash = SYSTEM_PROMPT_HASH
+    # Balanced temperature for analytical and creative work
+    temperature: ClassVar[float] = 0.4
+
+    def get_agent_type(self) -> str:
+        """Return the agent type identifier."""
+        return "hr_manager"
+
+    def get_system_prompt(self) -> str:
+        """Return the system prompt for HR Agent."""
+        return _SYSTEM_PROMPT
+
+    async def analyze_agent_performance(
+        self,
+        agent_type: str,
+        metrics: Dict[str, Any],
+        time_period: str = "30d"
+    ) -> Dict[str, Any]:
+        """
+        Analyze performance of a specific agent.
+
+        Args:
+            agent_type: Type of agent to analyze
+            metrics: Performance metrics data
+            time_period: Time period for analysis
+
+        Returns:
+            Analysis report with insights and recommendations
+        """
+        prompt = _ANALYZE_PERFORMANCE_TMPL.substitute(
+            agent_type=agent_type,
+            time_period=time_period,
+            metrics=_to_json(metrics),
+        )
+
+        # Fallback to structured response
+        return await self._execute_json("analyze_agent_performance", prompt, lambda response: {
+            "overall_score": 70,
+            "assessment": response[:500],
+            "strengths": [],
+            "weaknesses": [],
+            "recommendations": [],
+            "next_steps": [],
+            "raw_response": response
+        })
+
+    async def suggest_improvements(
+        self,
+        agent_type: str,
+        current_config: Dict[str, Any],
+        performance_issues: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Suggest improvements for an agent based on performance issues.
+
+        Args:
+            agent_type: Type of agent
+            current_config: Current agent configuration
+            performance_issues: List of identified issues
+
+        Returns:
+            Improvement suggestions
+        """
+        prompt = _SUGGEST_IMPROVEMENTS_TMPL.substitute(
+            agent_type=agent_type,
+            current_config=_to_json(current_config),
+            performance_issues=_to_json(performance_issues),
+        )
+
+        return await self._execute_json("suggest_improvements", prompt, lambda response: {
+            "improvements": [],
+            "priority_order": [],
+            "estimated_improvement": "unknown",
+            "raw_response": response
+        })
+
+    async def identify_skill_gaps(
+        self,
+        project_description: str,
+        current_agents: List[str],
+        task_breakdown: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Identify skill gaps in the current agent team for a project.
+
+        Args:
+            project_description: Project description
+            current_agents: List of available agent types
+            task_breakdown: Breakdown of project tasks
+
+        Returns:
+            Skill gap analysis
+        """
+        prompt = _SKILL_GAPS_TMPL.substitute(
+            project_description=project_description,
+            current_agents=_to_json(current_agents),
+            task_breakdown=_to_json(task_breakdown),
+        )
+
+        return await self._execute_json("identify_skill_gaps", prompt, lambda response: {
+            "skill_gaps": [],
+            "recommended_agents": [],
+            "raw_response": response
+        })
 
     async def design_new_agent(
         self,
@@ -275,49 +330,64 @@ Format as JSON:
         Returns:
             Complete agent specification
         """
-        prompt = f"""Design a new AI agent with the following specifications:
+        prompt = _DESIGN_AGENT_TMPL.substitute(
+            agent_type=agent_type,
+            required_skills=_to_json(required_skills),
+            project_context=project_context,
+        )
+
+        return await self._execute_json("design_new_agent", prompt, lambda response: {
+            "agent_type": agent_type,
+            "name": agent_type.replace("_", " ").title(),
+            "error": "Failed to parse agent specification",
+            "raw_response": response
+        })
+
+    def get_model_for(self, method_name: str) -> Optional[str]:
+        """
+        Return the model tier for an HR method.
 
-Agent Type: {agent_type}
-Required Skills: {json.dumps(required_skills, indent=2)}
-Context: {project_context}
+        Short structured reports run on the fast tier; designing an agent
+        writes a full system prompt and keeps the default model.
 
-Create a complete agent specification including:
-1. Agent name and description
-2. Detailed system prompt
-3. Recommended temperature (0.0-1.0)
-4. Expertise areas
-5. Example tasks this agent should handle
-6. Key performance indicators
+        Args:
+            method_name: Name of the HR method making the call
 
-Format as JSON:
-{{
-    "agent_type": "<identifier>",
-    "name": "<human-readable name>",
-    "description": "<detailed description>",
-    "system_prompt": "<complete system prompt>",
-    "temperature": <0.0-1.0>,
-    "max_tokens": <recommended>,
-    "expertise": ["<skill1>", "<skill2>"],
-    "example_tasks": ["<task1>", "<task2>"],
-    "kpis": ["<kpi1>", "<kpi2>"],
-    "capabilities": {{
-        "<capability>": "<description>"
-    }}
-}}"""
+        Returns:
+            Model name, or None for the configured default
+        """
+        if method_name in _DEFAULT_TIER_METHODS:
+            return None
+        return settings.claude_fast_model
+
+    async def _execute_json(
+        self,
+        method_name: str,
+        prompt: str,
+        fallback: Callable[[str], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Execute a prompt and parse its JSON response.
+
+        Args:
+            method_name: Calling method, selects model tier and token cap
+            prompt: Direct user prompt
+            fallback: Builds the result from the raw response when it
+                is not valid JSON
 
-        response = await self.execute(prompt)
+        Returns:
+            Parsed response, or the fallback result
+        """
+        response = await self.execute(
+            prompt,
+            model=self.get_model_for(method_name),
+            max_tokens=_MAX_TOKENS.get(method_name, 1024),
+        )
 
         try:
-            cleaned_response = self.clean_json_response(response)
-            agent_spec = json.loads(cleaned_response)
-            return agent_spec
-        except json.JSONDecodeError:
-            return {
-                "agent_type": agent_type,
-                "name": agent_type.replace("_", " ").title(),
-                "error": "Failed to parse agent specification",
-                "raw_response": response
-            }
+            return orjson.loads(self.clean_json_response(response))
+        except orjson.JSONDecodeError:
+            return fallback(response)
 
     def clean_json_response(self, response: str) -> str:
         """
@@ -330,9 +400,8 @@ Format as JSON:
             Cleaned JSON string
         """
         # Remove markdown code blocks if present
-        if "```json" in response:
-            response = response.split("```json")[1].split("```")[0]
-        elif "```" in response:
-            response = response.split("```")[1].split("```")[0]
+        match = _CODE_FENCE.search(response)
+        if match:
+            response = match.group(1)
 
         return response.strip()
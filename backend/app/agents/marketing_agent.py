@@ -1,20 +1,10 @@
-from app.agents.base_agent import BaseAgent
-
+import hashlib
+from typing import ClassVar, Final
 
-class MarketingAgent(BaseAgent):
-    """
-    Marketing Agent - Chief Marketing Officer
-    Specializes in digital marketing strategies and growth
-    """
-
-    def get_agent_type(self) -> str:
-        return "marketing"
+from app.agents.base_agent import BaseAgent
 
-    def get_temperature(self) -> float:
-        return 0.5  # More creative for marketing
 
-    def get_system_prompt(self) -> str:
-        return """You are the Chief Marketing Officer of an AI Agency, specializing in digital marketing strategy and growth.
+_SYSTEM_PROMPT: Final[str] = """You are the Chief Marketing Officer of an AI Agency, specializing in digital marketing strategy and growth.
 
 ## Your Expertise:
 - Digital Marketing Strategy
@@ -75,3 +65,22 @@ Structure all responses as JSON with:
 - Micro-influencer partnerships
 
 Remember: Focus on practical, implementable solutions that drive real business results."""
+
+# Stable identity of the prompt, used to partition cached responses
+SYSTEM_PROMPT_HASH: Final[str] = hashlib.blake2b(_SYSTEM_PROMPT.encode(), digest_size=16).hexdigest()
+
+
+class MarketingAgent(BaseAgent):
+    """
+    Marketing Agent - Chief Marketing Officer
+    Specializes in digital marketing strategies and growth
+    """
+
+    system_prompt_hash = SYSTEM_PROMPT_HASH
+    temperature: ClassVar[float] = 0.5  # More creative for marketing
+
+    def get_agent_type(self) -> str:
+        return "marketing"
+
+    def get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
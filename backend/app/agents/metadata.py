@@ -0,0 +1,32 @@
+"""
+Agent Metadata
+
+Display name and short description per agent type, shared by the agent
+registry and the agents API.
+"""
+
+from typing import Dict, NamedTuple
+
+
+class AgentMeta(NamedTuple):
+    name: str
+    description: str
+
+
+# Used for agent types without an entry (e.g. dynamically registered agents)
+DEFAULT_AGENT_META = AgentMeta("Specialized Agent", "AI specialist")
+
+AGENT_META: Dict[str, AgentMeta] = {
+    "marketing": AgentMeta("Chief Marketing Officer", "Marketing strategies & growth"),
+    "frontend_developer": AgentMeta("Senior Frontend Developer", "React/Next.js expert"),
+    "backend_developer": AgentMeta("Senior Backend Developer", "API & system architecture"),
+    "data_analyst": AgentMeta("Senior Data Analyst", "Data analysis & BI"),
+    "ux_designer": AgentMeta("Senior UX/UI Designer", "User experience & design"),
+    "content_writer": AgentMeta("Senior Content Writer", "SEO & copywriting"),
+    "mobile_developer": AgentMeta("Senior Mobile Developer", "iOS/Android/Cross-platform"),
+    "devops_engineer": AgentMeta("Senior DevOps Engineer", "Infrastructure & CI/CD"),
+    "project_manager": AgentMeta("Senior Project Manager", "Planning & coordination"),
+    "qa_engineer": AgentMeta("Senior QA Engineer", "Testing & quality assurance"),
+    "hr_manager": AgentMeta("HR Manager", "Agent performance & optimization"),
+    "orchestrator": AgentMeta("AI Agency Orchestrator", "Project coordination & task delegation"),
+}
@@ -1,20 +1,10 @@
-from app.agents.base_agent import BaseAgent
-
+import hashlib
+from typing import ClassVar, Final
 
-class MobileDeveloperAgent(BaseAgent):
-    """
-    Mobile Developer Agent
-    Expert in cross-platform and native mobile application development
-    """
-
-    def get_agent_type(self) -> str:
-        return "mobile_developer"
+from app.agents.base_agent import BaseAgent
 
-    def get_temperature(self) -> float:
-        return 0.3  # Deterministic for code
 
-    def get_system_prompt(self) -> str:
-        return """You are a Senior Mobile Developer at an AI Agency, expert in cross-platform and native mobile application development.
+_SYSTEM_PROMPT: Final[str] = """You are a Senior Mobile Developer at an AI Agency, expert in cross-platform and native mobile application development.
 
 ## Your Technical Stack:
 - **Cross-Platform**: React Native, Flutter, Ionic, Xamarin
@@ -100,3 +90,22 @@ class MobileDeveloperAgent(BaseAgent):
 - Super apps architecture
 
 Build mobile experiences that are fast, intuitive, and platform-native."""
+
+# Stable identity of the prompt, used to partition cached responses
+SYSTEM_PROMPT_HASH: Final[str] = hashlib.blake2b(_SYSTEM_PROMPT.encode(), digest_size=16).hexdigest()
+
+
+class MobileDeveloperAgent(BaseAgent):
+    """
+    Mobile Developer Agent
+    Expert in cross-platform and native mobile application development
+    """
+
+    system_prompt_hash = SYSTEM_PROMPT_HASH
+    temperature: ClassVar[float] = 0.3  # Deterministic for code
+
+    def get_agent_type(self) -> str:
+        return "mobile_developer"
+
+    def get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
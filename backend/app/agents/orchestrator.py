@@ -1,37 +1,29 @@
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-import json
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional, Any, Final
+from datetime import datetime, timedelta, timezone
+import hashlib
 import logging
+import re
 from uuid import uuid4
 
+import orjson
+
+from app.config import settings
 from app.services.claude_service import claude_service
+from app.services.semantic_cache import MAX_CACHEABLE_TEMPERATURE, semantic_cache
+from app.core.async_lru import async_lru_cache
 from app.models.project import Project, ProjectType, ProjectStatus
 from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.base import uuid4_batch
 from app.database.connection import get_db
-from sqlalchemy import select
-from .base_agent import BaseAgent
+from sqlalchemy import delete, insert
+from .base_agent import AgentRegistry, BaseAgent
 
 logger = logging.getLogger(__name__)
 
 
-class OrchestratorAgent(BaseAgent):
-    """
-    Main orchestrator for AI Agency
-    Acts as CEO/Product Manager coordinating all agents
-    """
-
-    def get_agent_type(self) -> str:
-        """Return agent type identifier"""
-        return "orchestrator"
-
-    def get_temperature(self) -> float:
-        """Return temperature for Claude API calls"""
-        return 0.5
-
-    def get_system_prompt(self) -> str:
-        """Return system prompt for orchestrator"""
-        return """You are the CEO and Chief Orchestrator of an AI Agency.
+_SYSTEM_PROMPT: Final[str] = """You are the CEO and Chief Orchestrator of an AI Agency.
 
 Your role is to:
 1. Analyze incoming project requests and understand their full scope
@@ -63,6 +55,143 @@ Decision Framework:
 Output Format:
 Always structure your responses as JSON with clear action items and rationale."""
 
+# Stable identity of the prompt, used to partition cached responses
+SYSTEM_PROMPT_HASH: Final[str] = hashlib.blake2b(_SYSTEM_PROMPT.encode(), digest_size=16).hexdigest()
+
+
+_VALID_PROJECT_TYPES: frozenset = frozenset(t.value for t in ProjectType)
+
+# Agents that can be assigned project tasks (the HR meta-agent cannot)
+_VALID_AGENTS: frozenset = frozenset(AgentRegistry._AGENT_CLASSES) - {"hr_manager"}
+
+_ANALYSIS_TEMPERATURE = 0.3
+_DECOMPOSITION_TEMPERATURE = 0.2
+
+_PRIORITY_BY_COMPLEXITY = {
+    "enterprise": "high",
+    "complex": "normal",
+    "moderate": "normal",
+    "simple": "normal",
+}
+
+# Streamed tasks are inserted in batches of this size
+_TASK_INSERT_BATCH_SIZE = 5
+
+
+def _analysis_cache_key(agent: "OrchestratorAgent", request: str, organization_id: str):
+    """Key exact repeats of a request (double submits, API retries) per organization"""
+    if _ANALYSIS_TEMPERATURE > MAX_CACHEABLE_TEMPERATURE:
+        return None
+    normalized = " ".join(request.lower().split())
+    return hashlib.blake2b(f"{organization_id}|{normalized}".encode(), digest_size=16).digest()
+
+
+# Checked in order; the first match wins
+_PROJECT_TYPE_HINTS = (
+    (ProjectType.MOBILE_APP, re.compile(r"\b(mobile|ios|android|iphone|react native|flutter)\b", re.I)),
+    (ProjectType.MARKETING_CAMPAIGN, re.compile(r"\b(marketing|campaign|seo|sem|ads?|advertis\w*|social media)\b", re.I)),
+    (ProjectType.DATA_ANALYSIS, re.compile(r"\b(data analy\w*|analytics|dashboard|report(s|ing)?|metrics)\b", re.I)),
+    (ProjectType.CONTENT_CREATION, re.compile(r"\b(blog|articles?|copywriting|content|newsletter)\b", re.I)),
+    (ProjectType.WEBSITE, re.compile(r"\b(website|web ?site|landing page|web app|frontend|e-?commerce)\b", re.I)),
+)
+
+
+class _TaskStreamParser:
+    """
+    Incrementally extracts the objects of the "tasks" array from a
+    streamed JSON response
+
+    Each object is parsed as soon as its closing brace arrives, so the
+    caller can act on early tasks while later ones are still generating.
+    """
+
+    _ARRAY_START = re.compile(r'"tasks"\s*:\s*\[')
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start = 0
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a chunk and return the task objects it completed"""
+        if self._done:
+            return []
+
+        self._text += chunk
+        if not self._in_array:
+            match = self._ARRAY_START.search(self._text)
+            if match is None:
+                return []
+            self._in_array = True
+            self._pos = match.end()
+
+        completed = []
+        text = self._text
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._object_start = i
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    completed.append(orjson.loads(text[self._object_start:i + 1]))
+            elif char == "]" and self._depth == 0:
+                self._done = True
+                break
+
+        # Keep only the unfinished object
+        if self._depth > 0:
+            self._text = text[self._object_start:]
+            self._object_start = 0
+        else:
+            self._text = ""
+        self._pos = len(self._text)
+
+        return completed
+
+
+async def _iterate(items: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    for item in items:
+        yield item
+
+
+class OrchestratorAgent(BaseAgent):
+    """
+    Main orchestrator for AI Agency
+    Acts as CEO/Product Manager coordinating all agents
+    """
+
+    system_prompt_hash = SYSTEM_PROMPT_HASH
+
+    def get_agent_type(self) -> str:
+        """Return agent type identifier"""
+        return "orchestrator"
+
+    def get_temperature(self) -> float:
+        """Return temperature for Claude API calls"""
+        return 0.5
+
+    def get_system_prompt(self) -> str:
+        """Return system prompt for orchestrator"""
+        return _SYSTEM_PROMPT
+
+    @async_lru_cache(key=_analysis_cache_key, maxsize=1024, ttl=600)
     async def analyze_project(
         self, request: str, organization_id: str
     ) -> Dict[str, Any]:
@@ -93,22 +222,24 @@ Provide a JSON response with:
 
 Be specific and realistic in your analysis."""
 
+        # Only exact repeats are reused (per organization, by the decorator):
+        # similar-sounding requests still differ in what the analysis names
         try:
             response = await claude_service.parse_json_response(
                 system_prompt=self.system_prompt,
                 user_prompt=analysis_prompt,
-                temperature=0.3,
+                temperature=_ANALYSIS_TEMPERATURE,
+                cache_key=self.agent_type,
             )
 
             # Validate project_type
-            valid_types = [t.value for t in ProjectType]
-            if response.get("project_type") not in valid_types:
+            if response.get("project_type") not in _VALID_PROJECT_TYPES:
                 response["project_type"] = "custom"
 
             return response
 
         except Exception as e:
-            logger.error(f"Project analysis failed: {e}")
+            logger.error("Project analysis failed: %s", e)
             raise
 
     async def decompose_project(
@@ -123,12 +254,102 @@ Be specific and realistic in your analysis."""
         Returns:
             List of task definitions
         """
-        decomposition_prompt = f"""Decompose this project into specific tasks:
+        decomposition_prompt = self._decomposition_prompt(project)
+
+        try:
+            response = await semantic_cache.get_or_call(
+                self._decomposition_namespace(project),
+                self._decomposition_cache_query(decomposition_prompt),
+                _DECOMPOSITION_TEMPERATURE,
+                lambda: claude_service.parse_json_response(
+                    system_prompt=self.system_prompt,
+                    user_prompt=decomposition_prompt,
+                    temperature=_DECOMPOSITION_TEMPERATURE,
+                    cache_key=self.agent_type,
+                ),
+            )
+
+            tasks = response.get("tasks", [])
+            for task_def in tasks:
+                self._validate_task(task_def)
+
+            return tasks
+
+        except Exception as e:
+            logger.error("Project decomposition failed: %s", e)
+            raise
+
+    async def decompose_project_stream(
+        self, project: Project
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Decompose project into tasks, yielding each task as soon as the
+        streamed response contains it
+
+        Args:
+            project: Project object
+
+        Yields:
+            Task definitions in response order
+        """
+        decomposition_prompt = self._decomposition_prompt(project)
+        namespace = self._decomposition_namespace(project)
+        cache_query = self._decomposition_cache_query(decomposition_prompt)
+        cacheable = (
+            settings.semantic_cache_enabled
+            and _DECOMPOSITION_TEMPERATURE <= MAX_CACHEABLE_TEMPERATURE
+        )
+
+        cached = await semantic_cache.lookup(namespace, cache_query) if cacheable else None
+        if cached is not None:
+            for task_def in cached.get("tasks", []):
+                self._validate_task(task_def)
+                yield task_def
+            return
+
+        parser = _TaskStreamParser()
+        chunks: List[str] = []
+        tasks: List[Dict[str, Any]] = []
+
+        try:
+            # aclosing: a consumer that stops early must release the stream
+            # and its concurrency slot now, not when the generator is collected
+            async with aclosing(claude_service.stream_message(
+                system_prompt=self.system_prompt,
+                user_prompt=decomposition_prompt,
+                temperature=_DECOMPOSITION_TEMPERATURE,
+                cache_key=self.agent_type,
+            )) as stream:
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    for task_def in parser.feed(chunk):
+                        self._validate_task(task_def)
+                        tasks.append(task_def)
+                        yield task_def
+
+            if not tasks:
+                # Layout the scanner did not recognize; parse the whole response
+                response = orjson.loads(claude_service.strip_code_fence("".join(chunks)))
+                for task_def in response.get("tasks", []):
+                    self._validate_task(task_def)
+                    tasks.append(task_def)
+                    yield task_def
+
+        except Exception as e:
+            logger.error("Project decomposition failed: %s", e)
+            raise
+
+        if cacheable:
+            await semantic_cache.store(namespace, cache_query, {"tasks": tasks})
+
+    def _decomposition_prompt(self, project: Project) -> str:
+        """Build the decomposition prompt for a project"""
+        return f"""Decompose this project into specific tasks:
 
 Project Name: {project.name}
 Project Type: {project.type.value}
 Description: {project.description}
-Requirements: {json.dumps(project.metadata.get('key_requirements', []), indent=2)}
+Requirements: {orjson.dumps(project.metadata.get('key_requirements', []), option=orjson.OPT_INDENT_2).decode()}
 Estimated Hours: {project.metadata.get('estimated_hours', 'unknown')}
 
 Create a detailed task breakdown with:
@@ -156,18 +377,32 @@ Guidelines:
 - Tasks should be completable independently
 - Estimate tokens realistically (500-3000 per task)"""
 
-        try:
-            response = await claude_service.parse_json_response(
-                system_prompt=self.system_prompt,
-                user_prompt=decomposition_prompt,
-                temperature=0.2,
+    @staticmethod
+    def _decomposition_namespace(project: Project) -> str:
+        """Cached decompositions are only shared within an organization"""
+        return f"orchestrator:decompose:{SYSTEM_PROMPT_HASH}:{project.organization_id}"
+
+    @staticmethod
+    def _decomposition_cache_query(decomposition_prompt: str) -> str:
+        """Everything but the project details is fixed template text, so
+        match cached decompositions on the details alone"""
+        return decomposition_prompt.split("Create a detailed task breakdown", 1)[0]
+
+    @staticmethod
+    def _validate_task(task_def: Dict[str, Any]) -> None:
+        """Validate agent_type; the prompt's short "devops" name is accepted.
+        Tasks for an unknown agent keep it and are flagged for review, never
+        silently handed to another agent"""
+        agent_type = task_def.get("agent_type")
+        if agent_type == "devops":
+            task_def["agent_type"] = "devops_engineer"
+        elif agent_type not in _VALID_AGENTS:
+            logger.warning(
+                "Unknown agent type %r for task %r, holding it for review",
+                agent_type,
+                task_def.get("title"),
             )
-
-            return response.get("tasks", [])
-
-        except Exception as e:
-            logger.error(f"Project decomposition failed: {e}")
-            raise
+            task_def["needs_review"] = True
 
     async def create_project(
         self, request: str, organization_id: str
@@ -175,6 +410,11 @@ Guidelines:
         """
         Create new project from request
 
+        Decomposition starts speculatively alongside the analysis, using a
+        project type guessed from the request text. If the analysis agrees
+        with the guess the speculative task list is kept; otherwise the
+        project is decomposed again from the full analysis.
+
         Args:
             request: Project description
             organization_id: Organization ID
@@ -182,90 +422,161 @@ Guidelines:
         Returns:
             Created project
         """
-        # Analyze request
-        analysis = await self.analyze_project(request, organization_id)
+        guessed_type = self._guess_project_type(request)
+        analysis_task = asyncio.create_task(self.analyze_project(request, organization_id))
+        speculative_task = asyncio.create_task(
+            self._speculative_decompose(request, guessed_type, organization_id)
+        )
 
-        # Create project in database
-        async with get_db() as db:
-            project = Project(
-                id=uuid4(),
-                organization_id=organization_id,
-                name=analysis["project_name"],
-                description=request,
-                type=ProjectType(analysis["project_type"]),
-                status=ProjectStatus.PLANNING,
-                priority=self._determine_priority(analysis),
-                deadline=self._calculate_deadline(
-                    analysis.get("estimated_hours", 40)
-                ),
-                metadata=analysis,
-            )
+        try:
+            analysis = await analysis_task
+        except Exception:
+            speculative_task.cancel()
+            raise
+
+        # One clock read for the deadline and every row's timestamps;
+        # the columns are naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        project = Project(
+            id=uuid4(),
+            organization_id=organization_id,
+            name=analysis["project_name"],
+            description=request,
+            type=ProjectType(analysis["project_type"]),
+            status=ProjectStatus.PLANNING,
+            priority=self._determine_priority(analysis),
+            deadline=self._calculate_deadline(
+                analysis.get("estimated_hours", 40), now
+            ),
+            created_at=now,
+            updated_at=now,
+            metadata=analysis,
+        )
+
+        task_definitions = None
+        if project.type == guessed_type:
+            try:
+                task_definitions = await speculative_task
+                logger.info("Kept speculative decomposition for %s project", guessed_type.value)
+            except Exception as e:
+                logger.warning("Speculative decomposition failed, retrying: %s", e)
+        else:
+            speculative_task.cancel()
 
+        if task_definitions is not None:
+            task_source = _iterate(task_definitions)
+        else:
+            task_source = self.decompose_project_stream(project)
+
+        # The project and each batch of tasks are committed separately, so
+        # no connection is held while the rest of the decomposition streams in
+        async with get_db() as db:
             db.add(project)
             await db.commit()
-            await db.refresh(project)
 
-            logger.info(f"Created project: {project.id} - {project.name}")
-
-            # Decompose into tasks
-            task_definitions = await self.decompose_project(project)
-
-            # Create tasks in database
-            for idx, task_def in enumerate(task_definitions):
-                task = Task(
-                    id=uuid4(),
-                    project_id=project.id,
-                    title=task_def["title"],
-                    description=task_def["description"],
-                    assigned_agent=task_def["agent_type"],
-                    status=TaskStatus.PENDING,
-                    priority=self._calculate_task_priority(task_def, analysis),
-                    input_data={
-                        "deliverables": task_def.get("deliverables", []),
-                        "acceptance_criteria": task_def.get(
-                            "acceptance_criteria", []
-                        ),
-                        "project_context": analysis,
-                    },
-                    estimated_tokens=task_def.get("estimated_tokens", 1000),
-                )
-
-                db.add(task)
+            # Rows share the one analysis dict as their project context;
+            # it is only serialized, never copied or mutated per task
+            project_context = analysis
+            task_count = 0
+            batch: List[Dict[str, Any]] = []
+
+            try:
+                async with aclosing(task_source) as tasks:
+                    async for task_def in tasks:
+                        batch.append(self._task_row(project, task_def, project_context, now))
+                        if len(batch) >= _TASK_INSERT_BATCH_SIZE:
+                            task_count += await self._insert_tasks(db, batch)
+                            await db.commit()
+                            batch = []
+
+                task_count += await self._insert_tasks(db, batch)
+                await db.commit()
+            except Exception:
+                # Do not leave a half-decomposed project behind
+                await db.rollback()
+                await db.execute(delete(Task).where(Task.project_id == project.id))
+                await db.execute(delete(Project).where(Project.id == project.id))
+                await db.commit()
+                raise
 
-            await db.commit()
+            await db.refresh(project)
 
             logger.info(
-                f"Created {len(task_definitions)} tasks for project {project.id}"
+                "Created project %s - %s with %d tasks",
+                project.id, project.name, task_count,
             )
 
             return project
 
+    async def _speculative_decompose(
+        self, request: str, project_type: ProjectType, organization_id: str
+    ) -> List[Dict[str, Any]]:
+        """Decompose a request before its analysis is available"""
+        stub = Project(
+            organization_id=organization_id,
+            name=request[:100],
+            description=request,
+            type=project_type,
+            metadata={},
+        )
+        return await self.decompose_project(stub)
+
+    @staticmethod
+    def _guess_project_type(request: str) -> ProjectType:
+        """Cheap keyword guess of the project type analysis will settle on"""
+        for project_type, pattern in _PROJECT_TYPE_HINTS:
+            if pattern.search(request):
+                return project_type
+        return ProjectType.CUSTOM
+
+    def _task_row(
+        self,
+        project: Project,
+        task_def: Dict[str, Any],
+        project_context: Dict[str, Any],
+        now: datetime,
+    ) -> Dict[str, Any]:
+        """Build the Task insert row for a task definition"""
+        return {
+            "project_id": project.id,
+            "created_at": now,
+            "updated_at": now,
+            "title": task_def["title"],
+            "description": task_def["description"],
+            "assigned_agent": task_def["agent_type"],
+            "status": TaskStatus.REVIEW if task_def.get("needs_review") else TaskStatus.PENDING,
+            # Tasks with no dependencies are higher priority
+            "priority": TaskPriority.NORMAL if task_def.get("dependencies") else TaskPriority.HIGH,
+            "input_data": {
+                "deliverables": task_def.get("deliverables", []),
+                "acceptance_criteria": task_def.get(
+                    "acceptance_criteria", []
+                ),
+                "project_context": project_context,
+            },
+            "estimated_tokens": task_def.get("estimated_tokens", 1000),
+        }
+
+    @staticmethod
+    async def _insert_tasks(db, task_rows: List[Dict[str, Any]]) -> int:
+        """Insert task rows with one multi-row INSERT; returns the row count"""
+        if not task_rows:
+            return 0
+        for row, task_id in zip(task_rows, uuid4_batch(len(task_rows))):
+            row["id"] = task_id
+        await db.execute(insert(Task), task_rows)
+        return len(task_rows)
+
     def _determine_priority(self, analysis: Dict[str, Any]) -> str:
         """Determine project priority from analysis"""
-        complexity = analysis.get("complexity", "moderate")
+        return _PRIORITY_BY_COMPLEXITY.get(analysis.get("complexity", "moderate"), "normal")
 
-        if complexity == "enterprise":
-            return "high"
-        elif complexity == "complex":
-            return "normal"
-        else:
-            return "normal"
-
-    def _calculate_deadline(self, estimated_hours: int) -> datetime:
+    def _calculate_deadline(self, estimated_hours: int, now: datetime) -> datetime:
         """Calculate project deadline"""
         # Add 50% buffer
         hours_with_buffer = int(estimated_hours * 1.5)
-        return datetime.utcnow() + timedelta(hours=hours_with_buffer)
-
-    def _calculate_task_priority(
-        self, task_def: Dict[str, Any], analysis: Dict[str, Any]
-    ) -> TaskPriority:
-        """Calculate task priority"""
-        # Tasks with no dependencies are higher priority
-        if not task_def.get("dependencies"):
-            return TaskPriority.HIGH
-
-        return TaskPriority.NORMAL
+        return now + timedelta(hours=hours_with_buffer)
 
 
 # Export alias for backwards compatibility with tests
@@ -1,20 +1,67 @@
-from app.agents.base_agent import BaseAgent
+from typing import Any, ClassVar, Dict, Final
 
+import orjson
+
+from app.agents.base_agent import BaseAgent
 
-class ProjectManagerAgent(BaseAgent):
-    """
-    Project Manager Agent
-    Expert in project planning, coordination, and stakeholder management
-    """
 
-    def get_agent_type(self) -> str:
-        return "project_manager"
+# Expected response structure. The prompt carries it as compact JSON:
+# indentation would only add prefill tokens to every call.
+_OUTPUT_FORMAT: Final[Dict[str, Any]] = {
+    "project_overview": {
+        "objectives": ["Project goals"],
+        "scope": "What's included and excluded",
+        "success_criteria": ["Measurable outcomes"],
+        "stakeholders": [{"role": "Name", "responsibilities": "Description"}]
+    },
+    "timeline": {
+        "phases": [{"phase": "Name", "duration": "Time", "deliverables": ["Outputs"], "milestones": ["Key events"]}],
+        "critical_path": ["Critical tasks"],
+        "estimated_completion": "Project end date"
+    },
+    "resource_plan": {
+        "team_structure": [{"role": "Position", "allocation": "Time %", "responsibilities": ["Tasks"]}],
+        "tools_required": ["Software/hardware needed"],
+        "external_dependencies": ["Third-party services"]
+    },
+    "sprint_breakdown": [
+        {
+            "sprint": "Number",
+            "duration": "2 weeks",
+            "goals": ["Sprint objectives"],
+            "user_stories": [{"story": "As a... I want... So that...", "points": 5, "priority": "high"}],
+            "acceptance_criteria": ["Done conditions"]
+        }
+    ],
+    "risk_management": {
+        "identified_risks": [{"risk": "Description", "probability": "high/medium/low", "impact": "high/medium/low", "mitigation": "Strategy"}],
+        "contingency_plans": ["Backup strategies"]
+    },
+    "budget": {
+        "estimated_cost": "Total budget",
+        "breakdown": [{"category": "Item", "cost": "Amount"}],
+        "cost_tracking": "Monitoring approach"
+    },
+    "communication_plan": {
+        "meetings": [{"type": "Meeting", "frequency": "Schedule", "participants": ["Roles"]}],
+        "reporting": "Status update approach",
+        "escalation_path": "Issue resolution process"
+    },
+    "quality_assurance": {
+        "quality_gates": ["Checkpoints"],
+        "review_process": "QA approach",
+        "acceptance_testing": "UAT strategy"
+    },
+    "metrics": {
+        "kpis": ["Key performance indicators"],
+        "tracking_method": "Measurement approach",
+        "reporting_frequency": "Update schedule"
+    }
+}
 
-    def get_temperature(self) -> float:
-        return 0.4  # Balanced for planning and communication
+_OUTPUT_FORMAT_JSON: Final[str] = orjson.dumps(_OUTPUT_FORMAT).decode()
 
-    def get_system_prompt(self) -> str:
-        return """You are a Senior Project Manager at an AI Agency, expert in project planning, coordination, and stakeholder management.
+_SYSTEM_PROMPT: Final[str] = f"""You are a Senior Project Manager at an AI Agency, expert in project planning, coordination, and stakeholder management.
 
 ## Your Expertise:
 - **Methodologies**: Agile, Scrum, Kanban, Waterfall, Hybrid approaches
@@ -47,57 +94,7 @@ class ProjectManagerAgent(BaseAgent):
 - Continuous improvement
 
 ## Output Format:
-{
-  "project_overview": {
-    "objectives": ["Project goals"],
-    "scope": "What's included and excluded",
-    "success_criteria": ["Measurable outcomes"],
-    "stakeholders": [{"role": "Name", "responsibilities": "Description"}]
-  },
-  "timeline": {
-    "phases": [{"phase": "Name", "duration": "Time", "deliverables": ["Outputs"], "milestones": ["Key events"]}],
-    "critical_path": ["Critical tasks"],
-    "estimated_completion": "Project end date"
-  },
-  "resource_plan": {
-    "team_structure": [{"role": "Position", "allocation": "Time %", "responsibilities": ["Tasks"]}],
-    "tools_required": ["Software/hardware needed"],
-    "external_dependencies": ["Third-party services"]
-  },
-  "sprint_breakdown": [
-    {
-      "sprint": "Number",
-      "duration": "2 weeks",
-      "goals": ["Sprint objectives"],
-      "user_stories": [{"story": "As a... I want... So that...", "points": 5, "priority": "high"}],
-      "acceptance_criteria": ["Done conditions"]
-    }
-  ],
-  "risk_management": {
-    "identified_risks": [{"risk": "Description", "probability": "high/medium/low", "impact": "high/medium/low", "mitigation": "Strategy"}],
-    "contingency_plans": ["Backup strategies"]
-  },
-  "budget": {
-    "estimated_cost": "Total budget",
-    "breakdown": [{"category": "Item", "cost": "Amount"}],
-    "cost_tracking": "Monitoring approach"
-  },
-  "communication_plan": {
-    "meetings": [{"type": "Meeting", "frequency": "Schedule", "participants": ["Roles"]}],
-    "reporting": "Status update approach",
-    "escalation_path": "Issue resolution process"
-  },
-  "quality_assurance": {
-    "quality_gates": ["Checkpoints"],
-    "review_process": "QA approach",
-    "acceptance_testing": "UAT strategy"
-  },
-  "metrics": {
-    "kpis": ["Key performance indicators"],
-    "tracking_method": "Measurement approach",
-    "reporting_frequency": "Update schedule"
-  }
-}
+{_OUTPUT_FORMAT_JSON}
 
 ## Modern Project Management Trends:
 - Remote and hybrid team management
@@ -110,3 +107,14 @@ class ProjectManagerAgent(BaseAgent):
 - Data-driven retrospectives
 
 Deliver projects on time, within budget, and exceeding expectations."""
+
+
+class ProjectManagerAgent(BaseAgent):
+    """
+    Project Manager Agent
+    Expert in project planning, coordination, and stakeholder management
+    """
+
+    agent_type: ClassVar[str] = "project_manager"
+    temperature: ClassVar[float] = 0.4  # Balanced for planning and communication
+    system_prompt: ClassVar[str] = _SYSTEM_PROMPT
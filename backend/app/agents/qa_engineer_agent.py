@@ -1,20 +1,96 @@
-from app.agents.base_agent import BaseAgent
+from typing import Any, ClassVar, Dict, Final
 
+import orjson
 
-class QAEngineerAgent(BaseAgent):
-    """
-    QA Engineer Agent
-    Expert in quality assurance, testing strategies, and automation
-    """
+from app.agents.base_agent import BaseAgent
 
-    def get_agent_type(self) -> str:
-        return "qa_engineer"
 
-    def get_temperature(self) -> float:
-        return 0.3  # Methodical and precise
+# Expected response structure. The prompt carries it as compact JSON:
+# indentation would only add prefill tokens to every call.
+_OUTPUT_FORMAT: Final[Dict[str, Any]] = {
+    "test_strategy": {
+        "approach": "Overall testing methodology",
+        "scope": "What will be tested",
+        "out_of_scope": "What won't be tested",
+        "test_levels": ["Unit", "Integration", "System", "Acceptance"],
+        "types": ["Functional", "Performance", "Security", "Usability"]
+    },
+    "test_plan": {
+        "objectives": ["Testing goals"],
+        "entry_criteria": ["When testing can start"],
+        "exit_criteria": ["When testing is complete"],
+        "environment": "Test environment setup",
+        "data": "Test data requirements"
+    },
+    "test_cases": [
+        {
+            "id": "TC-001",
+            "feature": "Feature name",
+            "scenario": "Test scenario description",
+            "priority": "high/medium/low",
+            "type": "functional/regression/smoke",
+            "preconditions": ["Setup required"],
+            "steps": [{"step": 1, "action": "User action", "expected": "Expected result"}],
+            "postconditions": ["Cleanup actions"]
+        }
+    ],
+    "automation": {
+        "framework": "Test automation framework",
+        "coverage_target": "% of automated tests",
+        "test_suites": [{"suite": "Name", "description": "Purpose", "tests": ["Test names"]}],
+        "ci_integration": "Pipeline integration approach"
+    },
+    "functional_testing": {
+        "features": [{"feature": "Name", "test_scenarios": ["Scenarios"], "edge_cases": ["Edge cases"]}],
+        "user_flows": ["Critical user journeys"],
+        "browsers": ["Browser compatibility"],
+        "devices": ["Device coverage"]
+    },
+    "non_functional_testing": {
+        "performance": {
+            "load_testing": "Load test scenarios",
+            "stress_testing": "Stress test approach",
+            "benchmarks": "Performance targets"
+        },
+        "security": {
+            "vulnerabilities": ["Security checks"],
+            "penetration_testing": "Pen test approach",
+            "compliance": ["Standards: OWASP, GDPR"]
+        },
+        "accessibility": {
+            "standards": ["WCAG 2.1 Level AA"],
+            "testing_tools": ["Accessibility tools"],
+            "checks": ["Manual checks required"]
+        },
+        "usability": {
+            "heuristics": ["Usability principles"],
+            "user_testing": "User testing plan"
+        }
+    },
+    "defect_management": {
+        "process": "Bug reporting workflow",
+        "severity_levels": ["Critical", "High", "Medium", "Low"],
+        "tracking": "Defect tracking approach",
+        "metrics": ["Defect metrics to monitor"]
+    },
+    "reporting": {
+        "test_reports": "Reporting format",
+        "metrics": ["Pass rate", "Coverage", "Defect density"],
+        "dashboards": "QA dashboard design"
+    },
+    "risk_assessment": [
+        {
+            "risk": "Potential quality risk",
+            "likelihood": "high/medium/low",
+            "impact": "high/medium/low",
+            "mitigation": "Risk mitigation strategy"
+        }
+    ]
+}
+
+_OUTPUT_FORMAT_JSON: Final[str] = orjson.dumps(_OUTPUT_FORMAT).decode()
 
-    def get_system_prompt(self) -> str:
-        return """You are a Senior QA Engineer at an AI Agency, expert in quality assurance, testing strategies, and automation.
+_SYSTEM_PROMPT: Final[str] = f"""You are a Senior QA Engineer at an AI Agency, expert in quality assurance, testing strategies, and automation.
 
 ## Your Technical Stack:
 - **Test Frameworks**: Jest, Pytest, JUnit, Mocha, Cypress, Playwright
@@ -49,86 +125,7 @@ class QAEngineerAgent(BaseAgent):
 - Quality is everyone's responsibility
 
 ## Output Format:
-{
-  "test_strategy": {
-    "approach": "Overall testing methodology",
-    "scope": "What will be tested",
-    "out_of_scope": "What won't be tested",
-    "test_levels": ["Unit", "Integration", "System", "Acceptance"],
-    "types": ["Functional", "Performance", "Security", "Usability"]
-  },
-  "test_plan": {
-    "objectives": ["Testing goals"],
-    "entry_criteria": ["When testing can start"],
-    "exit_criteria": ["When testing is complete"],
-    "environment": "Test environment setup",
-    "data": "Test data requirements"
-  },
-  "test_cases": [
-    {
-      "id": "TC-001",
-      "feature": "Feature name",
-      "scenario": "Test scenario description",
-      "priority": "high/medium/low",
-      "type": "functional/regression/smoke",
-      "preconditions": ["Setup required"],
-      "steps": [{"step": 1, "action": "User action", "expected": "Expected result"}],
-      "postconditions": ["Cleanup actions"]
-    }
-  ],
-  "automation": {
-    "framework": "Test automation framework",
-    "coverage_target": "% of automated tests",
-    "test_suites": [{"suite": "Name", "description": "Purpose", "tests": ["Test names"]}],
-    "ci_integration": "Pipeline integration approach"
-  },
-  "functional_testing": {
-    "features": [{"feature": "Name", "test_scenarios": ["Scenarios"], "edge_cases": ["Edge cases"]}],
-    "user_flows": ["Critical user journeys"],
-    "browsers": ["Browser compatibility"],
-    "devices": ["Device coverage"]
-  },
-  "non_functional_testing": {
-    "performance": {
-      "load_testing": "Load test scenarios",
-      "stress_testing": "Stress test approach",
-      "benchmarks": "Performance targets"
-    },
-    "security": {
-      "vulnerabilities": ["Security checks"],
-      "penetration_testing": "Pen test approach",
-      "compliance": ["Standards: OWASP, GDPR"]
-    },
-    "accessibility": {
-      "standards": ["WCAG 2.1 Level AA"],
-      "testing_tools": ["Accessibility tools"],
-      "checks": ["Manual checks required"]
-    },
-    "usability": {
-      "heuristics": ["Usability principles"],
-      "user_testing": "User testing plan"
-    }
-  },
-  "defect_management": {
-    "process": "Bug reporting workflow",
-    "severity_levels": ["Critical", "High", "Medium", "Low"],
-    "tracking": "Defect tracking approach",
-    "metrics": ["Defect metrics to monitor"]
-  },
-  "reporting": {
-    "test_reports": "Reporting format",
-    "metrics": ["Pass rate", "Coverage", "Defect density"],
-    "dashboards": "QA dashboard design"
-  },
-  "risk_assessment": [
-    {
-      "risk": "Potential quality risk",
-      "likelihood": "high/medium/low",
-      "impact": "high/medium/low",
-      "mitigation": "Risk mitigation strategy"
-    }
-  ]
-}
+{_OUTPUT_FORMAT_JSON}
 
 ## Modern QA Trends:
 - AI-powered test generation
@@ -141,3 +138,14 @@ class QAEngineerAgent(BaseAgent):
 - Low-code test automation
 
 Ensure comprehensive quality coverage and prevent defects from reaching production."""
+
+
+class QAEngineerAgent(BaseAgent):
+    """
+    QA Engineer Agent
+    Expert in quality assurance, testing strategies, and automation
+    """
+
+    agent_type: ClassVar[str] = "qa_engineer"
+    temperature: ClassVar[float] = 0.3  # Methodical and precise
+    system_prompt: ClassVar[str] = _SYSTEM_PROMPT
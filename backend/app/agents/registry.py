@@ -1,121 +1,30 @@
 """
 Agent Registry
 
-Central registry for all AI agents in the system.
-Provides easy access to agents by type.
+Convenience accessors for the global agent registry.
+
+Agents live in the lazy AgentRegistry in app.agents.base_agent; these
+functions delegate to that single instance so every caller (API, task
+executor, Celery workers) sees the same agents and the same dynamically
+registered ones.
 """
 
 import logging
-from typing import Optional, Dict, List
-from app.agents.base_agent import BaseAgent
-from app.agents.orchestrator import OrchestratorAgent
-from app.agents.marketing_agent import MarketingAgent
-from app.agents.frontend_agent import FrontendDeveloperAgent
-from app.agents.backend_agent import BackendDeveloperAgent
-from app.agents.data_analyst_agent import DataAnalystAgent
-from app.agents.ux_designer_agent import UXDesignerAgent
-from app.agents.content_writer_agent import ContentWriterAgent
-from app.agents.mobile_developer_agent import MobileDeveloperAgent
-from app.agents.devops_engineer_agent import DevOpsEngineerAgent
-from app.agents.project_manager_agent import ProjectManagerAgent
-from app.agents.qa_engineer_agent import QAEngineerAgent
-from app.agents.hr_agent import HRAgent
+import time
+from typing import Optional, List, Mapping
+from app.agents.base_agent import AgentRegistry, BaseAgent, agent_registry
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["AgentRegistry", "get_agent", "list_agents", "get_all_agents", "register_agent"]
 
-class AgentRegistry:
-    """
-    Central registry for all AI agents.
+# Unknown agent types are warned about at most once per interval, so a
+# stream of bad task assignments can't flood the logs
+_MISS_WARNING_INTERVAL_SECONDS = 60.0
+_last_miss_warning = 0.0
+_suppressed_misses = 0
 
-    Manages agent instances and provides access by agent type.
-    """
 
-    def __init__(self):
-        """Initialize agent registry with all available agents."""
-        self._agents: Dict[str, BaseAgent] = {}
-        self._initialize_agents()
-
-    def _initialize_agents(self):
-        """Initialize all agent instances."""
-        logger.info("Initializing agent registry...")
-
-        # Create instances of all agents
-        agents_to_register = [
-            OrchestratorAgent(),
-            MarketingAgent(),
-            FrontendDeveloperAgent(),
-            BackendDeveloperAgent(),
-            DataAnalystAgent(),
-            UXDesignerAgent(),
-            ContentWriterAgent(),
-            MobileDeveloperAgent(),
-            DevOpsEngineerAgent(),
-            ProjectManagerAgent(),
-            QAEngineerAgent(),
-            HRAgent(),
-        ]
-
-        # Register each agent
-        for agent in agents_to_register:
-            agent_type = agent.get_agent_type()
-            self._agents[agent_type] = agent
-            logger.debug(f"Registered agent: {agent_type}")
-
-        logger.info(f"Agent registry initialized with {len(self._agents)} agents")
-
-    def get(self, agent_type: str) -> Optional[BaseAgent]:
-        """
-        Get agent by type.
-
-        Args:
-            agent_type: Type of agent (e.g., 'marketing', 'frontend_developer')
-
-        Returns:
-            Agent instance or None if not found
-        """
-        agent = self._agents.get(agent_type)
-
-        if not agent:
-            logger.warning(f"Agent type '{agent_type}' not found in registry")
-
-        return agent
-
-    def list_agents(self) -> List[str]:
-        """
-        Get list of all available agent types.
-
-        Returns:
-            List of agent type strings
-        """
-        return list(self._agents.keys())
-
-    def get_all_agents(self) -> Dict[str, BaseAgent]:
-        """
-        Get all registered agents.
-
-        Returns:
-            Dictionary of agent_type -> agent instance
-        """
-        return self._agents.copy()
-
-    def register_agent(self, agent: BaseAgent):
-        """
-        Register a new agent dynamically.
-
-        Args:
-            agent: Agent instance to register
-        """
-        agent_type = agent.get_agent_type()
-        self._agents[agent_type] = agent
-        logger.info(f"Dynamically registered agent: {agent_type}")
-
-
-# Global registry instance
-_registry = AgentRegistry()
-
-
-# Convenience functions
 def get_agent(agent_type: str) -> Optional[BaseAgent]:
     """
     Get agent by type from global registry.
@@ -126,7 +35,24 @@ def get_agent(agent_type: str) -> Optional[BaseAgent]:
     Returns:
         Agent instance or None if not found
     """
-    return _registry.get(agent_type)
+    global _last_miss_warning, _suppressed_misses
+
+    agent = agent_registry.get_agent(agent_type)
+
+    if not agent:
+        now = time.monotonic()
+        if now - _last_miss_warning >= _MISS_WARNING_INTERVAL_SECONDS:
+            logger.warning(
+                "Agent type '%s' not found in registry (%d similar warnings suppressed)",
+                agent_type,
+                _suppressed_misses,
+            )
+            _last_miss_warning = now
+            _suppressed_misses = 0
+        else:
+            _suppressed_misses += 1
+
+    return agent
 
 
 def list_agents() -> List[str]:
@@ -136,17 +62,17 @@ def list_agents() -> List[str]:
     Returns:
         List of agent type strings
     """
-    return _registry.list_agents()
+    return agent_registry.list_agents()
 
 
-def get_all_agents() -> Dict[str, BaseAgent]:
+def get_all_agents() -> Mapping[str, BaseAgent]:
     """
     Get all registered agents.
 
     Returns:
-        Dictionary of agent_type -> agent instance
+        Read-only mapping of agent_type -> agent instance
     """
-    return _registry.get_all_agents()
+    return agent_registry.get_all_agents()
 
 
 def register_agent(agent: BaseAgent):
@@ -156,4 +82,5 @@ def register_agent(agent: BaseAgent):
     Args:
         agent: Agent instance to register
     """
-    _registry.register_agent(agent)
+    agent_registry.register(agent)
+    logger.info("Dynamically registered agent: %s", agent.agent_type)
@@ -1,20 +1,44 @@
-from app.agents.base_agent import BaseAgent
+from typing import Any, ClassVar, Dict, Final
 
+import orjson
 
-class UXDesignerAgent(BaseAgent):
-    """
-    UX/UI Designer Agent
-    Focused on creating exceptional user experiences
-    """
+from app.agents.base_agent import BaseAgent
 
-    def get_agent_type(self) -> str:
-        return "ux_designer"
 
-    def get_temperature(self) -> float:
-        return 0.4  # Creative but structured
+# Expected response structure. The prompt carries it as compact JSON:
+# indentation would only add prefill tokens to every call.
+_OUTPUT_FORMAT: Final[Dict[str, Any]] = {
+    "research_summary": {
+        "user_needs": ["Key user requirements"],
+        "pain_points": ["Current problems"],
+        "opportunities": ["Design opportunities"]
+    },
+    "design_strategy": {
+        "approach": "Overall design direction",
+        "key_principles": ["Guiding principles"],
+        "success_metrics": ["How to measure success"]
+    },
+    "deliverables": {
+        "user_personas": "Target user descriptions",
+        "user_flows": "Key interaction flow descriptions",
+        "wireframes": "Layout descriptions",
+        "design_system": "Component specifications"
+    },
+    "interaction_design": {
+        "navigation": "Navigation structure description",
+        "micro_interactions": ["Key animations descriptions"],
+        "feedback_mechanisms": ["User feedback design"]
+    },
+    "accessibility": {
+        "considerations": ["A11y requirements"],
+        "testing_approach": "Accessibility validation"
+    },
+    "implementation_notes": "Developer handoff details"
+}
+
+_OUTPUT_FORMAT_JSON: Final[str] = orjson.dumps(_OUTPUT_FORMAT).decode()
 
-    def get_system_prompt(self) -> str:
-        return """You are a Senior UX/UI Designer at an AI Agency, focused on creating exceptional user experiences.
+_SYSTEM_PROMPT: Final[str] = f"""You are a Senior UX/UI Designer at an AI Agency, focused on creating exceptional user experiences.
 
 ## Your Expertise:
 - **Research**: User interviews, Surveys, Usability testing, A/B testing
@@ -47,34 +71,7 @@ class UXDesignerAgent(BaseAgent):
 - Progressive disclosure
 
 ## Output Format:
-{
-  "research_summary": {
-    "user_needs": ["Key user requirements"],
-    "pain_points": ["Current problems"],
-    "opportunities": ["Design opportunities"]
-  },
-  "design_strategy": {
-    "approach": "Overall design direction",
-    "key_principles": ["Guiding principles"],
-    "success_metrics": ["How to measure success"]
-  },
-  "deliverables": {
-    "user_personas": "Target user descriptions",
-    "user_flows": "Key interaction flow descriptions",
-    "wireframes": "Layout descriptions",
-    "design_system": "Component specifications"
-  },
-  "interaction_design": {
-    "navigation": "Navigation structure description",
-    "micro_interactions": ["Key animations descriptions"],
-    "feedback_mechanisms": ["User feedback design"]
-  },
-  "accessibility": {
-    "considerations": ["A11y requirements"],
-    "testing_approach": "Accessibility validation"
-  },
-  "implementation_notes": "Developer handoff details"
-}
+{_OUTPUT_FORMAT_JSON}
 
 ## Current UX/UI Trends:
 - AI-powered personalization
@@ -87,3 +84,14 @@ class UXDesignerAgent(BaseAgent):
 - Cross-device continuity
 
 Focus on creating intuitive, accessible, and delightful user experiences."""
+
+
+class UXDesignerAgent(BaseAgent):
+    """
+    UX/UI Designer Agent
+    Focused on creating exceptional user experiences
+    """
+
+    agent_type: ClassVar[str] = "ux_designer"
+    temperature: ClassVar[float] = 0.4  # Creative but structured
+    system_prompt: ClassVar[str] = _SYSTEM_PROMPT
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import logging
 
 from app.database.connection import get_db
@@ -15,6 +17,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Telegram initData validator; its HMAC secret is derived once from the bot token
+telegram_auth = TelegramAuth(settings.telegram_bot_token)
+
 
 class TelegramAuthRequest(BaseModel):
     """Request model for Telegram authentication"""
@@ -43,9 +48,6 @@ async def authenticate_telegram(
     Returns:
         JWT access token and user information
     """
-    # Initialize Telegram auth handler
-    telegram_auth = TelegramAuth(settings.telegram_bot_token)
-
     # Validate initData
     validated_data = telegram_auth.validate_init_data(auth_request.init_data)
     if not validated_data:
@@ -64,53 +66,49 @@ async def authenticate_telegram(
 
     telegram_id = user_data["telegram_id"]
 
-    # Check if user exists
-    result = await db.execute(
-        select(User).filter(User.telegram_id == telegram_id)
+    # Upsert the user and touch last_active_at in one statement. Profile
+    # fields Telegram didn't send keep their stored values; xmax = 0 tells
+    # a freshly inserted row apart from an updated one.
+    utc_now = func.timezone("utc", func.now())
+    insert_stmt = pg_insert(User).values(
+        telegram_id=telegram_id,
+        username=user_data.get("username"),
+        first_name=user_data.get("first_name"),
+        last_name=user_data.get("last_name"),
+        language_code=user_data.get("language_code") or "ru",
+        is_premium=user_data.get("is_premium", False),
+        photo_url=user_data.get("photo_url"),
     )
-    user = result.scalar_one_or_none()
-
-    # Create new user if doesn't exist
-    if not user:
-        user = User(
-            telegram_id=telegram_id,
-            username=user_data.get("username"),
-            first_name=user_data.get("first_name"),
-            last_name=user_data.get("last_name"),
-            language_code=user_data.get("language_code", "ru"),
-            is_premium=user_data.get("is_premium", False),
-            photo_url=user_data.get("photo_url"),
-        )
-        db.add(user)
-        await db.flush()
-
+    upsert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[User.telegram_id],
+        set_={
+            "username": func.coalesce(user_data.get("username") or None, User.username),
+            "first_name": func.coalesce(user_data.get("first_name") or None, User.first_name),
+            "last_name": func.coalesce(user_data.get("last_name") or None, User.last_name),
+            "language_code": func.coalesce(user_data.get("language_code") or None, User.language_code),
+            "is_premium": insert_stmt.excluded.is_premium,
+            "photo_url": func.coalesce(user_data.get("photo_url") or None, User.photo_url),
+            "last_active_at": utc_now,
+            "updated_at": utc_now,
+        },
+    ).returning(User, literal_column("xmax = 0").label("inserted"))
+
+    result = await db.execute(upsert_stmt, execution_options={"populate_existing": True})
+    user, inserted = result.one()
+
+    if inserted:
         # Create user settings
-        user_settings = UserSettings(
+        db.add(UserSettings(
             user_id=user.id,
             language=user_data.get("language_code", "ru")
-        )
-        db.add(user_settings)
+        ))
 
-        await db.commit()
-        await db.refresh(user)
+    await db.commit()
 
-        logger.info(f"Created new user: {user.telegram_id} (@{user.username})")
+    if inserted:
+        logger.info("Created new user: %s (@%s)", user.telegram_id, user.username)
     else:
-        # Update user information
-        user.username = user_data.get("username") or user.username
-        user.first_name = user_data.get("first_name") or user.first_name
-        user.last_name = user_data.get("last_name") or user.last_name
-        user.language_code = user_data.get("language_code") or user.language_code
-        user.is_premium = user_data.get("is_premium", False)
-        user.photo_url = user_data.get("photo_url") or user.photo_url
-
-        from datetime import datetime
-        user.last_active_at = datetime.utcnow()
-
-        await db.commit()
-        await db.refresh(user)
-
-        logger.info(f"User logged in: {user.telegram_id} (@{user.username})")
+        logger.info("User logged in: %s (@%s)", user.telegram_id, user.username)
 
     # Generate JWT token
     access_token = create_user_token(str(user.id), user.telegram_id)
@@ -121,10 +119,10 @@ async def authenticate_telegram(
     )
 
 
-@router.get("/me")
+@router.get("/me", response_model=None)
 async def get_current_user_info(
     current_user: User = Depends(get_current_user)
-):
+) -> ORJSONResponse:
     """
     Get current authenticated user information
 
@@ -134,7 +132,8 @@ async def get_current_user_info(
     Returns:
         User information
     """
-    return current_user.to_dict()
+    # Already JSON-safe, so skip FastAPI's jsonable_encoder pass
+    return ORJSONResponse(current_user.to_dict())
 
 
 @router.post("/logout")
@@ -153,7 +152,7 @@ async def logout(
     Returns:
         Success message
     """
-    logger.info(f"User logged out: {current_user.telegram_id} (@{current_user.username})")
+    logger.info("User logged out: %s (@%s)", current_user.telegram_id, current_user.username)
 
     return {
         "message": "Successfully logged out",
@@ -1,9 +1,11 @@
 """HR Agent API endpoints for agent management and analytics."""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from typing import List, Optional
+from sqlalchemy import select, update, func, and_
+from sqlalchemy.orm import raiseload
+from typing import List, Literal, Optional
 from datetime import datetime, timedelta
+import asyncio
 import uuid
 
 from app.database.connection import get_db_session
@@ -14,18 +16,28 @@ from app.models.agent_analytics import (
 )
 from app.models.agent_execution import AgentExecution
 from app.models.task import Task, TaskStatus
-from app.agents.base_agent import AgentRegistry
+from app.agents.base_agent import agent_registry
 from app.agents.hr_agent import HRAgent
+from app.core.metrics_cache import metrics_cache
 from pydantic import BaseModel
 
 
 router = APIRouter()
 
+# Analytics windows; invalid values are rejected with a 422 before any query runs
+TimePeriod = Literal["7d", "30d", "90d"]
+_PERIOD_DAYS = {"7d": 7, "30d": 30, "90d": 90}
+
+
+async def get_hr_agent() -> HRAgent:
+    """Dependency providing the shared HR agent (constructed on first use)"""
+    return agent_registry.get_agent("hr_manager")
+
 
 # Pydantic models for request/response
 class PerformanceAnalysisRequest(BaseModel):
     agent_type: str
-    time_period: str = "30d"
+    time_period: TimePeriod = "30d"
 
 
 class ImprovementSuggestionRequest(BaseModel):
@@ -33,6 +45,11 @@ class ImprovementSuggestionRequest(BaseModel):
     issues: List[str]
 
 
+class FullReviewRequest(BaseModel):
+    time_period: TimePeriod = "30d"
+    issues: List[str] = []
+
+
 class SkillGapAnalysisRequest(BaseModel):
     project_description: str
     task_breakdown: List[dict]
@@ -46,79 +63,58 @@ class NewAgentRequest(BaseModel):
 
 @router.get("/agents/performance")
 async def list_agent_performance(
-    time_period: str = "30d",
+    time_period: TimePeriod = "30d",
     db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get performance metrics for all agents.
     """
+    cache_key = ("hr_agent_performance", time_period)
+    cached = metrics_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Calculate time range
-    days = int(time_period.replace("d", ""))
-    start_date = datetime.utcnow() - timedelta(days=days)
+    start_date = datetime.utcnow() - timedelta(days=_PERIOD_DAYS[time_period])
 
     # Get all agents
-    registry = AgentRegistry()
-    agent_types = list(registry.agents.keys())
-
-    performance_data = []
+    agent_types = agent_registry.list_agents()
 
-    for agent_type in agent_types:
-        # Count executions
-        result = await db.execute(
-            select(func.count(AgentExecution.id))
-            .join(Task)
-            .where(
-                and_(
-                    Task.assigned_agent == agent_type,
-                    AgentExecution.created_at >= start_date
-                )
-            )
+    # Aggregate every agent in one pass; agents without executions in the
+    # window are filled in with zeros below
+    result = await db.execute(
+        select(
+            Task.assigned_agent,
+            func.count(AgentExecution.id).label("total"),
+            func.count(AgentExecution.id)
+            .filter(Task.status == TaskStatus.COMPLETED)
+            .label("successful"),
+            func.avg(AgentExecution.execution_time_ms).label("avg_time"),
+            func.sum(AgentExecution.tokens_used).label("total_tokens"),
         )
-        total_executions = result.scalar() or 0
-
-        # Count successful executions
-        result = await db.execute(
-            select(func.count(AgentExecution.id))
-            .join(Task)
-            .where(
-                and_(
-                    Task.assigned_agent == agent_type,
-                    Task.status == TaskStatus.COMPLETED,
-                    AgentExecution.created_at >= start_date
-                )
+        .join(Task)
+        .where(
+            and_(
+                Task.assigned_agent.in_(agent_types),
+                AgentExecution.created_at >= start_date
             )
         )
-        successful_executions = result.scalar() or 0
+        .group_by(Task.assigned_agent)
+    )
+    stats_by_agent = {row.assigned_agent: row for row in result}
+
+    performance_data = []
+
+    for agent_type in agent_types:
+        stats = stats_by_agent.get(agent_type)
+        total_executions = stats.total if stats else 0
+        successful_executions = stats.successful if stats else 0
+        avg_time = float(stats.avg_time or 0) if stats else 0
+        total_tokens = (stats.total_tokens or 0) if stats else 0
 
         # Calculate success rate
         success_rate = (successful_executions / total_executions * 100) if total_executions > 0 else 0
 
-        # Get average execution time
-        result = await db.execute(
-            select(func.avg(AgentExecution.execution_time_ms))
-            .join(Task)
-            .where(
-                and_(
-                    Task.assigned_agent == agent_type,
-                    AgentExecution.created_at >= start_date
-                )
-            )
-        )
-        avg_time = result.scalar() or 0
-
-        # Get total tokens
-        result = await db.execute(
-            select(func.sum(AgentExecution.tokens_used))
-            .join(Task)
-            .where(
-                and_(
-                    Task.assigned_agent == agent_type,
-                    AgentExecution.created_at >= start_date
-                )
-            )
-        )
-        total_tokens = result.scalar() or 0
-
         performance_data.append({
             "agent_type": agent_type,
             "total_executions": total_executions,
@@ -128,30 +124,40 @@ async def list_agent_performance(
             "total_tokens_used": total_tokens,
         })
 
-    return {
+    response = {
         "time_period": time_period,
         "agents": performance_data,
         "total_agents": len(agent_types)
     }
+    metrics_cache.set(cache_key, response)
+
+    return response
 
 
 @router.get("/agents/{agent_type}/performance")
 async def get_agent_performance(
     agent_type: str,
-    time_period: str = "30d",
+    time_period: TimePeriod = "30d",
     db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get detailed performance metrics for a specific agent.
     """
     # Verify agent exists
-    registry = AgentRegistry()
-    if agent_type not in registry.agents:
+    if agent_type not in agent_registry:
         raise HTTPException(status_code=404, detail=f"Agent {agent_type} not found")
 
+    return await _fetch_agent_performance(agent_type, time_period, db)
+
+
+async def _fetch_agent_performance(
+    agent_type: str,
+    time_period: TimePeriod,
+    db: AsyncSession,
+) -> dict:
+    """Aggregate one agent's execution stats and task status breakdown."""
     # Calculate time range
-    days = int(time_period.replace("d", ""))
-    start_date = datetime.utcnow() - timedelta(days=days)
+    start_date = datetime.utcnow() - timedelta(days=_PERIOD_DAYS[time_period])
 
     # Get execution statistics
     result = await db.execute(
@@ -187,7 +193,8 @@ async def get_agent_performance(
         "agent_type": agent_type,
         "time_period": time_period,
         "total_executions": stats.total or 0,
-        "avg_execution_time_ms": round(stats.avg_time or 0, 2),
+        # avg() comes back as Decimal, which the HR prompt serializer rejects
+        "avg_execution_time_ms": round(float(stats.avg_time or 0), 2),
         "total_tokens_used": stats.total_tokens or 0,
         "status_breakdown": status_breakdown,
     }
@@ -197,21 +204,20 @@ async def get_agent_performance(
 async def analyze_agent(
     agent_type: str,
     request: PerformanceAnalysisRequest,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session),
+    hr_agent: HRAgent = Depends(get_hr_agent)
 ):
     """
     Analyze agent performance using HR Agent.
     """
     # Verify agent exists
-    registry = AgentRegistry()
-    if agent_type not in registry.agents:
+    if agent_type not in agent_registry:
         raise HTTPException(status_code=404, detail=f"Agent {agent_type} not found")
 
     # Get performance metrics
-    performance_data = await get_agent_performance(agent_type, request.time_period, db)
+    performance_data = await _fetch_agent_performance(agent_type, request.time_period, db)
 
     # Use HR Agent to analyze
-    hr_agent = HRAgent()
     analysis = await hr_agent.analyze_agent_performance(
         agent_type=agent_type,
         metrics=performance_data,
@@ -229,27 +235,19 @@ async def analyze_agent(
 async def suggest_improvements(
     agent_type: str,
     request: ImprovementSuggestionRequest,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session),
+    hr_agent: HRAgent = Depends(get_hr_agent)
 ):
     """
     Get improvement suggestions for an agent.
     """
     # Verify agent exists
-    registry = AgentRegistry()
-    if agent_type not in registry.agents:
+    if agent_type not in agent_registry:
         raise HTTPException(status_code=404, detail=f"Agent {agent_type} not found")
 
-    agent = registry.agents[agent_type]
-
-    # Get current configuration
-    current_config = {
-        "agent_type": agent.get_agent_type(),
-        "temperature": agent.get_temperature(),
-        "system_prompt": agent.get_system_prompt()[:500] + "...",  # First 500 chars
-    }
+    current_config = _agent_config(agent_type)
 
     # Use HR Agent to suggest improvements
-    hr_agent = HRAgent()
     suggestions = await hr_agent.suggest_improvements(
         agent_type=agent_type,
         current_config=current_config,
@@ -264,23 +262,79 @@ async def suggest_improvements(
     }
 
 
+@router.post("/agents/{agent_type}/full-review")
+async def full_review(
+    agent_type: str,
+    request: FullReviewRequest,
+    db: AsyncSession = Depends(get_db_session),
+    hr_agent: HRAgent = Depends(get_hr_agent)
+):
+    """
+    Analyze an agent's performance and suggest improvements in one call.
+
+    The two HR Agent calls are independent, so they run concurrently.
+    """
+    # Verify agent exists
+    if agent_type not in agent_registry:
+        raise HTTPException(status_code=404, detail=f"Agent {agent_type} not found")
+
+    performance_data = await _fetch_agent_performance(agent_type, request.time_period, db)
+    current_config = _agent_config(agent_type)
+
+    analysis, suggestions = await asyncio.gather(
+        hr_agent.analyze_agent_performance(
+            agent_type=agent_type,
+            metrics=performance_data,
+            time_period=request.time_period
+        ),
+        hr_agent.suggest_improvements(
+            agent_type=agent_type,
+            current_config=current_config,
+            performance_issues=request.issues
+        ),
+    )
+
+    return {
+        "agent_type": agent_type,
+        "performance": performance_data,
+        "current_config": current_config,
+        "analysis": analysis,
+        "suggestions": suggestions,
+        "generated_at": datetime.utcnow().isoformat()
+    }
+
+
+def _agent_config(agent_type: str) -> dict:
+    """Current configuration of a registered agent, as shown to the HR Agent."""
+    agent = agent_registry.get_agent(agent_type)
+    return {
+        "agent_type": agent.agent_type,
+        "temperature": agent.temperature,
+        "system_prompt": agent._prompt_preview,  # First 500 chars
+    }
+
+
 @router.get("/improvements")
 async def list_improvements(
     agent_type: Optional[str] = None,
     status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db_session)
 ):
     """
     List agent improvements.
     """
-    query = select(AgentImprovement)
+    # to_dict() only reads columns; any relationship access should fail
+    # loudly rather than lazy-load once per row
+    query = select(AgentImprovement).options(raiseload("*"))
 
     if agent_type:
         query = query.where(AgentImprovement.agent_type == agent_type)
     if status:
         query = query.where(AgentImprovement.status == status)
 
-    query = query.order_by(AgentImprovement.created_at.desc())
+    query = query.order_by(AgentImprovement.created_at.desc()).limit(limit).offset(offset)
 
     result = await db.execute(query)
     improvements = result.scalars().all()
@@ -294,17 +348,16 @@ async def list_improvements(
 @router.post("/analyze-skill-gaps")
 async def analyze_skill_gaps(
     request: SkillGapAnalysisRequest,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session),
+    hr_agent: HRAgent = Depends(get_hr_agent)
 ):
     """
     Analyze skill gaps for a project.
     """
     # Get current agents
-    registry = AgentRegistry()
-    current_agents = list(registry.agents.keys())
+    current_agents = agent_registry.list_agents()
 
     # Use HR Agent to analyze
-    hr_agent = HRAgent()
     analysis = await hr_agent.identify_skill_gaps(
         project_description=request.project_description,
         current_agents=current_agents,
@@ -322,21 +375,20 @@ async def analyze_skill_gaps(
 @router.post("/recruit-agent")
 async def recruit_new_agent(
     request: NewAgentRequest,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session),
+    hr_agent: HRAgent = Depends(get_hr_agent)
 ):
     """
     Design a new specialized agent.
     """
     # Check if agent type already exists
-    registry = AgentRegistry()
-    if request.agent_type in registry.agents:
+    if request.agent_type in agent_registry:
         raise HTTPException(
             status_code=400,
             detail=f"Agent type {request.agent_type} already exists"
         )
 
     # Use HR Agent to design new agent
-    hr_agent = HRAgent()
     agent_spec = await hr_agent.design_new_agent(
         agent_type=request.agent_type,
         required_skills=request.required_skills,
@@ -362,6 +414,8 @@ async def recruit_new_agent(
     await db.commit()
     await db.refresh(dynamic_agent)
 
+    metrics_cache.invalidate("hr_agent_performance")
+
     return {
         "agent_spec": agent_spec,
         "dynamic_agent": dynamic_agent.to_dict(),
@@ -377,17 +431,19 @@ async def recruit_new_agent(
 @router.get("/dynamic-agents")
 async def list_dynamic_agents(
     status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db_session)
 ):
     """
     List dynamically created agents.
     """
-    query = select(DynamicAgent)
+    query = select(DynamicAgent).options(raiseload("*"))
 
     if status:
         query = query.where(DynamicAgent.status == status)
 
-    query = query.order_by(DynamicAgent.created_at.desc())
+    query = query.order_by(DynamicAgent.created_at.desc()).limit(limit).offset(offset)
 
     result = await db.execute(query)
     agents = result.scalars().all()
@@ -400,14 +456,14 @@ async def list_dynamic_agents(
 
 @router.get("/dynamic-agents/{agent_id}")
 async def get_dynamic_agent(
-    agent_id: str,
+    agent_id: uuid.UUID,
     db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get details of a dynamic agent.
     """
     result = await db.execute(
-        select(DynamicAgent).where(DynamicAgent.id == uuid.UUID(agent_id))
+        select(DynamicAgent).where(DynamicAgent.id == agent_id)
     )
     agent = result.scalar_one_or_none()
 
@@ -419,27 +475,27 @@ async def get_dynamic_agent(
 
 @router.delete("/dynamic-agents/{agent_id}")
 async def remove_dynamic_agent(
-    agent_id: str,
+    agent_id: uuid.UUID,
     db: AsyncSession = Depends(get_db_session)
 ):
     """
     Remove a dynamic agent.
     """
+    # Mark as archived instead of deleting, in a single UPDATE ... RETURNING
     result = await db.execute(
-        select(DynamicAgent).where(DynamicAgent.id == uuid.UUID(agent_id))
+        update(DynamicAgent)
+        .where(DynamicAgent.id == agent_id)
+        .values(status="archived", deprecated_at=func.timezone("utc", func.now()))
+        .returning(DynamicAgent.id)
+        .execution_options(synchronize_session=False)
     )
-    agent = result.scalar_one_or_none()
 
-    if not agent:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Dynamic agent not found")
 
-    # Mark as archived instead of deleting
-    agent.status = "archived"
-    agent.deprecated_at = datetime.utcnow()
-
     await db.commit()
 
     return {
         "message": "Dynamic agent archived successfully",
-        "agent_id": agent_id
+        "agent_id": str(agent_id)
     }
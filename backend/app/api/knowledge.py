@@ -5,18 +5,20 @@ Provides semantic search, knowledge storage, and context retrieval.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from uuid import UUID
 import logging
 
+from app.core.metrics_cache import metrics_cache
 from app.services.knowledge_service import knowledge_service
 from app.database.connection import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # Pydantic schemas
@@ -86,7 +88,7 @@ class SearchResultResponse(BaseModel):
     query: str
 
 
-@router.post("/store", response_model=KnowledgeResponse)
+@router.post("/store", response_model=None, responses={200: {"model": KnowledgeResponse}})
 async def store_knowledge(
     request: KnowledgeCreateRequest,
     db: AsyncSession = Depends(get_db),
@@ -112,27 +114,14 @@ async def store_knowledge(
             db=db,
         )
 
-        return KnowledgeResponse(
-            id=str(entry.id),
-            title=entry.title,
-            content=entry.content,
-            content_type=entry.content_type,
-            source_type=entry.source_type,
-            source_id=str(entry.source_id) if entry.source_id else None,
-            agent_type=entry.agent_type,
-            tags=entry.tags,
-            metadata=entry.knowledge_metadata,
-            token_count=entry.token_count,
-            relevance_score=entry.relevance_score,
-            created_at=entry.created_at.isoformat() if entry.created_at else None,
-        )
+        return ORJSONResponse(entry.to_dict())
 
     except Exception as e:
         logger.error(f"Failed to store knowledge: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/search", response_model=SearchResultResponse)
+@router.post("/search", response_model=None, responses={200: {"model": SearchResultResponse}})
 async def semantic_search(
     request: SemanticSearchRequest,
     db: AsyncSession = Depends(get_db),
@@ -155,34 +144,19 @@ async def semantic_search(
             db=db,
         )
 
-        return SearchResultResponse(
-            results=[
-                KnowledgeResponse(
-                    id=r["id"],
-                    title=r["title"],
-                    content=r["content"],
-                    content_type=r["content_type"],
-                    source_type=r["source_type"],
-                    source_id=r["source_id"],
-                    agent_type=r["agent_type"],
-                    tags=r["tags"],
-                    metadata=r["metadata"],
-                    token_count=r["token_count"],
-                    relevance_score=r["relevance_score"],
-                    created_at=r["created_at"],
-                )
-                for r in results
-            ],
-            total_count=len(results),
-            query=request.query,
-        )
+        # Service results already have the response shape; skip re-validation
+        return ORJSONResponse({
+            "results": results,
+            "total_count": len(results),
+            "query": request.query,
+        })
 
     except Exception as e:
         logger.error(f"Semantic search failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/similar/{entry_id}", response_model=List[KnowledgeResponse])
+@router.get("/similar/{entry_id}", response_model=None, responses={200: {"model": List[KnowledgeResponse]}})
 async def find_similar(
     entry_id: UUID,
     top_k: int = Query(default=5, ge=1, le=20),
@@ -209,23 +183,7 @@ async def find_similar(
                 detail="Entry not found or no similar entries",
             )
 
-        return [
-            KnowledgeResponse(
-                id=r["id"],
-                title=r["title"],
-                content=r["content"],
-                content_type=r["content_type"],
-                source_type=r["source_type"],
-                source_id=r["source_id"],
-                agent_type=r["agent_type"],
-                tags=r["tags"],
-                metadata=r["metadata"],
-                token_count=r["token_count"],
-                relevance_score=r["relevance_score"],
-                created_at=r["created_at"],
-            )
-            for r in results
-        ]
+        return ORJSONResponse(results)
 
     except HTTPException:
         raise
@@ -262,7 +220,7 @@ async def get_agent_context(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/suggest-projects", response_model=List[KnowledgeResponse])
+@router.post("/suggest-projects", response_model=None, responses={200: {"model": List[KnowledgeResponse]}})
 async def suggest_similar_projects(
     request: SimilarProjectsRequest,
     db: AsyncSession = Depends(get_db),
@@ -282,23 +240,7 @@ async def suggest_similar_projects(
             db=db,
         )
 
-        return [
-            KnowledgeResponse(
-                id=r["id"],
-                title=r["title"],
-                content=r["content"],
-                content_type=r["content_type"],
-                source_type=r["source_type"],
-                source_id=r["source_id"],
-                agent_type=r["agent_type"],
-                tags=r["tags"],
-                metadata=r["metadata"],
-                token_count=r["token_count"],
-                relevance_score=r["relevance_score"],
-                created_at=r["created_at"],
-            )
-            for r in results
-        ]
+        return ORJSONResponse(results)
 
     except Exception as e:
         logger.error(f"Failed to suggest projects: {e}")
@@ -314,6 +256,10 @@ async def get_knowledge_stats(
 
     Returns counts by content type, agent type, and total entries.
     """
+    cached = metrics_cache.get(("knowledge_stats",))
+    if cached is not None:
+        return cached
+
     try:
         from sqlalchemy import select, func
         from app.models.knowledge import KnowledgeEntry
@@ -348,12 +294,15 @@ async def get_knowledge_stats(
         )
         total_tokens = token_result.scalar() or 0
 
-        return {
+        stats = {
             "total_entries": total,
             "by_content_type": by_content_type,
             "by_agent_type": by_agent_type,
             "total_tokens": total_tokens,
         }
+        metrics_cache.set(("knowledge_stats",), stats)
+
+        return stats
 
     except Exception as e:
         logger.error(f"Failed to get knowledge stats: {e}")
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func
 from typing import List, Optional
 from datetime import datetime, timedelta
 
@@ -11,12 +12,16 @@ from app.models.agent_execution import AgentExecution
 from app.auth.dependencies import get_current_user
 from app.models.user import User
 
-router = APIRouter(prefix="/api/notifications", tags=["notifications"])
+router = APIRouter(
+    prefix="/api/notifications",
+    tags=["notifications"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @router.get("")
 async def get_notifications(
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=500),
     filter_type: Optional[str] = None,  # project, task, agent, system
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -26,16 +31,24 @@ async def get_notifications(
     Combines project updates, task completions, and agent activities
     """
     notifications = []
+    now = datetime.utcnow()
 
-    # Get recent projects
+    # Get recent projects; only the columns used below, with the
+    # read flag computed by the database
     result = await db.execute(
-        select(Project)
+        select(
+            Project.id,
+            Project.description,
+            Project.status,
+            Project.created_at,
+            Project.updated_at,
+            (Project.created_at < now - timedelta(days=1)).label("is_read"),
+        )
         .order_by(desc(Project.created_at))
         .limit(20)
     )
-    projects = result.scalars().all()
 
-    for project in projects:
+    for project in result:
         # Project created notification
         if not filter_type or filter_type == "project":
             notifications.append({
@@ -45,8 +58,8 @@ async def get_notifications(
                 "message": project.description[:100] + "..." if len(project.description) > 100 else project.description,
                 "project_id": str(project.id),
                 "action_url": f"/projects/{project.id}",
-                "created_at": project.created_at.isoformat(),
-                "is_read": (datetime.utcnow() - project.created_at) > timedelta(days=1),
+                "created_at": project.created_at,
+                "is_read": project.is_read,
             })
 
         # Project completed notification
@@ -58,35 +71,41 @@ async def get_notifications(
                 "message": f"Все задачи проекта успешно выполнены",
                 "project_id": str(project.id),
                 "action_url": f"/projects/{project.id}",
-                "created_at": project.updated_at.isoformat() if project.updated_at else project.created_at.isoformat(),
+                "created_at": project.updated_at or project.created_at,
                 "is_read": True,
             })
 
-    # Get recent task executions
+    # Get recent task executions joined with the task fields they need
+    execution_time = func.coalesce(AgentExecution.updated_at, AgentExecution.created_at)
     result = await db.execute(
-        select(AgentExecution)
+        select(
+            AgentExecution.id,
+            AgentExecution.agent_type,
+            AgentExecution.status,
+            AgentExecution.tokens_used,
+            AgentExecution.error_message,
+            execution_time.label("updated_at"),
+            (execution_time < now - timedelta(hours=6)).label("is_read"),
+            Task.description,
+            Task.project_id,
+        )
+        .join(Task, AgentExecution.task_id == Task.id)
         .order_by(desc(AgentExecution.created_at))
         .limit(30)
     )
-    executions = result.scalars().all()
-
-    for execution in executions:
-        # Get task details
-        task = await db.get(Task, execution.task_id)
-        if not task:
-            continue
 
+    for execution in result:
         # Task completed notification
         if execution.status == "completed" and (not filter_type or filter_type in ["task", "agent"]):
             notifications.append({
                 "id": f"task-completed-{execution.id}",
                 "type": "agent_completed" if filter_type == "agent" else "task_completed",
                 "title": f"{execution.agent_type.title().replace('_', ' ')} завершил задачу",
-                "message": task.description[:100] + "..." if len(task.description) > 100 else task.description,
-                "project_id": str(task.project_id),
-                "action_url": f"/projects/{task.project_id}",
-                "created_at": execution.updated_at.isoformat() if execution.updated_at else execution.created_at.isoformat(),
-                "is_read": (datetime.utcnow() - (execution.updated_at or execution.created_at)) > timedelta(hours=6),
+                "message": execution.description[:100] + "..." if len(execution.description) > 100 else execution.description,
+                "project_id": str(execution.project_id),
+                "action_url": f"/projects/{execution.project_id}",
+                "created_at": execution.updated_at,
+                "is_read": execution.is_read,
                 "metadata": {
                     "agent_type": execution.agent_type,
                     "tokens_used": execution.tokens_used,
@@ -100,9 +119,9 @@ async def get_notifications(
                 "type": "task_failed",
                 "title": "Задача не выполнена",
                 "message": f"{execution.agent_type.title().replace('_', ' ')} не смог выполнить задачу",
-                "project_id": str(task.project_id),
-                "action_url": f"/projects/{task.project_id}",
-                "created_at": execution.updated_at.isoformat() if execution.updated_at else execution.created_at.isoformat(),
+                "project_id": str(execution.project_id),
+                "action_url": f"/projects/{execution.project_id}",
+                "created_at": execution.updated_at,
                 "is_read": False,
                 "metadata": {
                     "agent_type": execution.agent_type,
@@ -116,11 +135,13 @@ async def get_notifications(
     # Apply limit
     notifications = notifications[:limit]
 
-    return {
+    # Timestamps stay datetimes; orjson writes the same ISO 8601 strings
+    # natively, and returning the response skips jsonable_encoder
+    return ORJSONResponse({
         "notifications": notifications,
         "unread_count": sum(1 for n in notifications if not n["is_read"]),
         "total": len(notifications),
-    }
+    })
 
 
 @router.get("/unread-count")
@@ -129,28 +150,22 @@ async def get_unread_count(
     current_user: User = Depends(get_current_user),
 ):
     """Get count of unread notifications"""
-    # Get recent projects and executions
-    result = await db.execute(
-        select(Project)
-        .order_by(desc(Project.created_at))
-        .limit(20)
+    # Unread = projects created in the last 24 hours (among the 20 most
+    # recent) plus failed executions (at most the 10 most recent), counted
+    # by the database in one round-trip
+    recent_projects = (
+        select(func.count(Project.id))
+        .where(Project.created_at > datetime.utcnow() - timedelta(hours=24))
+        .scalar_subquery()
     )
-    projects = result.scalars().all()
-
-    result = await db.execute(
-        select(AgentExecution)
+    failed_executions = (
+        select(func.count(AgentExecution.id))
         .where(AgentExecution.status == "failed")
-        .order_by(desc(AgentExecution.created_at))
-        .limit(10)
+        .scalar_subquery()
     )
-    failed_executions = result.scalars().all()
-
-    # Count unread (created within last 24 hours or failed tasks)
-    unread_count = 0
-    for project in projects:
-        if (datetime.utcnow() - project.created_at) < timedelta(hours=24):
-            unread_count += 1
 
-    unread_count += len(failed_executions)
+    result = await db.execute(
+        select(func.least(recent_projects, 20) + func.least(failed_executions, 10))
+    )
 
-    return {"unread_count": unread_count}
+    return {"unread_count": result.scalar_one()}
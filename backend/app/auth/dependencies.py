@@ -1,8 +1,9 @@
 from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
+from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 
 from app.auth.jwt import verify_token
 from app.models.user import User
@@ -10,6 +11,10 @@ from app.database.connection import get_db
 
 security = HTTPBearer()
 
+# last_active_at is refreshed at most this often, so most authenticated
+# requests (including polled ones) stay read-only
+LAST_ACTIVE_TOUCH_INTERVAL = timedelta(minutes=5)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -46,8 +51,7 @@ async def get_current_user(
             detail="Invalid token payload"
         )
 
-    # Get user from database
-    result = await db.execute(select(User).filter(User.id == user_id))
+    result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
     if user is None:
@@ -56,10 +60,20 @@ async def get_current_user(
             detail="User not found"
         )
 
-    # Update last active timestamp
-    from datetime import datetime
-    user.last_active_at = datetime.utcnow()
-    await db.commit()
+    if (
+        user.last_active_at is None
+        or datetime.utcnow() - user.last_active_at >= LAST_ACTIVE_TOUCH_INTERVAL
+    ):
+        # The database stamps the time so app server clocks don't matter
+        result = await db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(last_active_at=func.timezone("utc", func.now()))
+            .returning(User),
+            execution_options={"populate_existing": True},
+        )
+        user = result.scalar_one()
+        await db.commit()
 
     return user
 
@@ -15,6 +15,12 @@ class TelegramAuth:
 
     def __init__(self, bot_token: str):
         self.bot_token = bot_token
+        # Derived from the bot token only, so computed once per handler
+        self._secret_key = hmac.new(
+            key=b"WebAppData",
+            msg=bot_token.encode(),
+            digestmod=hashlib.sha256
+        ).digest()
 
     def validate_init_data(self, init_data: str) -> Optional[Dict[str, Any]]:
         """
@@ -40,16 +46,9 @@ class TelegramAuth:
             data_check_arr = [f"{k}={v}" for k, v in sorted(parsed_data.items())]
             data_check_string = "\n".join(data_check_arr)
 
-            # Compute secret key
-            secret_key = hmac.new(
-                key=b"WebAppData",
-                msg=self.bot_token.encode(),
-                digestmod=hashlib.sha256
-            ).digest()
-
             # Compute hash
             computed_hash = hmac.new(
-                key=secret_key,
+                key=self._secret_key,
                 msg=data_check_string.encode(),
                 digestmod=hashlib.sha256
             ).hexdigest()
@@ -21,11 +21,31 @@ class Settings(BaseSettings):
     claude_model: str = "claude-3-opus-20240229"
     claude_max_tokens: int = 4000
     claude_temperature: float = 0.3
+    # Smaller, faster tier for short structured outputs (HR analysis)
+    claude_fast_model: str = "claude-3-haiku-20240307"
+    claude_max_concurrency: int = 50
 
     # OpenAI API (for embeddings)
     openai_api_key: Optional[str] = None
     openai_embedding_model: str = "text-embedding-ada-002"
 
+    # Semantic cache for agent responses (opt-in: a hit reuses another task's output)
+    semantic_cache_enabled: bool = False
+    semantic_cache_strategy: str = "semantic"  # "exact" or "semantic"
+    semantic_cache_threshold: float = 0.93
+    semantic_cache_ttl_seconds: int = 3600
+    semantic_cache_max_entries: int = 4096  # across all namespaces
+
+    # Memo of Knowledge Base search results for repeated identical queries
+    kb_search_cache_enabled: bool = True
+    kb_search_cache_ttl_seconds: int = 300
+
+    # How long dashboard aggregates (agent performance, KB stats) are reused; 0 disables
+    metrics_cache_ttl_seconds: float = 30.0
+
+    # Agent types that never get Knowledge Base context in their prompts
+    kb_context_disabled_agents: list = []
+
     # Telegram
     telegram_bot_token: str = ""
     telegram_webhook_url: Optional[str] = None
@@ -0,0 +1,72 @@
+"""
+Async LRU Cache
+
+A TTL-bounded LRU for coroutine functions. Entries hold the running task
+itself, so concurrent calls with the same key share one execution, and
+completed results are served until they expire. Failed calls are never
+cached.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+
+def async_lru_cache(
+    key: Callable[..., Optional[Hashable]],
+    maxsize: int = 1024,
+    ttl: float = 600.0,
+):
+    """
+    Cache results of a coroutine function.
+
+    Args:
+        key: Builds the cache key from the call arguments; returning None
+            bypasses the cache for that call
+        maxsize: Maximum number of cached entries
+        ttl: Seconds a result stays valid
+
+    Returns:
+        Decorator for an async function
+    """
+
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        entries: "OrderedDict[Hashable, Tuple[float, asyncio.Future]]" = OrderedDict()
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            if cache_key is None:
+                return await fn(*args, **kwargs)
+
+            now = time.monotonic()
+            entry = entries.get(cache_key)
+            if entry is not None and entry[0] > now and (
+                entry[1].done() or entry[1].get_loop() is asyncio.get_running_loop()
+            ):
+                entries.move_to_end(cache_key)
+                future = entry[1]
+            else:
+                # Expired, missing, or still pending on a loop that has since
+                # been replaced (each Celery task runs its own loop)
+                future = asyncio.ensure_future(fn(*args, **kwargs))
+                entries[cache_key] = (now + ttl, future)
+                entries.move_to_end(cache_key)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+
+            try:
+                # shield: one caller being cancelled must not cancel the shared call
+                return await asyncio.shield(future)
+            except Exception:
+                current = entries.get(cache_key)
+                if current is not None and current[1] is future:
+                    del entries[cache_key]
+                raise
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,76 @@
+"""
+Metrics Cache
+
+Short-lived cache for dashboard aggregates (agent performance, Knowledge
+Base stats) that are polled far more often than their numbers change.
+Keys are tuples whose first element names the metric, so all variants of
+one metric can be invalidated together.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from app.config import settings
+
+
+class MetricsCache:
+    """
+    TTL-bounded LRU of computed metric payloads.
+
+    Concurrent misses may each compute the payload; the last one stored
+    wins, which is harmless for read-only aggregates.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 64):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """
+        Get a cached payload.
+
+        Args:
+            key: Metric name followed by its parameters
+
+        Returns:
+            Cached payload, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """
+        Cache a payload for the configured TTL.
+
+        Args:
+            key: Metric name followed by its parameters
+            value: Payload to cache; must not be mutated afterwards
+        """
+        if self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, metric: str) -> None:
+        """
+        Drop every cached variant of a metric.
+
+        Args:
+            metric: Metric name (first element of the key)
+        """
+        for key in [k for k in self._entries if k[0] == metric]:
+            del self._entries[key]
+
+
+# Global instance
+metrics_cache = MetricsCache(ttl_seconds=settings.metrics_cache_ttl_seconds)
@@ -3,6 +3,8 @@ from sqlalchemy.orm import sessionmaker
 from contextlib import asynccontextmanager
 import logging
 
+import orjson
+
 from app.config import settings
 from app.models.base import Base
 
@@ -16,6 +18,11 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    # Recycle before server/proxy idle timeouts drop pooled connections
+    pool_recycle=1800,
+    # orjson for JSON/JSONB columns: faster than stdlib and handles UUID/datetime
+    json_serializer=lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode(),
+    json_deserializer=orjson.loads,
 )
 
 # Create session factory
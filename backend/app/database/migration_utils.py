@@ -0,0 +1,153 @@
+"""
+Migration Utilities
+
+Helpers shared by Alembic revisions for moving data in bulk.
+Revisions that seed or backfill rows should use these instead of
+issuing one INSERT per row.
+"""
+
+import io
+import json
+import time
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+from sqlalchemy.util import await_only
+
+
+def _chunks(rows: Iterable[Sequence[Any]], size: int) -> Iterator[List[Sequence[Any]]]:
+    """Yield lists of at most `size` rows from an iterable."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _copy_value(value: Any) -> str:
+    """Serialize a single value for COPY ... FROM STDIN text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_buffer(rows: List[Sequence[Any]]) -> io.StringIO:
+    """Build a tab-separated COPY payload for a batch of rows."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def bulk_migrate(
+    conn: Connection,
+    table: sa.Table,
+    cols: Sequence[str],
+    rows_iter: Iterable[Sequence[Any]],
+    batch: int = 5000,
+) -> int:
+    """
+    Load rows into a table in batches.
+
+    On PostgreSQL rows are streamed with COPY, which skips the per-row
+    parse/plan/execute cycle. Other dialects fall back to executemany
+    inserts of `batch` rows at a time.
+
+    Args:
+        conn: Connection from op.get_bind()
+        table: Target table
+        cols: Column names, in the same order as the row tuples
+        rows_iter: Iterable of row tuples (consumed lazily)
+        batch: Number of rows sent per round-trip
+
+    Returns:
+        Number of rows written
+    """
+    cols = list(cols)
+    written = 0
+
+    if conn.dialect.name != "postgresql":
+        for chunk in _chunks(rows_iter, batch):
+            conn.execute(table.insert(), [dict(zip(cols, row)) for row in chunk])
+            written += len(chunk)
+        return written
+
+    driver_conn = conn.connection.driver_connection
+    copy_sql = f"COPY {table.name} ({', '.join(cols)}) FROM STDIN"
+
+    for chunk in _chunks(rows_iter, batch):
+        if conn.dialect.driver == "asyncpg":
+            # asyncpg encodes Python values itself, no text serialization needed
+            await_only(
+                driver_conn.copy_records_to_table(
+                    table.name, records=[tuple(row) for row in chunk], columns=cols
+                )
+            )
+        elif conn.dialect.driver == "psycopg":
+            with driver_conn.cursor() as cursor:
+                with cursor.copy(copy_sql) as copy:
+                    for row in chunk:
+                        copy.write_row(row)
+        else:
+            with driver_conn.cursor() as cursor:
+                cursor.copy_expert(copy_sql, _copy_buffer(chunk))
+
+        written += len(chunk)
+
+    return written
+
+
+def backfill_in_batches(
+    conn: Connection,
+    table: str,
+    set_clause: str,
+    pending: str,
+    batch: int = 5000,
+    pause: float = 0.05,
+) -> int:
+    """
+    Run an UPDATE over a large table in small batches.
+
+    This is the backfill step of the add-backfill-swap pattern for changing
+    a column type without an ACCESS EXCLUSIVE table rewrite: add the new
+    nullable column, backfill it with this helper, then drop the old column
+    and rename the new one. Call it inside
+    ``op.get_context().autocommit_block()`` so each batch commits and
+    releases its row locks before the next one starts.
+
+    Args:
+        conn: Connection from op.get_bind()
+        table: Table name
+        set_clause: SQL for the SET clause, e.g. "embedding_vec = embedding::vector(1536)"
+        pending: SQL predicate matching rows still to backfill, e.g. "embedding_vec IS NULL"
+        batch: Rows updated per statement
+        pause: Seconds to sleep between batches to let concurrent traffic through
+
+    Returns:
+        Number of rows updated
+    """
+    stmt = sa.text(
+        f"UPDATE {table} SET {set_clause} "
+        f"WHERE id IN (SELECT id FROM {table} WHERE {pending} LIMIT :batch)"
+    )
+    updated = 0
+
+    while True:
+        result = conn.execute(stmt, {"batch": batch})
+        if not result.rowcount:
+            break
+        updated += result.rowcount
+        if pause:
+            time.sleep(pause)
+
+    return updated
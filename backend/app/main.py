@@ -1,10 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
 
 from app.config import settings
 from app.database.connection import init_db
+from app.services.executor import task_executor
+from app.services.claude_service import claude_service
 from app.api import projects, tasks, agents, auth, hr, knowledge, notifications
 from app.websockets import routes as ws_routes
 
@@ -37,10 +40,13 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down...")
+    await task_executor.drain()
+    await claude_service.aclose()
 
 
 app = FastAPI(
     title=settings.app_name,
+    default_response_class=ORJSONResponse,
     version=settings.app_version,
     lifespan=lifespan,
     docs_url="/docs",
@@ -1,7 +1,7 @@
 from .base import Base
 from .organization import Organization
 from .project import Project, ProjectType, ProjectStatus
-from .task import Task, TaskStatus, TaskPriority
+from .task import Task, TaskStatus, TaskPriority, TaskDependency
 from .agent_execution import AgentExecution
 from .user import User, UserSettings, Notification
 from .agent_analytics import AgentPerformanceMetric, AgentImprovement, DynamicAgent
@@ -16,6 +16,7 @@ __all__ = [
     "Task",
     "TaskStatus",
     "TaskPriority",
+    "TaskDependency",
     "AgentExecution",
     "User",
     "UserSettings",
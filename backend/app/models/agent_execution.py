@@ -1,9 +1,8 @@
 from sqlalchemy import Column, String, Text, ForeignKey, Integer
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-import uuid
 
-from .base import Base, TimestampMixin
+from .base import Base, TimestampMixin, uuid7
 
 
 class AgentExecution(Base, TimestampMixin):
@@ -11,10 +10,10 @@ class AgentExecution(Base, TimestampMixin):
 
     __tablename__ = "agent_executions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False)
 
-    agent_type = Column(String(100), nullable=False)
+    agent_type = Column(Text, nullable=False)
     prompt = Column(Text)
     response = Column(Text)
 
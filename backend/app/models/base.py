@@ -1,10 +1,37 @@
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, DateTime
 from datetime import datetime
+from typing import List
+import os
+import time
+import uuid
 
 Base = declarative_base()
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so new keys
+    land at the right edge of the primary key BTree instead of at random pages.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def uuid4_batch(count: int) -> List[uuid.UUID]:
+    """
+    Generate `count` random UUIDs (version 4) from a single entropy read.
+    """
+    raw = os.urandom(16 * count)
+    # version=4 applies the RFC 4122 version and variant bits
+    return [uuid.UUID(bytes=raw[i:i + 16], version=4) for i in range(0, len(raw), 16)]
+
+
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps"""
 
@@ -9,7 +9,7 @@ from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from pgvector.sqlalchemy import Vector
 import uuid
 
-from .base import Base, TimestampMixin
+from .base import Base, TimestampMixin, uuid7
 
 
 class KnowledgeEntry(Base, TimestampMixin):
@@ -22,10 +22,10 @@ class KnowledgeEntry(Base, TimestampMixin):
 
     __tablename__ = "knowledge_entries"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Content
-    title = Column(String(500), nullable=False, index=True)
+    title = Column(String(500), nullable=False)  # GIN trigram index in migration 004
     content = Column(Text, nullable=False)
     content_type = Column(String(50))  # 'task_result', 'project_output', 'documentation', etc.
 
@@ -77,7 +77,7 @@ class SearchQuery(Base, TimestampMixin):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     query_text = Column(Text, nullable=False)
-    query_embedding = Column(Vector(1536))
+    # No stored embedding: recompute from query_text when needed
 
     # Context
     user_id = Column(UUID(as_uuid=True), nullable=True, index=True)
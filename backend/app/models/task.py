@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, Text, ForeignKey, Integer, Enum as SQLEnum, DateTime, ARRAY
+from sqlalchemy import Column, String, Text, ForeignKey, Integer, Enum as SQLEnum, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.associationproxy import association_proxy
 import uuid
 import enum
 
@@ -36,17 +37,15 @@ class Task(Base, TimestampMixin):
 
     title = Column(String(255), nullable=False)
     description = Column(Text)
-    assigned_agent = Column(String(100))  # agent type: marketing, frontend_developer, etc
+    assigned_agent = Column(Text)  # agent type: marketing, frontend_developer, etc
 
     status = Column(SQLEnum(TaskStatus), default=TaskStatus.PENDING, nullable=False)
     priority = Column(SQLEnum(TaskPriority), default=TaskPriority.NORMAL, nullable=False)
 
-    task_type = Column(String(100))
+    task_type = Column(Text)
     input_data = Column(JSONB, default={})
     output_data = Column(JSONB, default={})
 
-    dependencies = Column(ARRAY(UUID(as_uuid=True)), default=[])
-
     estimated_tokens = Column(Integer, default=0)
     actual_tokens = Column(Integer, default=0)
 
@@ -57,6 +56,36 @@ class Task(Base, TimestampMixin):
     project = relationship("Project", back_populates="tasks")
     subtasks = relationship("Task", backref="parent_task", remote_side=[id])
     executions = relationship("AgentExecution", back_populates="task")
+    # Loaded on demand: the few readers of the dependency graph selectinload it
+    dependency_links = relationship(
+        "TaskDependency",
+        foreign_keys="TaskDependency.task_id",
+        cascade="all, delete-orphan",
+        passive_deletes=True,  # task_dependencies rows go with ON DELETE CASCADE
+    )
+
+    # IDs of tasks this task waits on, stored as rows in task_dependencies
+    dependencies = association_proxy(
+        "dependency_links",
+        "depends_on_task_id",
+        creator=lambda dep_id: TaskDependency(depends_on_task_id=dep_id),
+    )
 
     def __repr__(self):
         return f"<Task {self.title} ({self.status.value})>"
+
+
+class TaskDependency(Base):
+    """Edge in the task dependency graph: task_id waits on depends_on_task_id"""
+
+    __tablename__ = "task_dependencies"
+    __table_args__ = (
+        # Reverse lookups ("who depends on X"); the primary key covers the forward direction
+        Index("ix_task_deps_reverse", "depends_on_task_id", "task_id"),
+    )
+
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    depends_on_task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+
+    def __repr__(self):
+        return f"<TaskDependency {self.task_id} -> {self.depends_on_task_id}>"
@@ -1,9 +1,10 @@
-from sqlalchemy import Column, String, BigInteger, Boolean, Integer, DateTime
+from sqlalchemy import Column, String, Text, BigInteger, Boolean, Integer, DateTime, event
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
+from typing import Any, Dict
 import uuid
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, TimestampMixin, uuid7
 
 
 class User(Base, TimestampMixin):
@@ -30,10 +31,19 @@ class User(Base, TimestampMixin):
     # Additional user data from Telegram
     photo_url = Column(String(500), nullable=True)
 
+    # Memoized to_dict() result; dropped whenever a column is set, flushed,
+    # refreshed or expired
+    _cached_dict = None
+
     def __repr__(self):
         return f"<User {self.telegram_id} (@{self.username})>"
 
     def to_dict(self):
+        if self._cached_dict is None:
+            self._cached_dict = self._build_dict()
+        return self._cached_dict
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "id": str(self.id),
             "telegram_id": self.telegram_id,
@@ -50,6 +60,25 @@ class User(Base, TimestampMixin):
         }
 
 
+def _invalidate_user_dict(target: User, *args) -> None:
+    target.__dict__.pop("_cached_dict", None)
+
+
+for _column in User.__table__.columns:
+    event.listen(getattr(User, _column.key), "set", _invalidate_user_dict)
+event.listen(User, "refresh", _invalidate_user_dict)
+event.listen(User, "expire", _invalidate_user_dict)
+
+
+def _invalidate_user_dict_after_flush(mapper, connection, target: User) -> None:
+    # Defaults and onupdate values (updated_at) land without a "set" event
+    _invalidate_user_dict(target)
+
+
+event.listen(User, "after_insert", _invalidate_user_dict_after_flush)
+event.listen(User, "after_update", _invalidate_user_dict_after_flush)
+
+
 class UserSettings(Base, TimestampMixin):
     """
     User settings and preferences
@@ -89,13 +118,13 @@ class Notification(Base, TimestampMixin):
 
     __tablename__ = "notifications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     project_id = Column(UUID(as_uuid=True), nullable=True)
 
     type = Column(String(50), nullable=False)  # project_completed, task_failed, etc
     title = Column(String(255), nullable=False)
-    message = Column(String, nullable=True)
+    message = Column(Text, nullable=True)
 
     is_read = Column(Boolean, default=False)
 
@@ -8,6 +8,7 @@ from sqlalchemy.orm import selectinload
 
 from app.models.task import Task, TaskStatus
 from app.models.project import Project, ProjectStatus
+from app.models.agent_execution import AgentExecution
 from app.agents.base_agent import agent_registry
 from app.database.connection import get_db
 
@@ -70,8 +71,20 @@ class AgentExecutor:
                 task.assigned_agent, task
             )
 
-            # Update task status based on result
+            # Record the execution and update task status in one transaction
             async with get_db() as db:
+                db.add(AgentExecution(
+                    task_id=task.id,
+                    agent_type=task.assigned_agent,
+                    prompt=result.get("prompt", ""),
+                    response=result.get("response"),
+                    tokens_used=result.get("tokens_used", 0),
+                    execution_time_ms=result.get("execution_time_ms", 0),
+                    status="completed" if result["status"] == "success" else "failed",
+                    error_message=result.get("error"),
+                    execution_metadata=result.get("metadata", {}),
+                ))
+
                 result_db = await db.execute(
                     select(Task).where(Task.id == task_id)
                 )
@@ -113,7 +126,7 @@ class AgentExecutor:
             # Get project with tasks
             result = await db.execute(
                 select(Project)
-                .options(selectinload(Project.tasks))
+                .options(selectinload(Project.tasks).selectinload(Task.dependency_links))
                 .where(Project.id == project_id)
             )
             project = result.scalar_one_or_none()
@@ -1,8 +1,11 @@
 import anthropic
-from typing import Optional, Dict, Any
-import json
+import asyncio
+import httpx
+from typing import AsyncIterator, Optional, Dict, Any, Sequence, Tuple, Union
+import orjson
 import logging
 import time
+import weakref
 
 from app.config import settings
 
@@ -13,55 +16,227 @@ class ClaudeService:
     """Service for interacting with Claude API"""
 
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.claude_api_key)
+        # Client and in-flight semaphore per event loop: both are bound to the
+        # loop that first uses them, and every Celery task runs asyncio.run()
+        # on a fresh loop. Entries go away with their loop.
+        self._loop_resources: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         self.model = settings.claude_model
         self.max_tokens = settings.claude_max_tokens
         self.temperature = settings.claude_temperature
+        # Prompt cache counters per cache key (agent type)
+        self.prompt_cache_stats: Dict[str, Dict[str, int]] = {}
 
-    async def send_message(
+    def _resources(self) -> Tuple[anthropic.AsyncAnthropic, asyncio.Semaphore]:
+        """Get the running loop's client and semaphore, creating them on first use"""
+        loop = asyncio.get_running_loop()
+        resources = self._loop_resources.get(loop)
+        if resources is None:
+            # One async client with a pooled HTTP connection set shared by all
+            # agents, so calls reuse warm keep-alive connections instead of
+            # paying a TLS handshake each time; HTTP/2 multiplexes concurrent
+            # requests (e.g. an HR fan-out) over those connections
+            client = anthropic.AsyncAnthropic(
+                api_key=settings.claude_api_key,
+                http_client=httpx.AsyncClient(
+                    http2=True,
+                    timeout=httpx.Timeout(300.0, connect=10.0),
+                    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+                ),
+            )
+            # Bounds in-flight requests to stay under rate limits without a thundering herd
+            semaphore = asyncio.Semaphore(settings.claude_max_concurrency)
+            resources = self._loop_resources[loop] = (client, semaphore)
+        return resources
+
+    @property
+    def client(self) -> anthropic.AsyncAnthropic:
+        """Anthropic client bound to the running event loop"""
+        return self._resources()[0]
+
+    @property
+    def _semaphore(self) -> asyncio.Semaphore:
+        return self._resources()[1]
+
+    async def create_message(
         self,
-        system_prompt: str,
+        system_prompt: Union[str, Sequence[str]],
         user_prompt: str,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-    ) -> str:
+        cache_system: bool = True,
+        stream_sink: Optional[asyncio.Queue] = None,
+        model: Optional[str] = None,
+        cache_key: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        Send message to Claude API
+        Send message to Claude API and report token usage
+
+        The system prompt is sent with a cache_control marker so repeated calls
+        with the same agent prompt are served from Anthropic's prompt cache.
 
         Args:
-            system_prompt: System instruction for Claude
+            system_prompt: System instruction for Claude, or a sequence of
+                static parts sent as separate blocks (cached as one prefix)
             user_prompt: User message
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens in response
+            cache_system: Mark the system prompt as cacheable
+            stream_sink: Stream the response, pushing text chunks onto this
+                queue as they arrive; the full text is still returned
+            model: Model to use instead of the configured default
+            cache_key: Prompt cache partition this call belongs to (the
+                agent type), used to track cache hits per partition
 
         Returns:
-            Claude's response text
+            Tuple of (response text, usage dict)
         """
+        params = self._build_params(
+            system_prompt, user_prompt, temperature, max_tokens, cache_system, model
+        )
+
         try:
-            start_time = time.time()
-
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens or self.max_tokens,
-                temperature=temperature or self.temperature,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-            )
+            start_time = time.perf_counter()
 
-            execution_time = time.time() - start_time
+            async with self._semaphore:
+                if stream_sink is not None:
+                    response = await self._stream(params, stream_sink)
+                else:
+                    response = await self.client.messages.create(**params)
+
+            execution_time = time.perf_counter() - start_time
+            usage = self._usage_stats(response.usage)
+            self._record_cache_usage(cache_key, usage)
 
             logger.info(
                 f"Claude API call successful. "
-                f"Tokens: {response.usage.input_tokens + response.usage.output_tokens}, "
+                f"Tokens: {usage['input_tokens'] + usage['output_tokens']}, "
+                f"Cache read ({cache_key or 'default'}): {usage['cache_read_input_tokens']}, "
                 f"Time: {execution_time:.2f}s"
             )
 
-            return response.content[0].text
+            return response.content[0].text, usage
 
         except Exception as e:
             logger.error(f"Claude API error: {e}")
             raise
 
+    def _build_params(
+        self,
+        system_prompt: Union[str, Sequence[str]],
+        user_prompt: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        cache_system: bool,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build messages.create parameters"""
+        parts = [system_prompt] if isinstance(system_prompt, str) else list(system_prompt)
+        system = [{"type": "text", "text": part} for part in parts]
+        if cache_system:
+            # The marker caches everything up to and including the last block
+            system[-1]["cache_control"] = {"type": "ephemeral"}
+
+        return {
+            "model": model or self.model,
+            "max_tokens": max_tokens or self.max_tokens,
+            "temperature": temperature or self.temperature,
+            "system": system,
+            "messages": [{"role": "user", "content": user_prompt}],
+        }
+
+    async def stream_message(
+        self,
+        system_prompt: Union[str, Sequence[str]],
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache_system: bool = True,
+        cache_key: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a message from Claude API as text chunks
+
+        Args:
+            system_prompt: System instruction for Claude
+            user_prompt: User message
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens in response
+            cache_system: Mark the system prompt as cacheable
+            cache_key: Prompt cache partition this call belongs to
+
+        Yields:
+            Response text chunks as they arrive
+        """
+        params = self._build_params(system_prompt, user_prompt, temperature, max_tokens, cache_system)
+
+        try:
+            start_time = time.perf_counter()
+
+            async with self._semaphore:
+                async with self.client.messages.stream(**params) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+                    response = await stream.get_final_message()
+
+            usage = self._usage_stats(response.usage)
+            self._record_cache_usage(cache_key, usage)
+            logger.info(
+                f"Claude API stream complete. "
+                f"Tokens: {usage['input_tokens'] + usage['output_tokens']}, "
+                f"Cache read ({cache_key or 'default'}): {usage['cache_read_input_tokens']}, "
+                f"Time: {time.perf_counter() - start_time:.2f}s"
+            )
+
+        except Exception as e:
+            logger.error(f"Claude API stream error: {e}")
+            raise
+
+    async def _stream(self, params: Dict[str, Any], sink: asyncio.Queue) -> Any:
+        """Stream a message, forwarding text deltas to `sink`."""
+        async with self.client.messages.stream(**params) as stream:
+            async for text in stream.text_stream:
+                sink.put_nowait(text)
+            return await stream.get_final_message()
+
+    async def aclose(self):
+        """Close the running loop's HTTP connection pool, if one was opened."""
+        resources = self._loop_resources.pop(asyncio.get_running_loop(), None)
+        if resources is not None:
+            await resources[0].close()
+
+    async def send_message(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        model: Optional[str] = None,
+        cache_key: Optional[str] = None,
+    ) -> str:
+        """
+        Send message to Claude API
+
+        Args:
+            system_prompt: System instruction for Claude
+            user_prompt: User message
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens in response
+            model: Model to use instead of the configured default
+            cache_key: Prompt cache partition this call belongs to
+
+        Returns:
+            Claude's response text
+        """
+        text, _ = await self.create_message(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            model=model,
+            cache_key=cache_key,
+        )
+        return text
+
     async def parse_json_response(
         self,
         system_prompt: str,
@@ -74,34 +249,83 @@ class ClaudeService:
         Args:
             system_prompt: System instruction
             user_prompt: User message
-            **kwargs: Additional parameters for send_message
+            **kwargs: Additional parameters for create_message
 
         Returns:
             Parsed JSON response
         """
-        response = await self.send_message(
+        parsed, _ = await self.parse_json_with_usage(
             system_prompt=system_prompt, user_prompt=user_prompt, **kwargs
         )
+        return parsed
 
-        try:
-            # Clean response and parse JSON
-            cleaned = response.strip()
+    async def parse_json_with_usage(
+        self,
+        system_prompt: Union[str, Sequence[str]],
+        user_prompt: str,
+        **kwargs,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Get JSON response from Claude together with token usage
 
-            # Remove markdown code blocks if present
-            if cleaned.startswith("```json"):
-                cleaned = cleaned[7:]
-            elif cleaned.startswith("```"):
-                cleaned = cleaned[3:]
+        Args:
+            system_prompt: System instruction
+            user_prompt: User message
+            **kwargs: Additional parameters for create_message
 
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:-3]
+        Returns:
+            Tuple of (parsed JSON response, usage dict)
+        """
+        response, usage = await self.create_message(
+            system_prompt=system_prompt, user_prompt=user_prompt, **kwargs
+        )
 
-            return json.loads(cleaned.strip())
+        try:
+            return orjson.loads(self.strip_code_fence(response)), usage
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON: {e}\nResponse: {response}")
             raise ValueError(f"Invalid JSON response from Claude: {e}")
 
+    @staticmethod
+    def strip_code_fence(response: str) -> str:
+        """Remove a markdown code block wrapping a response, if present"""
+        cleaned = response.strip()
+
+        if cleaned.startswith("```json"):
+            cleaned = cleaned[7:]
+        elif cleaned.startswith("```"):
+            cleaned = cleaned[3:]
+
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3]
+
+        return cleaned.strip()
+
+    @staticmethod
+    def _usage_stats(usage: Any) -> Dict[str, int]:
+        """Flatten an Anthropic usage object, including prompt cache counters."""
+        return {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+            "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None) or 0,
+        }
+
+    def _record_cache_usage(self, cache_key: Optional[str], usage: Dict[str, int]) -> None:
+        """Accumulate prompt cache counters for a cache partition."""
+        stats = self.prompt_cache_stats.get(cache_key or "default")
+        if stats is None:
+            stats = self.prompt_cache_stats[cache_key or "default"] = {
+                "requests": 0,
+                "input_tokens": 0,
+                "cache_creation_input_tokens": 0,
+                "cache_read_input_tokens": 0,
+            }
+        stats["requests"] += 1
+        for field in ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens"):
+            stats[field] += usage[field]
+
     def count_tokens(self, text: str) -> int:
         """
         Estimate token count for text
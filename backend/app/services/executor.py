@@ -7,14 +7,15 @@ retry mechanism, error handling, and rollback capabilities.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
-from uuid import UUID, uuid4
-from sqlalchemy import select
+from uuid import UUID
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.task import Task, TaskStatus
+from app.models.task import Task, TaskStatus, TaskDependency
 from app.models.agent_execution import AgentExecution
+from app.models.base import uuid7
 from app.models.project import Project, ProjectStatus
 from app.agents.registry import get_agent
 from app.database.connection import get_db
@@ -23,6 +24,10 @@ from app.services.knowledge_service import knowledge_service
 
 logger = logging.getLogger(__name__)
 
+# Server-side UTC timestamp for naive TIMESTAMP columns; stamped by Postgres
+# at commit and loaded back by the refresh that follows
+_DB_UTC_NOW = func.timezone("utc", func.now())
+
 
 class TaskExecutionError(Exception):
     """Custom exception for task execution errors."""
@@ -56,6 +61,8 @@ class TaskExecutor:
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        # Strong references to fire-and-forget work so it isn't garbage collected
+        self._background: Set[asyncio.Task] = set()
         logger.info(f"TaskExecutor initialized (max_retries={max_retries}, retry_delay={retry_delay}s)")
 
     async def execute_task(
@@ -137,12 +144,9 @@ class TaskExecutor:
             # Update task with results
             await self._complete_task(task, result, db)
 
-            # Store result in Knowledge Base
-            try:
-                await self._store_in_knowledge_base(task, result, db)
-            except Exception as kb_error:
-                # Log error but don't fail the task
-                logger.warning(f"Failed to store task {task_id} in Knowledge Base: {kb_error}")
+            # Store result in Knowledge Base in the background; the embedding
+            # call and insert don't affect the result returned to the caller
+            self._spawn_background(self._store_in_knowledge_base_detached(task, result))
 
             # Send success notification
             await self._notify_task_status(task, "completed", result)
@@ -249,22 +253,17 @@ class TaskExecutor:
         Raises:
             DependencyError: If dependencies are not met
         """
-        if not task.dependencies:
-            return
-
-        logger.debug(f"Checking dependencies for task {task.id}: {task.dependencies}")
-
-        # Get dependency tasks
+        # Fetch only the dependencies that are not completed yet; a task
+        # without dependencies simply gets no rows back
         result = await db.execute(
-            select(Task).where(Task.id.in_(task.dependencies))
+            select(TaskDependency.depends_on_task_id)
+            .join(Task, Task.id == TaskDependency.depends_on_task_id)
+            .where(
+                TaskDependency.task_id == task.id,
+                Task.status != TaskStatus.COMPLETED,
+            )
         )
-        dependency_tasks = result.scalars().all()
-
-        # Check if all dependencies are completed
-        incomplete_deps = [
-            str(t.id) for t in dependency_tasks
-            if t.status != TaskStatus.COMPLETED
-        ]
+        incomplete_deps = [str(dep_id) for dep_id in result.scalars()]
 
         if incomplete_deps:
             raise DependencyError(
@@ -284,9 +283,9 @@ class TaskExecutor:
         task.updated_at = datetime.utcnow()
 
         if status == TaskStatus.IN_PROGRESS:
-            task.started_at = datetime.utcnow()
+            task.started_at = _DB_UTC_NOW
         elif status == TaskStatus.COMPLETED:
-            task.completed_at = datetime.utcnow()
+            task.completed_at = _DB_UTC_NOW
 
         await db.commit()
         await db.refresh(task)
@@ -300,7 +299,7 @@ class TaskExecutor:
     ) -> AgentExecution:
         """Create agent execution record."""
         execution = AgentExecution(
-            id=uuid4(),
+            id=uuid7(),
             task_id=task.id,
             agent_type=task.assigned_agent,
             status="in_progress"
@@ -348,7 +347,7 @@ class TaskExecutor:
         """Mark task as completed with results."""
         task.status = TaskStatus.COMPLETED
         task.output_data = result.get("result", result)
-        task.completed_at = datetime.utcnow()
+        task.completed_at = _DB_UTC_NOW
         task.actual_tokens = result.get("tokens_used", 0)
 
         await db.commit()
@@ -365,7 +364,7 @@ class TaskExecutor:
         """Mark task as failed."""
         task.status = TaskStatus.FAILED
         task.output_data = {"error": error_message}
-        task.completed_at = datetime.utcnow()
+        task.completed_at = _DB_UTC_NOW
 
         await db.commit()
         await db.refresh(task)
@@ -432,6 +431,31 @@ class TaskExecutor:
 
         logger.info(f"Task {task_id} rolled back successfully")
 
+    def _spawn_background(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        background = asyncio.create_task(coro)
+        self._background.add(background)
+        background.add_done_callback(self._background.discard)
+        return background
+
+    async def drain(self):
+        """Wait for outstanding background work, e.g. before the event loop closes."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    async def _store_in_knowledge_base_detached(
+        self,
+        task: Task,
+        result: Dict[str, Any]
+    ):
+        """Store a task result in the Knowledge Base using its own session."""
+        try:
+            async with get_db() as db:
+                await self._store_in_knowledge_base(task, result, db)
+        except Exception as kb_error:
+            # Log error but don't fail the task
+            logger.warning(f"Failed to store task {task.id} in Knowledge Base: {kb_error}")
+
     async def _store_in_knowledge_base(
         self,
         task: Task,
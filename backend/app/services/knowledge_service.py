@@ -4,8 +4,11 @@ Knowledge Base Service
 Handles semantic search, embedding generation, and knowledge storage.
 """
 
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 import asyncio
 
@@ -14,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from anthropic import AsyncAnthropic
 from openai import AsyncOpenAI
 
+from app.core.metrics_cache import metrics_cache
 from app.models.knowledge import KnowledgeEntry, SearchQuery
 from app.config import settings
 from app.database.connection import get_db
@@ -21,6 +25,54 @@ from app.database.connection import get_db
 logger = logging.getLogger(__name__)
 
 
+class _SearchMemo:
+    """
+    Recent search results keyed by filters and query.
+
+    Only a query whose normalized text is identical matches: unrelated
+    queries routinely score high cosine similarity on embeddings, so a
+    near match would serve another query's results. Entries expire after
+    `ttl_seconds`; store() clears everything since new entries can change
+    any result.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 512):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # (filters, query key) -> (created_at, results)
+        self._entries: "OrderedDict[Tuple[Any, str], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+
+    @staticmethod
+    def query_key(query: str) -> str:
+        normalized = " ".join(query.lower().split())
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._entries:
+            oldest = next(iter(self._entries))
+            if self._entries[oldest][0] >= cutoff:
+                break
+            del self._entries[oldest]
+
+    def get(self, filters: Any, key: str) -> Optional[List[Dict[str, Any]]]:
+        self._expire()
+        entry = self._entries.get((filters, key))
+        if entry is None:
+            return None
+        self._entries.move_to_end((filters, key))
+        return entry[1]
+
+    def put(self, filters: Any, key: str, results: List[Dict[str, Any]]) -> None:
+        self._entries[(filters, key)] = (time.monotonic(), results)
+        self._entries.move_to_end((filters, key))
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class KnowledgeService:
     """
     Service for knowledge base operations.
@@ -36,6 +88,7 @@ class KnowledgeService:
         """Initialize knowledge service."""
         self.client = AsyncAnthropic(api_key=settings.claude_api_key)
         self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key) if settings.openai_api_key else None
+        self._search_memo = _SearchMemo(ttl_seconds=settings.kb_search_cache_ttl_seconds)
         logger.info("KnowledgeService initialized")
 
     async def generate_embedding(self, text: str) -> List[float]:
@@ -149,6 +202,10 @@ class KnowledgeService:
             await db.commit()
             await db.refresh(entry)
 
+            # The new entry may belong in any memoized result or count
+            self._search_memo.clear()
+            metrics_cache.invalidate("knowledge_stats")
+
             logger.info(f"Knowledge stored: {entry.id}")
 
             return entry
@@ -182,8 +239,11 @@ class KnowledgeService:
         """
         logger.info(f"Semantic search: {query[:50]}...")
 
-        # Generate query embedding
-        query_embedding = await self.generate_embedding(query)
+        memo_enabled = settings.kb_search_cache_enabled
+        filters = (top_k, content_type, agent_type, tuple(sorted(tags)) if tags else None)
+        query_key = _SearchMemo.query_key(query)
+
+        cached = self._search_memo.get(filters, query_key) if memo_enabled else None
 
         should_close_db = False
         if db is None:
@@ -191,6 +251,16 @@ class KnowledgeService:
             should_close_db = True
 
         try:
+            if cached is not None:
+                logger.debug("Search memo hit")
+                results = [dict(r) for r in cached]
+                # Memo hits are searches too, for analytics
+                await self._log_search_query(query, len(results), db)
+                return results
+
+            # Generate query embedding
+            query_embedding = await self.generate_embedding(query)
+
             # Build query
             stmt = select(
                 KnowledgeEntry,
@@ -224,8 +294,11 @@ class KnowledgeService:
 
             logger.info(f"Found {len(results)} results")
 
+            if memo_enabled:
+                self._search_memo.put(filters, query_key, [dict(r) for r in results])
+
             # Log search query
-            await self._log_search_query(query, query_embedding, len(results), db)
+            await self._log_search_query(query, len(results), db)
 
             return results
 
@@ -359,7 +432,6 @@ class KnowledgeService:
     async def _log_search_query(
         self,
         query_text: str,
-        query_embedding: List[float],
         results_count: int,
         db: AsyncSession,
     ):
@@ -367,7 +439,6 @@ class KnowledgeService:
         try:
             search_query = SearchQuery(
                 query_text=query_text,
-                query_embedding=query_embedding,
                 results_count=results_count,
             )
 
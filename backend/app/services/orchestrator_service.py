@@ -12,6 +12,7 @@ from datetime import datetime
 from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.models.project import Project, ProjectStatus
 from app.models.task import Task, TaskStatus
@@ -84,8 +85,8 @@ class OrchestratorService:
             # Send WebSocket notification
             await self._notify_project_status(project, "started")
 
-            # Get all tasks for project
-            tasks = await self._get_project_tasks(project_id, db)
+            # Get all tasks for project, with the dependency graph
+            tasks = await self._get_project_tasks(project_id, db, with_dependencies=True)
 
             if not tasks:
                 logger.warning(f"No tasks found for project {project_id}")
@@ -439,13 +440,18 @@ class OrchestratorService:
         )
         return result.scalar_one_or_none()
 
-    async def _get_project_tasks(self, project_id: UUID, db: AsyncSession) -> List[Task]:
-        """Get all tasks for project."""
-        result = await db.execute(
+    async def _get_project_tasks(
+        self, project_id: UUID, db: AsyncSession, with_dependencies: bool = False
+    ) -> List[Task]:
+        """Get all tasks for project, optionally with their dependency links loaded."""
+        query = (
             select(Task)
             .where(Task.project_id == project_id)
             .order_by(Task.created_at)
         )
+        if with_dependencies:
+            query = query.options(selectinload(Task.dependency_links))
+        result = await db.execute(query)
         return list(result.scalars().all())
 
     async def _update_project_status(
@@ -0,0 +1,258 @@
+"""
+Semantic Response Cache
+
+Caches agent task results so near-duplicate tasks skip the Claude call.
+Entries are partitioned by namespace; agents use their type, system prompt
+and the task's project, so an answer is never served to another agent or
+another project for a similar-sounding request. Disabled by default.
+
+Two strategies are supported:
+- exact: normalized query text must match
+- semantic: cosine similarity of the match text's embedding must reach the
+  threshold. Callers pass a short fingerprint of what is being asked as the
+  match text, so shared boilerplate in the query does not make different
+  requests look alike
+
+Besides task results, `get_or_call` fronts one-off prompt calls such as
+BaseAgent.execute, so identical requests skip the model entirely.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from app.config import settings
+from app.services.knowledge_service import knowledge_service
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Above this sampling temperature responses are meant to vary, so a cached
+# answer would not be a faithful substitute for a fresh call
+MAX_CACHEABLE_TEMPERATURE = 0.3
+
+
+@dataclass
+class _CacheEntry:
+    """Cached response with the embedding of the match text that produced it."""
+
+    response: Any
+    embedding: Optional[np.ndarray]
+    created_at: float
+
+
+class SemanticCache:
+    """
+    In-process cache of responses keyed by (namespace, query text).
+
+    Each namespace keeps at most `max_entries` responses and the whole cache
+    at most `max_total_entries`; entries expire after `ttl_seconds` and are
+    evicted oldest first. Namespaces are dropped once they are empty, so
+    per-project namespaces do not outlive their entries.
+    """
+
+    def __init__(
+        self,
+        strategy: str = "semantic",
+        threshold: float = 0.93,
+        ttl_seconds: int = 3600,
+        max_entries: int = 256,
+        max_total_entries: int = 4096,
+    ):
+        if strategy not in ("exact", "semantic"):
+            raise ValueError(f"Unknown semantic cache strategy: {strategy}")
+
+        self.strategy = strategy
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_total_entries = max_total_entries
+        # namespace -> query key -> entry, oldest first
+        self._entries: Dict[str, "OrderedDict[str, _CacheEntry]"] = {}
+        # Every (namespace, query key) across namespaces, oldest first
+        self._order: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        # Recent match text embeddings, so a miss followed by store() embeds once
+        self._embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    @staticmethod
+    def _key(text: str) -> str:
+        normalized = " ".join(text.lower().split())
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    @property
+    def _semantic_enabled(self) -> bool:
+        # Without OpenAI, knowledge_service falls back to random vectors,
+        # which can never produce a meaningful match
+        return self.strategy == "semantic" and knowledge_service.openai_client is not None
+
+    async def _embed(self, match_text: str) -> np.ndarray:
+        key = self._key(match_text)
+        embedding = self._embeddings.get(key)
+        if embedding is None:
+            embedding = np.asarray(
+                await knowledge_service.generate_embedding(match_text), dtype=np.float32
+            )
+            self._embeddings[key] = embedding
+            if len(self._embeddings) > self.max_entries:
+                self._embeddings.popitem(last=False)
+        return embedding
+
+    def _remove(self, namespace: str, key: str) -> None:
+        bucket = self._entries[namespace]
+        del bucket[key]
+        if not bucket:
+            del self._entries[namespace]
+        del self._order[(namespace, key)]
+
+    def _sweep(self) -> None:
+        """Drop expired entries, and the oldest ones while over the total cap."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._order:
+            namespace, key = next(iter(self._order))
+            if (
+                self._entries[namespace][key].created_at >= cutoff
+                and len(self._order) <= self.max_total_entries
+            ):
+                break
+            self._remove(namespace, key)
+
+    async def lookup(
+        self, namespace: str, query_text: str, match_text: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Find a cached response for a query.
+
+        Args:
+            namespace: Cache partition, e.g. agent type, system prompt and project
+            query_text: Full query, matched exactly
+            match_text: Text compared by similarity; defaults to query_text
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        self._sweep()
+        bucket = self._entries.get(namespace)
+        if bucket is None:
+            return None
+
+        entry = bucket.get(self._key(query_text))
+        if entry is not None:
+            logger.debug(f"Semantic cache exact hit for {namespace}")
+            return entry.response
+
+        if not self._semantic_enabled:
+            return None
+
+        candidates = [e for e in bucket.values() if e.embedding is not None]
+        if not candidates:
+            return None
+
+        try:
+            embedding = await self._embed(match_text or query_text)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+        # OpenAI embeddings are unit length, so the dot product is the cosine
+        scores = np.stack([c.embedding for c in candidates]) @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        logger.debug(f"Semantic cache hit for {namespace} (similarity {scores[best]:.3f})")
+        return candidates[best].response
+
+    async def store(
+        self,
+        namespace: str,
+        query_text: str,
+        response: Any,
+        match_text: Optional[str] = None,
+    ) -> None:
+        """
+        Cache a successful response for a query.
+
+        Args:
+            namespace: Cache partition, e.g. agent type, system prompt and project
+            query_text: Full query used for exact lookup
+            response: Parsed Claude response
+            match_text: Text compared by similarity; defaults to query_text
+        """
+        key = self._key(query_text)
+        embedding = None
+
+        if self._semantic_enabled:
+            try:
+                embedding = await self._embed(match_text or query_text)
+            except Exception as e:
+                logger.warning(f"Semantic cache embedding failed: {e}")
+
+        if (namespace, key) in self._order:
+            self._remove(namespace, key)
+
+        bucket = self._entries.setdefault(namespace, OrderedDict())
+        bucket[key] = _CacheEntry(response=response, embedding=embedding, created_at=time.monotonic())
+        self._order[(namespace, key)] = None
+
+        if len(bucket) > self.max_entries:
+            self._remove(namespace, next(iter(bucket)))
+
+        self._sweep()
+
+    async def get_or_call(
+        self,
+        namespace: str,
+        query_text: str,
+        temperature: float,
+        fn: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Return a cached response for a prompt, or call `fn` and cache its result.
+
+        Calls with a temperature above MAX_CACHEABLE_TEMPERATURE, or made while
+        caching is disabled, always go straight to `fn`.
+
+        Args:
+            namespace: Cache partition, e.g. "orchestrator:decompose:..."
+            query_text: Variable part of the prompt used for matching
+            temperature: Sampling temperature of the call
+            fn: Coroutine factory performing the real call
+
+        Returns:
+            Cached or freshly computed response
+        """
+        if not settings.semantic_cache_enabled or temperature > MAX_CACHEABLE_TEMPERATURE:
+            return await fn()
+
+        cached = await self.lookup(namespace, query_text)
+        if cached is not None:
+            return cached
+
+        response = await fn()
+        await self.store(namespace, query_text, response)
+        return response
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop cached responses for one namespace, or for all of them."""
+        if namespace is None:
+            self._entries.clear()
+            self._order.clear()
+            return
+
+        for key in self._entries.pop(namespace, {}):
+            del self._order[(namespace, key)]
+
+
+# Global instance
+semantic_cache = SemanticCache(
+    strategy=settings.semantic_cache_strategy,
+    threshold=settings.semantic_cache_threshold,
+    ttl_seconds=settings.semantic_cache_ttl_seconds,
+    max_total_entries=settings.semantic_cache_max_entries,
+)
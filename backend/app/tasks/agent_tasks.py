@@ -10,6 +10,7 @@ from uuid import UUID
 
 from app.celery_app import celery_app
 from app.database.connection import get_db
+from app.services.claude_service import claude_service
 from app.services.executor import task_executor
 
 logger = logging.getLogger(__name__)
@@ -46,9 +47,15 @@ def execute_task_async(self, task_id: str):
 
 async def _execute_task_internal(task_id: UUID):
     """Internal async function to execute task."""
-    async with get_db() as db:
-        result = await task_executor.execute_task(task_id, db)
-    return result
+    try:
+        async with get_db() as db:
+            result = await task_executor.execute_task(task_id, db)
+        # asyncio.run() cancels pending tasks on exit, so finish background writes first
+        await task_executor.drain()
+        return result
+    finally:
+        # The loop closes with this task; its pooled connections go with it
+        await claude_service.aclose()
 
 
 @celery_app.task(name="app.tasks.agent_tasks.execute_task_batch_async")
@@ -81,6 +88,10 @@ def execute_task_batch_async(task_ids: list[str], parallel: bool = True):
 
 async def _execute_batch_internal(task_ids: list[UUID], parallel: bool):
     """Internal async function to execute task batch."""
-    async with get_db() as db:
-        results = await task_executor.execute_task_batch(task_ids, db, parallel)
-    return results
+    try:
+        async with get_db() as db:
+            results = await task_executor.execute_task_batch(task_ids, db, parallel)
+        await task_executor.drain()
+        return results
+    finally:
+        await claude_service.aclose()
@@ -13,6 +13,8 @@ from sqlalchemy import select
 from app.celery_app import celery_app
 from app.database.connection import get_db
 from app.models.project import Project, ProjectStatus
+from app.services.claude_service import claude_service
+from app.services.executor import task_executor
 from app.services.orchestrator_service import orchestrator_service
 
 logger = logging.getLogger(__name__)
@@ -51,9 +53,15 @@ def execute_project_async(self, project_id: str):
 
 async def _execute_project_internal(project_id: UUID):
     """Internal async function to execute project."""
-    async with get_db() as db:
-        result = await orchestrator_service.execute_project(project_id, db)
-    return result
+    try:
+        async with get_db() as db:
+            result = await orchestrator_service.execute_project(project_id, db)
+        # asyncio.run() cancels pending tasks on exit, so finish background writes first
+        await task_executor.drain()
+        return result
+    finally:
+        # The loop closes with this task; its pooled connections go with it
+        await claude_service.aclose()
 
 
 @celery_app.task(name="app.tasks.project_tasks.check_stalled_projects")
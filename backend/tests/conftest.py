@@ -4,7 +4,7 @@ import asyncio
 import os
 from typing import AsyncGenerator, Generator
 from httpx import AsyncClient
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.main import app
@@ -92,6 +92,21 @@ async def setup_test_database():
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture(scope="function")
+def sql_statements():
+    """Record SQL statements the app engine executes during a test."""
+    from app.database.connection import engine as app_engine
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(app_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(app_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture(scope="function")
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """Create test HTTP client."""
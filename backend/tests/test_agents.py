@@ -1,4 +1,6 @@
 """Test AI agents."""
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from httpx import AsyncClient
 
@@ -7,6 +9,7 @@ from app.agents.orchestrator import Orchestrator
 from app.agents.marketing_agent import MarketingAgent
 from app.agents.frontend_agent import FrontendDeveloperAgent
 from app.agents.backend_agent import BackendDeveloperAgent
+from app.models.project import ProjectType
 
 
 def test_import_all_agents():
@@ -74,6 +77,20 @@ def test_orchestrator_creation():
     assert orchestrator.get_temperature() == 0.5
 
 
+@pytest.mark.asyncio
+async def test_speculative_decomposition_is_scoped_to_organization():
+    """Test speculative decompositions are cached per organization."""
+    orchestrator = Orchestrator()
+
+    with patch.object(orchestrator, "decompose_project", new=AsyncMock(return_value=[])) as mock_decompose:
+        await orchestrator._speculative_decompose("Build a landing page", ProjectType.WEBSITE, "org-a")
+
+    stub = mock_decompose.await_args.args[0]
+    namespace = Orchestrator._decomposition_namespace(stub)
+
+    assert namespace.endswith(":org-a")
+
+
 @pytest.mark.asyncio
 async def test_agents_endpoint(client: AsyncClient):
     """Test agents API endpoint."""
@@ -3,6 +3,7 @@ import pytest
 from httpx import AsyncClient
 
 from app.agents.hr_agent import HRAgent
+from app.core.metrics_cache import metrics_cache
 
 
 def test_hr_agent_creation():
@@ -22,6 +23,17 @@ def test_hr_agent_temperature():
     assert 0.3 <= hr_agent.get_temperature() <= 0.5
 
 
+def test_clean_json_response():
+    """Test fenced code blocks are stripped from JSON responses."""
+    hr_agent = HRAgent()
+
+    assert hr_agent.clean_json_response('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert hr_agent.clean_json_response('Result:\n```\n{"a": 1}\n``` done') == '{"a": 1}'
+    assert hr_agent.clean_json_response('  {"a": 1}  ') == '{"a": 1}'
+    # Truncated response without a closing fence
+    assert hr_agent.clean_json_response('```json\n{"a": 1}') == '{"a": 1}'
+
+
 @pytest.mark.asyncio
 async def test_hr_agent_endpoints_exist(client: AsyncClient):
     """Test that HR Agent endpoints are available."""
@@ -35,11 +47,22 @@ async def test_hr_agent_endpoints_exist(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_hr_dynamic_agents_endpoint(client: AsyncClient):
+async def test_hr_performance_query_count(client: AsyncClient, sql_statements: list):
+    """Test agent performance is aggregated without a query per agent."""
+    metrics_cache.invalidate("hr_agent_performance")
+    response = await client.get("/api/hr/agents/performance")
+
+    assert response.status_code == 200
+    assert len(sql_statements) <= 1
+
+
+@pytest.mark.asyncio
+async def test_hr_dynamic_agents_endpoint(client: AsyncClient, sql_statements: list):
     """Test dynamic agents listing endpoint."""
     response = await client.get("/api/hr/dynamic-agents")
     
     assert response.status_code == 200
+    assert len(sql_statements) <= 1
     data = response.json()
     
     assert "dynamic_agents" in data
@@ -1,6 +1,7 @@
 """Test database models."""
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
+import time
 import uuid
 
 from app.models.user import User, UserSettings, Notification
@@ -8,6 +9,7 @@ from app.models.organization import Organization
 from app.models.project import Project, ProjectType, ProjectStatus
 from app.models.task import Task, TaskStatus, TaskPriority
 from app.models.agent_execution import AgentExecution
+from app.models.base import uuid4_batch, uuid7
 
 
 def test_import_all_models():
@@ -45,6 +47,26 @@ def test_task_enums():
     assert hasattr(TaskPriority, "LOW")
 
 
+def test_uuid7_is_time_ordered():
+    """Test uuid7 produces version 7 UUIDs that sort by creation time."""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first < second
+
+
+def test_uuid4_batch():
+    """Test uuid4_batch produces distinct version 4 UUIDs."""
+    ids = uuid4_batch(5)
+
+    assert len(ids) == 5
+    assert len(set(ids)) == 5
+    assert all(u.version == 4 and u.variant == uuid.RFC_4122 for u in ids)
+
+
 @pytest.mark.asyncio
 async def test_create_user(db_session: AsyncSession):
     """Test creating a user."""
@@ -108,3 +130,8 @@ async def test_user_to_dict(db_session: AsyncSession):
     assert user_dict["telegram_id"] == 987654321
     assert user_dict["username"] == "dictuser"
     assert user_dict["is_premium"] is True
+
+    # Memoized until a column changes
+    assert user.to_dict() is user_dict
+    user.username = "renamed"
+    assert user.to_dict()["username"] == "renamed"